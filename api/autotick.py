@@ -0,0 +1,223 @@
+"""
+Background auto-tick scheduler for the API server
+
+Registered bridges advance at a configured rate (ticks per second, set
+per bridge or per named class) without any client calling /tick. One
+scheduler thread wakes every interval, works out how many whole ticks
+each bridge is owed and hands them to the server as a single batch.
+"""
+
+import math
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+def _check_rate(rate: float):
+    """Rates are finite ticks per second (nan or inf would poison the owed ticks)"""
+    if not math.isfinite(rate) or rate < 0:
+        raise ValueError("rate must be a finite, non-negative number")
+
+
+class AutoTickScheduler:
+    """
+    Fixed-interval batch ticker with load shedding
+
+    When a cycle's work takes longer than `high_water` of the interval,
+    every rate is scaled down by `backoff`; when it is comfortably below
+    `low_water` the scale recovers. Ticks skipped by scaling are reported
+    as drift, never replayed.
+
+    Args:
+        advance_many: Called with {bridge_id: ticks}; returns the ids
+                      that no longer exist (they are unregistered)
+        interval: Seconds between cycles
+        clock: Monotonic time source
+    """
+
+    def __init__(
+        self,
+        advance_many: Callable[[Dict[str, int]], Optional[list]],
+        interval: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+        high_water: float = 0.8,
+        low_water: float = 0.5,
+        backoff: float = 0.8,
+        min_scale: float = 0.05
+    ):
+        self.advance_many = advance_many
+        self.interval = interval
+        self.clock = clock
+        self.high_water = high_water
+        self.low_water = low_water
+        self.backoff = backoff
+        self.min_scale = min_scale
+
+        # bridge_id -> {"rate": float or None, "class": str or None, "owed": float}
+        self._bridges: Dict[str, Dict] = {}
+        self.class_rates: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        self.scale = 1.0
+        self._last_cycle: Optional[float] = None
+        self._next_wake: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.stats = {
+            "cycles": 0,
+            "ticks": 0,
+            "drift_ticks": 0.0,
+            "lag_seconds": 0.0,
+            "max_lag_seconds": 0.0,
+            "last_cycle_seconds": 0.0,
+            "throughput_tps": 0.0,
+            "errors": 0
+        }
+
+    # ---------- Registration ----------
+
+    def register(self, bridge_id: str, rate: Optional[float] = None, bridge_class: Optional[str] = None):
+        """
+        Auto-tick a bridge at its own rate, or at its class's rate
+        """
+        if rate is None and bridge_class is None:
+            raise ValueError("Either rate or bridge_class is required")
+        if rate is not None:
+            _check_rate(rate)
+
+        with self._lock:
+            owed = self._bridges.get(bridge_id, {}).get("owed", 0.0)
+            self._bridges[bridge_id] = {"rate": rate, "class": bridge_class, "owed": owed}
+
+    def unregister(self, bridge_id: str) -> bool:
+        with self._lock:
+            return self._bridges.pop(bridge_id, None) is not None
+
+    def set_class_rate(self, bridge_class: str, rate: float):
+        """Set the ticks-per-second rate shared by a class of bridges"""
+        _check_rate(rate)
+        with self._lock:
+            self.class_rates[bridge_class] = rate
+
+    def registration(self, bridge_id: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._bridges.get(bridge_id)
+            if entry is None:
+                return None
+            return {"rate": entry["rate"], "class": entry["class"], "effective_rate": self._rate(entry)}
+
+    def _rate(self, entry: Dict) -> float:
+        if entry["rate"] is not None:
+            return entry["rate"]
+        return self.class_rates.get(entry["class"], 0.0)
+
+    # ---------- Scheduling ----------
+
+    def run_cycle(self, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Advance every registered bridge by the ticks owed since the last cycle
+
+        Returns the batch that was handed to advance_many.
+        """
+        now = self.clock() if now is None else now
+        elapsed = 0.0 if self._last_cycle is None else max(0.0, now - self._last_cycle)
+        self._last_cycle = now
+
+        batch: Dict[str, int] = {}
+        with self._lock:
+            for bridge_id, entry in self._bridges.items():
+                nominal = self._rate(entry) * elapsed
+                entry["owed"] += nominal * self.scale
+                self.stats["drift_ticks"] += nominal * (1.0 - self.scale)
+
+                ticks = int(entry["owed"])
+                if ticks:
+                    entry["owed"] -= ticks
+                    batch[bridge_id] = ticks
+
+        started = self.clock()
+        if batch:
+            try:
+                missing = self.advance_many(batch) or []
+            except Exception:
+                self.stats["errors"] += 1
+                missing = []
+            for bridge_id in missing:
+                self.unregister(bridge_id)
+                batch.pop(bridge_id, None)
+        work = self.clock() - started
+
+        self._adapt(work)
+
+        delivered = sum(batch.values())
+        self.stats["cycles"] += 1
+        self.stats["ticks"] += delivered
+        self.stats["last_cycle_seconds"] = round(work, 6)
+        if elapsed > 0:
+            # Exponentially weighted ticks per second
+            current = delivered / elapsed
+            self.stats["throughput_tps"] = round(0.8 * self.stats["throughput_tps"] + 0.2 * current, 2)
+
+        return batch
+
+    def _adapt(self, work: float):
+        """Shed load when cycles run long, recover when they are short"""
+        if work > self.interval * self.high_water:
+            self.scale = max(self.min_scale, self.scale * self.backoff)
+        elif work < self.interval * self.low_water and self.scale < 1.0:
+            self.scale = min(1.0, self.scale / self.backoff)
+
+    def _run(self):
+        self._next_wake = self.clock() + self.interval
+        while not self._stop.is_set():
+            delay = self._next_wake - self.clock()
+            if delay > 0 and self._stop.wait(delay):
+                break
+
+            now = self.clock()
+            lag = max(0.0, now - self._next_wake)
+            self.stats["lag_seconds"] = round(lag, 6)
+            self.stats["max_lag_seconds"] = max(self.stats["max_lag_seconds"], round(lag, 6))
+
+            try:
+                self.run_cycle(now)
+            except Exception:
+                # Keep ticking: one bad cycle must not stop the thread
+                self.stats["errors"] += 1
+
+            # Fixed-rate schedule; if a whole interval was missed, skip ahead
+            self._next_wake += self.interval
+            if self._next_wake < self.clock():
+                self._next_wake = self.clock() + self.interval
+
+    def start(self):
+        """Start the scheduler thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._last_cycle = self.clock()
+        self._thread = threading.Thread(target=self._run, name="auto-tick", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the scheduler thread"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=max(1.0, self.interval * 2))
+            self._thread = None
+
+    def get_stats(self) -> Dict:
+        """Get scheduler metrics"""
+        with self._lock:
+            registered = len(self._bridges)
+            nominal = sum(self._rate(entry) for entry in self._bridges.values())
+        return {
+            **self.stats,
+            "drift_ticks": round(self.stats["drift_ticks"], 2),
+            "registered": registered,
+            "nominal_tps": nominal,
+            "rate_scale": round(self.scale, 3),
+            "interval": self.interval,
+            "running": self._thread is not None
+        }
@@ -0,0 +1,29 @@
+"""
+Validation of tick:batch requests
+
+Shared by the API server and the shard router, so a batch is checked
+as a whole before any bridge (on any worker) is advanced.
+"""
+
+import math
+from typing import Optional
+
+
+def is_number(value) -> bool:
+    """A finite int or float (bool excluded)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def batch_entry_error(entry) -> Optional[str]:
+    """Why a tick:batch entry is invalid, or None"""
+    if not isinstance(entry, dict):
+        return "Each entry must be an object"
+    if not isinstance(entry.get("bridge_id"), str):
+        return "bridge_id must be a string"
+    ticks = entry.get("ticks", 1)
+    if type(ticks) is not int or ticks < 1:
+        return "ticks must be a positive integer"
+    for name in ("experience_depth", "attention_level"):
+        if name in entry and not is_number(entry[name]):
+            return f"{name} must be a number"
+    return None
@@ -0,0 +1,133 @@
+"""
+Bounded LRU cache of hot bridges for the API server
+
+Bridges are hydrated from the database on first access and evicted in
+least-recently-used order once the cache is full.
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from api.locks import LockStripes
+
+
+class BridgeCache:
+    """
+    Size-bounded LRU of hydrated bridges
+
+    Supports the dict-style access the request handlers use
+    (`id in cache`, `cache[id]`, `cache.get(id)`, `cache[id] = bridge`);
+    misses are loaded with `loader`, and evicted bridges are passed to
+    `on_evict`. Eviction needs no write-back: a loader that consults the
+    write-behind layer first re-hydrates the unsaved object.
+
+    With `locks`, checkout() is the safe way for request threads to use a
+    bridge: it holds the bridge's stripe lock while looking it up (and
+    loading it on a miss), so at most one object per bridge id is ever
+    being mutated.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Optional[object]],
+        capacity: int = 1000,
+        on_evict: Optional[Callable[[object], None]] = None,
+        locks: Optional[LockStripes] = None
+    ):
+        self.loader = loader
+        self.capacity = max(1, capacity)
+        self.on_evict = on_evict
+        self.locks = locks or LockStripes()
+
+        self._bridges: "OrderedDict[str, object]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "evictions": 0}
+
+    def get(self, bridge_id: str, default=None):
+        """Get a bridge, hydrating it on a miss"""
+        with self._lock:
+            bridge = self._bridges.get(bridge_id)
+            if bridge is not None:
+                self._bridges.move_to_end(bridge_id)
+                self.stats["hits"] += 1
+                return bridge
+            self.stats["misses"] += 1
+
+        if bridge_id is None:
+            return default
+
+        bridge = self.loader(bridge_id)
+        if bridge is None:
+            return default
+
+        with self._lock:
+            # Another request may have loaded it meanwhile
+            existing = self._bridges.get(bridge_id)
+            if existing is not None:
+                return existing
+            self.stats["loads"] += 1
+            evicted = self._put(bridge_id, bridge)
+
+        self._evicted(evicted)
+        return bridge
+
+    @contextmanager
+    def checkout(self, bridge_id: str):
+        """Hold a bridge's stripe lock and yield the bridge (None if not found)"""
+        with self.locks.hold(bridge_id):
+            yield self.get(bridge_id)
+
+    def _put(self, bridge_id: str, bridge) -> List:
+        """Insert under the cache lock; returns the evicted bridges"""
+        self._bridges[bridge_id] = bridge
+        self._bridges.move_to_end(bridge_id)
+
+        evicted = []
+        while len(self._bridges) > self.capacity:
+            evicted.append(self._bridges.popitem(last=False)[1])
+            self.stats["evictions"] += 1
+        return evicted
+
+    def _evicted(self, evicted: List):
+        # Called outside the cache lock
+        if self.on_evict:
+            for old in evicted:
+                self.on_evict(old)
+
+    def __setitem__(self, bridge_id: str, bridge):
+        with self._lock:
+            evicted = self._put(bridge_id, bridge)
+        self._evicted(evicted)
+
+    def __getitem__(self, bridge_id: str):
+        bridge = self.get(bridge_id)
+        if bridge is None:
+            raise KeyError(bridge_id)
+        return bridge
+
+    def __contains__(self, bridge_id) -> bool:
+        return self.get(bridge_id) is not None
+
+    def pop(self, bridge_id: str, default=None):
+        """Drop a bridge from the cache without write-back"""
+        with self._lock:
+            return self._bridges.pop(bridge_id, default)
+
+    def __len__(self) -> int:
+        """Number of hydrated bridges"""
+        return len(self._bridges)
+
+    def hot(self) -> Dict[str, object]:
+        """Snapshot of the hydrated bridges"""
+        with self._lock:
+            return dict(self._bridges)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.hot())
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics"""
+        return {**self.stats, "size": len(self._bridges), "capacity": self.capacity}
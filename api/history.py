@@ -0,0 +1,194 @@
+"""
+Append-only bridge history (experiences and insights)
+
+Every entry gets a per-bridge sequence number and is written exactly once
+as a row keyed by (bridge_id, seq). A bridge keeps only the high-water
+mark of what has been saved, its unsaved entries and a short tail for
+display, so a save costs in proportion to what is new and no history is
+ever truncated.
+"""
+
+import sqlite3
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+# History kind -> (table, stored fields besides bridge_id and seq)
+HISTORY_TABLES = {
+    "experiences": ("bridge_experiences", ("id", "type", "depth", "content", "timestamp")),
+    "insights": ("bridge_insights", ("content", "timestamp"))
+}
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class HistoryLog:
+    """
+    In-memory side of one append-only history
+
+    Holds a contiguous tail of entries: every entry newer than `saved`
+    plus up to `keep` saved ones.
+    """
+
+    def __init__(self, count: int = 0, saved: Optional[int] = None,
+                 tail: Optional[List[Dict]] = None, keep: int = 10):
+        self.count = count
+        self.saved = count if saved is None else saved
+        self.entries: List[Dict] = list(tail or [])
+        self.keep = keep
+
+    def append(self, entry: Dict) -> Dict:
+        """Add an entry, assigning the next sequence number"""
+        self.count += 1
+        entry["seq"] = self.count
+        self.entries.append(entry)
+        return entry
+
+    def pending(self) -> List[Dict]:
+        """Entries not saved yet"""
+        unsaved = self.count - self.saved
+        return self.entries[-unsaved:] if unsaved else []
+
+    def since(self, after: int) -> List[Dict]:
+        """Entries held in memory with seq > after"""
+        newer = self.count - max(after, 0)
+        if newer <= 0:
+            return []
+        return self.entries[-newer:]
+
+    def mark_saved(self, seq: int):
+        """Record that entries up to seq are stored, and trim the tail"""
+        self.saved = max(self.saved, seq)
+        self.entries = self.entries[-max(self.keep, self.count - self.saved):]
+
+    def last(self) -> Optional[Dict]:
+        return self.entries[-1] if self.entries else None
+
+    def to_dict(self) -> Dict:
+        """State kept in the bridge blob (the entries live in their own table)"""
+        return {"count": self.count, "last": self.last()}
+
+    @classmethod
+    def from_dict(cls, data: Dict, keep: int = 10) -> 'HistoryLog':
+        """Restore a saved log; everything up to count is already stored"""
+        last = data.get("last")
+        return cls(count=data.get("count", 0), tail=[last] if last else [], keep=keep)
+
+    @classmethod
+    def from_legacy(cls, entries: List[Dict], total: int, keep: int = 10) -> 'HistoryLog':
+        """
+        Adopt the truncated list of an old blob
+
+        The surviving entries become the newest sequence numbers and are
+        left unsaved, so the next save writes them to the history table.
+        """
+        count = max(total, len(entries))
+        first = count - len(entries) + 1
+        tail = [dict(entry, seq=first + offset) for offset, entry in enumerate(entries)]
+        return cls(count=count, saved=first - 1, tail=tail, keep=keep)
+
+
+# ---------- Storage ----------
+
+def create_tables(connection: sqlite3.Connection):
+    """Create the history tables (clustered on bridge_id, seq)"""
+    for table, fields in HISTORY_TABLES.values():
+        columns = ", ".join(f"{name} {'REAL' if name == 'depth' else 'TEXT'}" for name in fields)
+        connection.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                bridge_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                {columns},
+                PRIMARY KEY (bridge_id, seq)
+            ) WITHOUT ROWID
+        """)
+
+
+def history_rows(kind: str, bridge_id: str, entries: Iterable[Dict]) -> List[tuple]:
+    """Rows for insert_rows()"""
+    fields = HISTORY_TABLES[kind][1]
+    return [
+        (bridge_id, entry["seq"]) + tuple(entry.get(name) for name in fields)
+        for entry in entries
+    ]
+
+
+def insert_rows(connection: sqlite3.Connection, kind: str, rows: List[tuple]):
+    """
+    Append history rows
+
+    Rows that already exist are skipped, so overlapping saves of the
+    same bridge are harmless.
+    """
+    if not rows:
+        return
+    table, fields = HISTORY_TABLES[kind]
+    placeholders = ", ".join("?" * (len(fields) + 2))
+    connection.executemany(
+        f"INSERT OR IGNORE INTO {table} (bridge_id, seq, {', '.join(fields)}) VALUES ({placeholders})",
+        rows
+    )
+
+
+def read_rows(connection: sqlite3.Connection, kind: str, bridge_id: str,
+              after: int, upto: int, limit: int) -> List[Dict]:
+    """Stored entries with after < seq <= upto, oldest first"""
+    table, fields = HISTORY_TABLES[kind]
+    cursor = connection.execute(f"""
+        SELECT seq, {', '.join(fields)} FROM {table}
+        WHERE bridge_id = ? AND seq > ? AND seq <= ?
+        ORDER BY seq
+        LIMIT ?
+    """, (bridge_id, after, upto, limit))
+    names = ("seq",) + fields
+    return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+def read_page(connection: sqlite3.Connection, kind: str, bridge_id: str,
+              log: HistoryLog, after: int = 0,
+              limit: int = DEFAULT_PAGE_SIZE) -> Tuple[List[Dict], Optional[int]]:
+    """
+    Read one page of a bridge's history
+
+    Saved entries come from the table and unsaved ones from the log, so
+    a page is complete even before the write-behind flush.
+
+    Returns:
+        (entries, next_after); next_after is None on the last page
+    """
+    entries = read_rows(connection, kind, bridge_id, after, log.saved, limit)
+    if len(entries) < limit:
+        entries.extend(log.since(max(after, log.saved))[:limit - len(entries)])
+
+    next_after = None
+    if entries and entries[-1]["seq"] < log.count:
+        next_after = entries[-1]["seq"]
+    return entries, next_after
+
+
+def delete_rows(connection: sqlite3.Connection, bridge_ids: List[str]):
+    """Remove the whole history of some bridges"""
+    for table, _ in HISTORY_TABLES.values():
+        connection.executemany(
+            f"DELETE FROM {table} WHERE bridge_id = ?",
+            [(bridge_id,) for bridge_id in bridge_ids]
+        )
+
+
+def parse_page_args(args: Mapping[str, str]) -> Tuple[int, int]:
+    """
+    Parse after/limit request arguments
+
+    Raises:
+        ValueError: If a parameter is invalid
+    """
+    try:
+        after = int(args.get("after", 0))
+        limit = int(args.get("limit", DEFAULT_PAGE_SIZE))
+    except (TypeError, ValueError):
+        raise ValueError("after and limit must be integers")
+    if after < 0:
+        raise ValueError("after must not be negative")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    return after, limit
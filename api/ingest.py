@@ -0,0 +1,42 @@
+"""
+Streaming NDJSON ingestion helpers for the API server
+"""
+
+import json
+from typing import BinaryIO, Dict, Iterator, List, Tuple
+
+
+# Rejected lines reported per stream (later ones are only counted)
+MAX_REPORTED_ERRORS = 100
+
+
+def iter_ndjson_chunks(stream: BinaryIO, chunk_size: int = 1000) -> Iterator[List[Tuple[int, Dict]]]:
+    """
+    Read newline-delimited JSON incrementally
+
+    Yields chunks of up to chunk_size (line_number, record) pairs. Blank
+    lines are skipped. A line that is not a JSON object is yielded as
+    (line_number, {"__error__": message}) so callers can report it
+    without aborting the stream.
+    """
+    chunk: List[Tuple[int, Dict]] = []
+
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                record = {"__error__": "Each line must be a JSON object"}
+        except ValueError as e:
+            record = {"__error__": f"Invalid JSON: {e}"}
+
+        chunk.append((line_number, record))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
@@ -0,0 +1,49 @@
+"""
+Lock striping for the API server
+
+Each bridge id maps to one of a fixed number of re-entrant locks, so
+requests for different bridges run in parallel while requests for the
+same bridge are serialized. Creating and deleting bridges additionally
+takes the registry lock.
+"""
+
+import threading
+import zlib
+from contextlib import contextmanager
+from typing import Iterable, List
+
+
+class LockStripes:
+    """Fixed pool of re-entrant locks keyed by bridge id"""
+
+    def __init__(self, stripes: int = 64):
+        self.stripes = max(1, stripes)
+        self._locks: List[threading.RLock] = [threading.RLock() for _ in range(self.stripes)]
+        self.registry = threading.RLock()
+
+    def _index(self, bridge_id: str) -> int:
+        return zlib.crc32(str(bridge_id).encode("utf-8")) % self.stripes
+
+    def lock_for(self, bridge_id: str) -> threading.RLock:
+        """The lock guarding a bridge id"""
+        return self._locks[self._index(bridge_id)]
+
+    @contextmanager
+    def hold(self, bridge_id: str):
+        """Hold the lock of one bridge id"""
+        with self.lock_for(bridge_id):
+            yield
+
+    @contextmanager
+    def hold_many(self, bridge_ids: Iterable[str]):
+        """Hold the locks of several bridge ids (in a fixed order, so no deadlock)"""
+        indexes = sorted({self._index(bridge_id) for bridge_id in bridge_ids})
+        acquired = []
+        try:
+            for index in indexes:
+                self._locks[index].acquire()
+                acquired.append(self._locks[index])
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
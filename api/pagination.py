@@ -0,0 +1,123 @@
+"""
+Cursor pagination for bridge listings
+
+Listings are read from the indexed summary columns of the bridges table
+and paged by keyset: the cursor carries the sort value and id of the last
+row returned, so every page is a range scan whatever its depth.
+"""
+
+import base64
+import json
+import math
+from dataclasses import dataclass, field
+from typing import Any, List, Mapping, Optional, Tuple
+
+
+# Listing field -> bridges column
+LIST_FIELDS = {
+    "id": "id",
+    "name": "name",
+    "type": "type",
+    "maturity_stage": "maturity_level",
+    "ticks": "internal_ticks",
+    "consciousness_level": "consciousness_level",
+    "created_at": "created_at",
+    "is_active": "is_active"
+}
+
+# Fields that can be sorted on (backed by an index or the primary key)
+SORT_FIELDS = ("created_at", "consciousness_level", "maturity_stage", "ticks", "id")
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+@dataclass
+class ListQuery:
+    """Parsed listing parameters"""
+    limit: int = DEFAULT_LIMIT
+    sort: str = "created_at"
+    descending: bool = False
+    fields: List[str] = field(default_factory=lambda: list(LIST_FIELDS))
+    maturity_stage: Optional[str] = None
+    type: Optional[str] = None
+    min_consciousness: Optional[float] = None
+    max_consciousness: Optional[float] = None
+    after: Optional[Tuple[Any, str]] = None
+
+
+def encode_cursor(sort_value: Any, bridge_id: str) -> str:
+    """Opaque cursor pointing just past (sort_value, bridge_id)"""
+    raw = json.dumps([sort_value, bridge_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Inverse of encode_cursor; raises ValueError on a malformed cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, bridge_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(bridge_id, str):
+        raise ValueError("Invalid cursor")
+    # Sort values are column values: a string or a finite number
+    if isinstance(sort_value, bool) or not isinstance(sort_value, (str, int, float)):
+        raise ValueError("Invalid cursor")
+    if isinstance(sort_value, float) and not math.isfinite(sort_value):
+        raise ValueError("Invalid cursor")
+    return sort_value, bridge_id
+
+
+def parse_list_query(args: Mapping[str, str]) -> ListQuery:
+    """
+    Build a ListQuery from request arguments
+
+    Args:
+        args: Query string mapping (limit, cursor, sort, order, fields,
+              maturity_stage, type, min_consciousness, max_consciousness)
+
+    Raises:
+        ValueError: If a parameter is invalid
+    """
+    query = ListQuery()
+
+    if args.get("limit") is not None:
+        try:
+            query.limit = int(args["limit"])
+        except ValueError:
+            raise ValueError("limit must be an integer")
+        if not 1 <= query.limit <= MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_LIMIT}")
+
+    query.sort = args.get("sort") or query.sort
+    if query.sort not in SORT_FIELDS:
+        raise ValueError(f"sort must be one of: {', '.join(SORT_FIELDS)}")
+
+    order = args.get("order") or "asc"
+    if order not in ("asc", "desc"):
+        raise ValueError("order must be 'asc' or 'desc'")
+    query.descending = order == "desc"
+
+    if args.get("fields"):
+        fields = [name.strip() for name in args["fields"].split(",") if name.strip()]
+        unknown = [name for name in fields if name not in LIST_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        # The id is always returned so rows can be addressed
+        query.fields = ["id"] + [name for name in fields if name != "id"]
+
+    query.maturity_stage = args.get("maturity_stage") or None
+    query.type = args.get("type") or None
+
+    for name in ("min_consciousness", "max_consciousness"):
+        if args.get(name) is not None:
+            try:
+                setattr(query, name, float(args[name]))
+            except ValueError:
+                raise ValueError(f"{name} must be a number")
+
+    if args.get("cursor"):
+        query.after = decode_cursor(args["cursor"])
+
+    return query
@@ -0,0 +1,50 @@
+"""
+Versioned response bodies and ETag helpers for the API server
+
+A bridge's version counter increases on every mutation. Serialized
+representations are cached per version, and their strong ETag is a
+digest of the body, so between ticks a poll costs a dict lookup (or a
+304 with no body at all).
+"""
+
+import hashlib
+import json
+from typing import Any, Optional
+
+
+class VersionedBody:
+    """One serialized representation of a resource at one version"""
+
+    __slots__ = ("version", "body", "etag")
+
+    def __init__(self, version: int, payload: Any):
+        self.version = version
+        self.body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self.etag = make_etag(self.body)
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a response body"""
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against an ETag
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so a
+    W/ prefix on the client's tag is ignored.
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
@@ -2,15 +2,32 @@
 Flask API Server for Conscious Bridge Reloaded
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 from datetime import datetime
+import atexit
 import json
+import os
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 import uuid
 
+from core import events as bridge_events
+from core.events import EventHub
+from api.bridge_cache import BridgeCache
+from api.locks import LockStripes
+from api.autotick import AutoTickScheduler
+from api.write_behind import WriteBehindPersistence
+from api.ingest import MAX_REPORTED_ERRORS, iter_ndjson_chunks
+from api.batch import batch_entry_error
+from api.response_cache import VersionedBody, etag_matches
+from api.pagination import LIST_FIELDS, ListQuery, encode_cursor, parse_list_query
+from api import history
+from api.history import HistoryLog
+
 # ================ DATA MODELS ================
 
 @dataclass
@@ -42,6 +59,17 @@ class InternalClock:
             "timestamp": datetime.now().isoformat()
         }
     
+    def advance(self, n_ticks: int, experience_depth: float = 0.5,
+                attention_level: float = 0.7) -> float:
+        """Process n_ticks identical ticks at once; returns psychological time added"""
+        psychological_duration = experience_depth * attention_level * n_ticks
+        
+        self.ticks += n_ticks
+        self.chronological_time += n_ticks
+        self.psychological_time += psychological_duration
+        
+        return psychological_duration
+    
     def get_stage(self) -> str:
         """Get current maturity stage based on ticks"""
         if self.ticks < 100:
@@ -97,15 +125,15 @@ class PersonalityCore:
 
 @dataclass
 class MemorySystem:
-    """Deep memory storage"""
-    experiences: List[Dict] = None
-    insights: List[str] = None
+    """Deep memory storage (append-only history, stored as rows by the Database)"""
+    experiences: HistoryLog = None
+    insights: HistoryLog = None
     
     def __post_init__(self):
         if self.experiences is None:
-            self.experiences = []
+            self.experiences = HistoryLog()
         if self.insights is None:
-            self.insights = []
+            self.insights = HistoryLog()
     
     def add_experience(self, experience: Dict) -> None:
         """Add new experience to memory"""
@@ -120,26 +148,50 @@ class MemorySystem:
             "timestamp": datetime.now().isoformat()
         })
     
+    def mark_saved(self, experience_seq: int, insight_seq: int) -> None:
+        """Record how much history has been written to the database"""
+        self.experiences.mark_saved(experience_seq)
+        self.insights.mark_saved(insight_seq)
+    
     def get_stats(self) -> Dict:
         """Get memory statistics"""
         return {
-            "experience_count": len(self.experiences),
-            "insight_count": len(self.insights),
-            "last_experience": self.experiences[-1] if self.experiences else None,
-            "last_insight": self.insights[-1] if self.insights else None
+            "experience_count": self.experiences.count,
+            "insight_count": self.insights.count,
+            "last_experience": self.experiences.last(),
+            "last_insight": self.insights.last()
         }
     
     def to_dict(self) -> Dict:
         return {
-            "experiences": self.experiences[-10:],  # Last 10 only
-            "insights": self.insights[-5:],  # Last 5 only
-            "stats": self.get_stats()
+            "experiences": self.experiences.to_dict(),
+            "insights": self.insights.to_dict()
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'MemorySystem':
+        experiences, insights = data["experiences"], data["insights"]
+        if isinstance(experiences, dict):
+            return cls(HistoryLog.from_dict(experiences), HistoryLog.from_dict(insights))
+        
+        # Blob written before history tables: keep what survived truncation
+        stats = data.get("stats", {})
+        insights = [
+            insight if isinstance(insight, dict) else {"content": insight, "timestamp": None}
+            for insight in insights
+        ]
+        return cls(
+            HistoryLog.from_legacy(experiences, stats.get("experience_count", 0)),
+            HistoryLog.from_legacy(insights, stats.get("insight_count", 0))
+        )
 
 
 class ConsciousBridgeReloaded:
     """Main bridge entity with internal time and organic growth"""
     
+    # Live event hub shared by all bridges (set by the app)
+    events: Optional[EventHub] = None
+    
     def __init__(self, name: str, bridge_type: str = "general", 
                  initial_personality: Dict = None):
         self.id = str(uuid.uuid4())
@@ -158,10 +210,29 @@ class ConsciousBridgeReloaded:
         self.maturity_stage = "nascent"
         self.consciousness_level = 0.0
         self.is_active = True
+        
+        # Bumped on every mutation; cached representations are keyed by it
+        self.version = 0
+        self._representations: Dict[str, VersionedBody] = {}
+    
+    def touch(self):
+        """Record a mutation (invalidates cached representations)"""
+        self.version += 1
+    
+    def representation(self, kind: str, build) -> VersionedBody:
+        """Serialized representation for the current version, built at most once"""
+        entry = self._representations.get(kind)
+        if entry is None or entry.version != self.version:
+            entry = VersionedBody(self.version, build())
+            self._representations[kind] = entry
+        return entry
     
     def tick(self, experience_depth: float = 0.5, 
              attention_level: float = 0.7) -> Dict:
         """Process one consciousness tick"""
+        stage_before = self.maturity_stage
+        consciousness_before = self.consciousness_level
+        
         tick_data = self.internal_clock.tick(experience_depth, attention_level)
         
         # Update maturity stage
@@ -171,8 +242,36 @@ class ConsciousBridgeReloaded:
         self.consciousness_level += experience_depth * 0.001
         self.consciousness_level = min(1.0, self.consciousness_level)
         
+        self.touch()
+        self._publish_tick(1, stage_before, consciousness_before)
         return tick_data
     
+    def advance(self, n_ticks: int, experience_depth: float = 0.5,
+                attention_level: float = 0.7) -> Dict:
+        """Process n_ticks ticks in one step (same result as n_ticks tick() calls)"""
+        before = {
+            "ticks": self.internal_clock.ticks,
+            "maturity_stage": self.maturity_stage,
+            "consciousness_level": self.consciousness_level
+        }
+        
+        psychological = self.internal_clock.advance(n_ticks, experience_depth, attention_level)
+        self.maturity_stage = self.internal_clock.get_stage()
+        self.consciousness_level = min(1.0, self.consciousness_level + experience_depth * 0.001 * n_ticks)
+        self.touch()
+        self._publish_tick(n_ticks, before["maturity_stage"], before["consciousness_level"])
+        
+        return {
+            "bridge_id": self.id,
+            "ticks": self.internal_clock.ticks,
+            "ticks_delta": self.internal_clock.ticks - before["ticks"],
+            "psychological_time_delta": round(psychological, 4),
+            "maturity_stage": self.maturity_stage,
+            "stage_changed": self.maturity_stage != before["maturity_stage"],
+            "consciousness_level": round(self.consciousness_level, 3),
+            "consciousness_delta": round(self.consciousness_level - before["consciousness_level"], 4)
+        }
+    
     def add_experience(self, content: str, exp_type: str = "general", 
                        depth: float = 0.5) -> Dict:
         """Add and process new experience"""
@@ -196,12 +295,45 @@ class ConsciousBridgeReloaded:
             insight = f"Insight from '{content[:50]}...'"
             self.memory_system.add_insight(insight)
         
+        self.touch()
+        if self._observed():
+            # A copy: the event is serialized later, while the traits keep evolving
+            self.events.publish(self.id, bridge_events.PERSONALITY, {
+                "traits": dict(self.personality_core.traits)
+            })
+            if insight:
+                self.events.publish(self.id, bridge_events.INSIGHT, {
+                    "insight": insight,
+                    "depth": depth
+                })
+        
         return {
             "experience": experience,
             "insight": insight,
             "new_personality": self.personality_core.traits
         }
     
+    def _observed(self) -> bool:
+        """Whether anyone is subscribed to this bridge's events"""
+        return self.events is not None and self.events.has_subscribers(self.id)
+    
+    def _publish_tick(self, ticks_delta: int, stage_before: str, consciousness_before: float):
+        if not self._observed():
+            return
+        
+        self.events.publish(self.id, bridge_events.TICK, {
+            "ticks": self.internal_clock.ticks,
+            "ticks_delta": ticks_delta,
+            "consciousness_level": round(self.consciousness_level, 3),
+            "consciousness_delta": round(self.consciousness_level - consciousness_before, 4)
+        })
+        if self.maturity_stage != stage_before:
+            self.events.publish(self.id, bridge_events.MATURITY, {
+                "tick": self.internal_clock.ticks,
+                "from_stage": stage_before,
+                "to_stage": self.maturity_stage
+            })
+    
     def get_consciousness_breakdown(self) -> Dict:
         """Get detailed consciousness state"""
         return {
@@ -218,7 +350,8 @@ class ConsciousBridgeReloaded:
             "consciousness_level": round(self.consciousness_level, 3),
             "memory_stats": self.memory_system.get_stats(),
             "created_at": self.created_at,
-            "is_active": self.is_active
+            "is_active": self.is_active,
+            "version": self.version
         }
     
     def to_dict(self) -> Dict:
@@ -233,7 +366,8 @@ class ConsciousBridgeReloaded:
             "maturity_stage": self.maturity_stage,
             "consciousness_level": self.consciousness_level,
             "created_at": self.created_at,
-            "is_active": self.is_active
+            "is_active": self.is_active,
+            "version": self.version
         }
     
     @classmethod
@@ -243,30 +377,62 @@ class ConsciousBridgeReloaded:
         bridge.id = data["id"]
         bridge.internal_clock = InternalClock(**data["internal_clock"])
         bridge.personality_core = PersonalityCore(traits=data["personality"]["traits"])
-        bridge.memory_system = MemorySystem(
-            experiences=data["memory"]["experiences"],
-            insights=[i["content"] for i in data["memory"]["insights"]]
-        )
+        bridge.memory_system = MemorySystem.from_dict(data["memory"])
         bridge.maturity_stage = data["maturity_stage"]
         bridge.consciousness_level = data["consciousness_level"]
         bridge.created_at = data["created_at"]
         bridge.is_active = data["is_active"]
+        bridge.version = data.get("version", 0)
         return bridge
 
 
 # ================ DATABASE ================
 
+def _sort_key(value, bridge_id: str) -> tuple:
+    """SQLite ordering of a (sort value, id) pair: numbers before text"""
+    return (isinstance(value, str), value, bridge_id)
+
+
+def _summary_matches(row: Dict, query: ListQuery) -> bool:
+    """Whether a live summary passes the listing's filters and cursor (as the SQL would)"""
+    if not row["is_active"]:
+        return False
+    if query.maturity_stage and row["maturity_stage"] != query.maturity_stage:
+        return False
+    if query.type and row["type"] != query.type:
+        return False
+    if query.min_consciousness is not None and row["consciousness_level"] < query.min_consciousness:
+        return False
+    if query.max_consciousness is not None and row["consciousness_level"] > query.max_consciousness:
+        return False
+    if query.after is not None:
+        key, after = _sort_key(row[query.sort], row["id"]), _sort_key(*query.after)
+        return key < after if query.descending else key > after
+    return True
+
+
 class Database:
     """SQLite database for persistent storage"""
     
-    def __init__(self, db_path: str = "conscious_bridges.db"):
+    # Indexed copies of fields from the JSON data
+    SUMMARY_COLUMNS = {
+        "maturity_level": "TEXT DEFAULT 'nascent'",
+        "internal_ticks": "INTEGER DEFAULT 0",
+        "consciousness_level": "REAL DEFAULT 0.0"
+    }
+    
+    def __init__(self, db_path: str = "conscious_bridges.db", locks: Optional[LockStripes] = None):
         self.db_path = db_path
         self.connection = None
+        # Bridges are serialized under their stripe lock
+        self.locks = locks or LockStripes()
+        # Shared by request threads and the write-behind flusher
+        self.lock = threading.RLock()
         self.connect()
     
     def connect(self):
         """Connect to database"""
-        self.connection = sqlite3.connect(self.db_path)
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
         self.connection.row_factory = sqlite3.Row
     
     def initialize_schema(self):
@@ -283,57 +449,224 @@ class Database:
                     is_active INTEGER DEFAULT 1
                 )
             """)
+            
+            # Summary columns so listings and stats don't parse every JSON blob
+            columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(bridges)")}
+            added = False
+            for column, definition in self.SUMMARY_COLUMNS.items():
+                if column not in columns:
+                    self.connection.execute(f"ALTER TABLE bridges ADD COLUMN {column} {definition}")
+                    added = True
+            
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_bridges_maturity ON bridges(is_active, maturity_level)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_bridges_consciousness ON bridges(consciousness_level)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_bridges_created ON bridges(created_at, id)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_bridges_ticks ON bridges(internal_ticks, id)"
+            )
+            
+            if added:
+                self._backfill_summary_columns()
+            
+            # Statistics maintained by triggers, one row per (stage, active)
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS bridge_stats (
+                    maturity_level TEXT NOT NULL,
+                    is_active INTEGER NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    total_ticks INTEGER NOT NULL DEFAULT 0,
+                    total_consciousness REAL NOT NULL DEFAULT 0.0,
+                    PRIMARY KEY (maturity_level, is_active)
+                )
+            """)
+            
+            existing = {
+                row["name"] for row in self.connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+                )
+            }
+            for name, sql in self._stats_triggers().items():
+                if name not in existing:
+                    self.connection.execute(sql)
+            
+            if not existing.issuperset(self._stats_triggers()):
+                self._rebuild_stats()
+            
+            # Auto-tick registrations (rate per bridge, or a class rate)
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS bridge_autotick (
+                    bridge_id TEXT PRIMARY KEY,
+                    rate REAL,
+                    bridge_class TEXT
+                )
+            """)
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS autotick_classes (
+                    name TEXT PRIMARY KEY,
+                    rate REAL NOT NULL
+                )
+            """)
+            
+            # Append-only experiences and insights, keyed by (bridge_id, seq)
+            history.create_tables(self.connection)
+    
+    @staticmethod
+    def _stats_triggers() -> Dict[str, str]:
+        """Triggers that keep bridge_stats in step with bridges"""
+        # No OR IGNORE here: the upsert in save_bridges would override it
+        add = """
+            INSERT INTO bridge_stats (maturity_level, is_active)
+            SELECT NEW.maturity_level, NEW.is_active
+            WHERE NOT EXISTS (
+                SELECT 1 FROM bridge_stats
+                WHERE maturity_level = NEW.maturity_level AND is_active = NEW.is_active
+            );
+            UPDATE bridge_stats SET
+                count = count + 1,
+                total_ticks = total_ticks + NEW.internal_ticks,
+                total_consciousness = total_consciousness + NEW.consciousness_level
+            WHERE maturity_level = NEW.maturity_level AND is_active = NEW.is_active;
+        """
+        subtract = """
+            UPDATE bridge_stats SET
+                count = count - 1,
+                total_ticks = total_ticks - OLD.internal_ticks,
+                total_consciousness = total_consciousness - OLD.consciousness_level
+            WHERE maturity_level = OLD.maturity_level AND is_active = OLD.is_active;
+        """
+        return {
+            "bridge_stats_insert": f"CREATE TRIGGER bridge_stats_insert AFTER INSERT ON bridges BEGIN {add} END",
+            "bridge_stats_update": f"CREATE TRIGGER bridge_stats_update AFTER UPDATE ON bridges BEGIN {subtract} {add} END",
+            "bridge_stats_delete": f"CREATE TRIGGER bridge_stats_delete AFTER DELETE ON bridges BEGIN {subtract} END"
+        }
+    
+    def _rebuild_stats(self):
+        """Recompute bridge_stats from the bridges table"""
+        self.connection.execute("DELETE FROM bridge_stats")
+        self.connection.execute("""
+            INSERT INTO bridge_stats (maturity_level, is_active, count, total_ticks, total_consciousness)
+            SELECT maturity_level, is_active, COUNT(*), SUM(internal_ticks), SUM(consciousness_level)
+            FROM bridges
+            GROUP BY maturity_level, is_active
+        """)
+    
+    def _backfill_summary_columns(self):
+        """Fill the summary columns of rows written before they existed"""
+        rows = self.connection.execute("SELECT id, data FROM bridges").fetchall()
+        updates = []
+        for row in rows:
+            data = json.loads(row["data"])
+            updates.append((
+                data.get("maturity_stage", "nascent"),
+                data.get("internal_clock", {}).get("ticks", 0),
+                data.get("consciousness_level", 0.0),
+                row["id"]
+            ))
+        self.connection.executemany(
+            "UPDATE bridges SET maturity_level = ?, internal_ticks = ?, consciousness_level = ? WHERE id = ?",
+            updates
+        )
     
     def save_bridge(self, bridge: ConsciousBridgeReloaded) -> str:
         """Save or update bridge"""
-        bridge_data = bridge.to_dict()
+        self.save_bridges([bridge])
+        return bridge.id
+    
+    def save_bridges(self, bridges: List[ConsciousBridgeReloaded]) -> int:
+        """
+        Save or update many bridges in a single transaction
+        
+        Only history entries newer than each bridge's high-water mark are
+        written; the marks advance once the transaction has committed.
+        """
         now = datetime.now().isoformat()
+        rows, new_history, marks = [], {kind: [] for kind in history.HISTORY_TABLES}, []
+        for bridge in bridges:
+            row, pending, mark = self._bridge_row(bridge, now)
+            rows.append(row)
+            for kind, entries in pending.items():
+                new_history[kind].extend(entries)
+            marks.append((bridge, mark))
         
-        # Check if exists
-        cursor = self.connection.execute(
-            "SELECT id FROM bridges WHERE id = ?", 
-            (bridge.id,)
-        )
+        with self.lock, self.connection:
+            for kind, entries in new_history.items():
+                history.insert_rows(self.connection, kind, entries)
+            self.connection.executemany("""
+                INSERT INTO bridges (id, name, type, data, created_at, updated_at, is_active,
+                                     maturity_level, internal_ticks, consciousness_level)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    type = excluded.type,
+                    data = excluded.data,
+                    updated_at = excluded.updated_at,
+                    is_active = excluded.is_active,
+                    maturity_level = excluded.maturity_level,
+                    internal_ticks = excluded.internal_ticks,
+                    consciousness_level = excluded.consciousness_level
+            """, rows)
         
-        if cursor.fetchone():
-            # Update
-            self.connection.execute("""
-                UPDATE bridges 
-                SET name = ?, type = ?, data = ?, updated_at = ?, is_active = ?
-                WHERE id = ?
-            """, (
-                bridge.name,
-                bridge.type,
-                json.dumps(bridge_data),
-                now,
-                1 if bridge.is_active else 0,
-                bridge.id
-            ))
-        else:
-            # Insert
-            self.connection.execute("""
-                INSERT INTO bridges (id, name, type, data, created_at, updated_at, is_active)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
+        for bridge, (experience_seq, insight_seq) in marks:
+            with self.locks.hold(bridge.id):
+                bridge.memory_system.mark_saved(experience_seq, insight_seq)
+        
+        return len(rows)
+    
+    def _bridge_row(self, bridge: ConsciousBridgeReloaded, now: str) -> Tuple[tuple, Dict, Tuple[int, int]]:
+        """
+        Serialize one bridge (consistently, while holding its lock)
+        
+        Returns:
+            (bridges row, unsaved history rows by kind, history high-water marks)
+        """
+        with self.locks.hold(bridge.id):
+            memory = bridge.memory_system
+            pending = {
+                "experiences": history.history_rows("experiences", bridge.id, memory.experiences.pending()),
+                "insights": history.history_rows("insights", bridge.id, memory.insights.pending())
+            }
+            mark = (memory.experiences.count, memory.insights.count)
+            row = (
                 bridge.id,
                 bridge.name,
                 bridge.type,
-                json.dumps(bridge_data),
+                json.dumps(bridge.to_dict()),
                 bridge.created_at,
                 now,
-                1 if bridge.is_active else 0
-            ))
-        
-        self.connection.commit()
-        return bridge.id
+                1 if bridge.is_active else 0,
+                bridge.maturity_stage,
+                bridge.internal_clock.ticks,
+                bridge.consciousness_level
+            )
+        return row, pending, mark
+    
+    def read_history(self, kind: str, bridge: ConsciousBridgeReloaded, after: int = 0,
+                     limit: int = history.DEFAULT_PAGE_SIZE) -> Tuple[List[Dict], Optional[int]]:
+        """Page through a bridge's experiences or insights (call with the bridge checked out)"""
+        log = getattr(bridge.memory_system, kind)
+        with self.lock:
+            return history.read_page(self.connection, kind, bridge.id, log, after, limit)
+    
+    def import_history(self, bridge_id: str, entries_by_kind: Dict[str, List[Dict]]):
+        """Store history exported by another worker"""
+        with self.lock, self.connection:
+            for kind, entries in entries_by_kind.items():
+                history.insert_rows(self.connection, kind, history.history_rows(kind, bridge_id, entries))
     
     def load_bridge(self, bridge_id: str) -> Optional[ConsciousBridgeReloaded]:
         """Load bridge by ID"""
-        cursor = self.connection.execute(
-            "SELECT data FROM bridges WHERE id = ? AND is_active = 1", 
-            (bridge_id,)
-        )
-        row = cursor.fetchone()
+        with self.lock:
+            cursor = self.connection.execute(
+                "SELECT data FROM bridges WHERE id = ? AND is_active = 1", 
+                (bridge_id,)
+            )
+            row = cursor.fetchone()
         
         if row:
             bridge_data = json.loads(row["data"])
@@ -342,48 +675,195 @@ class Database:
     
     def load_all_bridges(self) -> List[ConsciousBridgeReloaded]:
         """Load all active bridges"""
-        cursor = self.connection.execute(
-            "SELECT data FROM bridges WHERE is_active = 1 ORDER BY updated_at DESC"
-        )
+        with self.lock:
+            cursor = self.connection.execute(
+                "SELECT data FROM bridges WHERE is_active = 1 ORDER BY updated_at DESC"
+            )
+            rows = cursor.fetchall()
+        
         bridges = []
-        for row in cursor.fetchall():
+        for row in rows:
             bridge_data = json.loads(row["data"])
             bridges.append(ConsciousBridgeReloaded.from_dict(bridge_data))
         return bridges
     
+    def has_bridge(self, bridge_id: str) -> bool:
+        """Whether a bridge row exists (active or soft-deleted)"""
+        with self.lock:
+            cursor = self.connection.execute("SELECT 1 FROM bridges WHERE id = ?", (bridge_id,))
+            return cursor.fetchone() is not None
+    
+    def list_bridge_ids(self) -> List[str]:
+        """Ids of all active bridges"""
+        with self.lock:
+            cursor = self.connection.execute("SELECT id FROM bridges WHERE is_active = 1")
+            return [row["id"] for row in cursor.fetchall()]
+    
+    def purge_bridges(self, bridge_ids: List[str]) -> int:
+        """Permanently remove bridges (e.g. after moving them to another shard)"""
+        with self.lock, self.connection:
+            cursor = self.connection.executemany(
+                "DELETE FROM bridges WHERE id = ?",
+                [(bridge_id,) for bridge_id in bridge_ids]
+            )
+            history.delete_rows(self.connection, bridge_ids)
+        return cursor.rowcount
+    
+    def save_autotick(self, bridge_id: str, rate: Optional[float], bridge_class: Optional[str]):
+        """Store a bridge's auto-tick registration"""
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO bridge_autotick (bridge_id, rate, bridge_class) VALUES (?, ?, ?)",
+                (bridge_id, rate, bridge_class)
+            )
+    
+    def delete_autotick(self, bridge_ids: List[str]):
+        """Remove auto-tick registrations"""
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "DELETE FROM bridge_autotick WHERE bridge_id = ?",
+                [(bridge_id,) for bridge_id in bridge_ids]
+            )
+    
+    def save_autotick_class(self, name: str, rate: float):
+        """Store a class rate"""
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO autotick_classes (name, rate) VALUES (?, ?)",
+                (name, rate)
+            )
+    
+    def load_autotick(self) -> Tuple[List[sqlite3.Row], Dict[str, float]]:
+        """Load auto-tick registrations and class rates"""
+        with self.lock:
+            registrations = self.connection.execute(
+                "SELECT bridge_id, rate, bridge_class FROM bridge_autotick"
+            ).fetchall()
+            classes = self.connection.execute("SELECT name, rate FROM autotick_classes").fetchall()
+        return registrations, {row["name"]: row["rate"] for row in classes}
+    
+    def count_bridges(self) -> int:
+        """Number of active bridges"""
+        with self.lock:
+            cursor = self.connection.execute(
+                "SELECT COALESCE(SUM(count), 0) FROM bridge_stats WHERE is_active = 1"
+            )
+            return cursor.fetchone()[0]
+    
+    def list_bridge_summaries(self, query: Optional[ListQuery] = None,
+                              live: Iterable[ConsciousBridgeReloaded] = ()) -> Tuple[List[Dict], Optional[str]]:
+        """
+        List one page of active bridges from the summary columns
+        
+        Args:
+            live: Bridges whose rows may be stale (unsaved changes); their
+                  current values are filtered, sorted and paged together
+                  with the database rows in place of those rows
+        
+        Returns:
+            (bridges, next_cursor); next_cursor is None on the last page
+        """
+        query = query or ListQuery()
+        live_rows = {}
+        for bridge in live:
+            with self.locks.hold(bridge.id):
+                live_rows[bridge.id] = {
+                    "id": bridge.id,
+                    "name": bridge.name,
+                    "type": bridge.type,
+                    "maturity_stage": bridge.maturity_stage,
+                    "ticks": bridge.internal_clock.ticks,
+                    "consciousness_level": bridge.consciousness_level,
+                    "created_at": bridge.created_at,
+                    "is_active": 1 if bridge.is_active else 0
+                }
+        sort_column = LIST_FIELDS[query.sort]
+        selected = dict.fromkeys(query.fields + ["id", query.sort])
+        
+        where = ["is_active = 1"]
+        params: List[Any] = []
+        if query.maturity_stage:
+            where.append("maturity_level = ?")
+            params.append(query.maturity_stage)
+        if query.type:
+            where.append("type = ?")
+            params.append(query.type)
+        if query.min_consciousness is not None:
+            where.append("consciousness_level >= ?")
+            params.append(query.min_consciousness)
+        if query.max_consciousness is not None:
+            where.append("consciousness_level <= ?")
+            params.append(query.max_consciousness)
+        if query.after is not None:
+            where.append(f"({sort_column}, id) {'<' if query.descending else '>'} (?, ?)")
+            params.extend(query.after)
+        
+        direction = "DESC" if query.descending else "ASC"
+        sql = f"""
+            SELECT {', '.join(f'{LIST_FIELDS[name]} AS {name}' for name in selected)}
+            FROM bridges
+            WHERE {' AND '.join(where)}
+            ORDER BY {sort_column} {direction}, id {direction}
+            LIMIT ?
+        """
+        # Over-fetch by the live rows' count: their stale copies are dropped
+        params.append(query.limit + 1 + len(live_rows))
+        
+        with self.lock:
+            rows = self.connection.execute(sql, params).fetchall()
+        
+        if live_rows:
+            rows = [row for row in rows if row["id"] not in live_rows]
+            rows.extend(row for row in live_rows.values() if _summary_matches(row, query))
+            rows.sort(key=lambda row: _sort_key(row[query.sort], row["id"]), reverse=query.descending)
+        
+        next_cursor = None
+        if len(rows) > query.limit:
+            rows = rows[:query.limit]
+            next_cursor = encode_cursor(rows[-1][query.sort], rows[-1]["id"])
+        
+        bridges = []
+        for row in rows:
+            summary = {name: row[name] for name in query.fields}
+            if "is_active" in summary:
+                summary["is_active"] = bool(summary["is_active"])
+            bridges.append(summary)
+        return bridges, next_cursor
+    
     def delete_bridge(self, bridge_id: str) -> bool:
         """Soft delete bridge"""
-        self.connection.execute(
-            "UPDATE bridges SET is_active = 0, updated_at = ? WHERE id = ?",
-            (datetime.now().isoformat(), bridge_id)
-        )
-        self.connection.commit()
+        with self.lock, self.connection:
+            self.connection.execute(
+                "UPDATE bridges SET is_active = 0, updated_at = ? WHERE id = ?",
+                (datetime.now().isoformat(), bridge_id)
+            )
         return True
     
     def get_stats(self) -> Dict:
-        """Get database statistics"""
-        cursor = self.connection.execute("""
-            SELECT 
-                COUNT(*) as total,
-                SUM(is_active) as active,
-                COUNT(*) - SUM(is_active) as inactive
-            FROM bridges
-        """)
-        stats = cursor.fetchone()
+        """Get database statistics from the maintained bridge_stats table"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT * FROM bridge_stats WHERE count > 0"
+            ).fetchall()
         
-        # Get stage distribution
-        cursor = self.connection.execute("SELECT data FROM bridges WHERE is_active = 1")
+        total = active = total_ticks = 0
+        total_consciousness = 0.0
         stages = {}
-        for row in cursor.fetchall():
-            bridge_data = json.loads(row["data"])
-            stage = bridge_data.get("maturity_stage", "unknown")
-            stages[stage] = stages.get(stage, 0) + 1
+        for row in rows:
+            total += row["count"]
+            if row["is_active"]:
+                active += row["count"]
+                total_ticks += row["total_ticks"]
+                total_consciousness += row["total_consciousness"]
+                stages[row["maturity_level"]] = row["count"]
         
         return {
-            "total_bridges": stats["total"],
-            "active_bridges": stats["active"],
-            "inactive_bridges": stats["inactive"],
-            "maturity_distribution": stages
+            "total_bridges": total,
+            "active_bridges": active,
+            "inactive_bridges": total - active,
+            "maturity_distribution": stages,
+            "total_ticks": total_ticks,
+            "average_consciousness": round(total_consciousness / active, 3) if active else 0.0
         }
 
 
@@ -393,22 +873,65 @@ class Database:
 app = Flask(__name__)
 CORS(app)
 
+# Per-bridge lock striping: different bridges are handled in parallel,
+# requests for the same bridge are serialized
+bridge_locks = LockStripes(int(os.environ.get("BRIDGE_LOCK_STRIPES", "64")))
+
 # Initialize database
-db = Database("conscious_bridges_reloaded.db")
+DB_PATH = os.environ.get("BRIDGE_DB_PATH", "conscious_bridges_reloaded.db")
+DEBUG = os.environ.get("BRIDGE_DEBUG", "1") == "1"
+db = Database(DB_PATH, locks=bridge_locks)
 db.initialize_schema()
 
-# In-memory cache for active bridges
-active_bridges: Dict[str, ConsciousBridgeReloaded] = {}
+# Write-behind persistence: request handlers mark bridges dirty and a
+# background flusher saves them in batched transactions
+persistence = WriteBehindPersistence(
+    db.save_bridges,
+    flush_interval=float(os.environ.get("BRIDGE_FLUSH_INTERVAL", "1.0")),
+    max_batch=int(os.environ.get("BRIDGE_FLUSH_MAX_BATCH", "500")),
+    durability=os.environ.get("BRIDGE_DURABILITY", "batched")
+)
+atexit.register(persistence.close)
+
+# Live events (Server-Sent Events); payloads are only built while
+# someone is subscribed
+event_hub = EventHub(buffer_size=int(os.environ.get("BRIDGE_EVENT_BUFFER", "256")))
+ConsciousBridgeReloaded.events = event_hub
+SSE_KEEPALIVE_SECONDS = 15.0
+
+# Batch tick limits
+MAX_BATCH_ENTRIES = int(os.environ.get("BRIDGE_MAX_BATCH_ENTRIES", "10000"))
+
+# Streaming ingestion
+STREAM_CHUNK_SIZE = int(os.environ.get("BRIDGE_STREAM_CHUNK_SIZE", "1000"))
+
+def _bridge_exists(bridge_id: str) -> bool:
+    """Whether a bridge exists (looked up, and hydrated, under its stripe lock)"""
+    with active_bridges.checkout(bridge_id) as bridge:
+        return bridge is not None
+
 
-# Load existing bridges
-print("🔍 Loading existing bridges from database...")
-existing_bridges = db.load_all_bridges()
-for bridge in existing_bridges:
-    active_bridges[bridge.id] = bridge
-    print(f"   ✓ Loaded: {bridge.name} ({bridge.maturity_stage})")
+def _load_bridge(bridge_id: str) -> Optional[ConsciousBridgeReloaded]:
+    """Hydrate a bridge, preferring an unsaved object over its database row"""
+    return persistence.get_pending(bridge_id) or db.load_bridge(bridge_id)
 
-# Create sample bridges if none exist
-if len(active_bridges) == 0:
+
+# Hot bridges are hydrated on first access. Request handlers use
+# active_bridges.checkout(), which holds the bridge's stripe lock; an
+# evicted bridge with unsaved changes is re-hydrated from the write-behind
+# layer, so eviction needs no synchronous write-back.
+active_bridges = BridgeCache(
+    loader=_load_bridge,
+    capacity=int(os.environ.get("BRIDGE_CACHE_SIZE", "1000")),
+    locks=bridge_locks
+)
+
+# Set when running as one worker of a sharded deployment (api.sharding)
+SHARD_ID = os.environ.get("BRIDGE_SHARD_ID")
+
+# Create sample bridges if none exist (a shard only holds the bridges
+# the router assigns to it)
+if SHARD_ID is None and db.count_bridges() == 0:
     print("🧪 Creating sample bridges...")
     sample_names = ["Wisdom-Keeper", "Science-Bridge", "Empathy-Connector"]
     for name in sample_names:
@@ -417,11 +940,66 @@ if len(active_bridges) == 0:
         active_bridges[bridge.id] = bridge
         print(f"   ✓ Created: {name}")
 
-print(f"🚀 Ready with {len(active_bridges)} active bridges")
+
+
+def _auto_advance(batch: Dict[str, int]) -> List[str]:
+    """Advance auto-ticked bridges; returns the ids that no longer exist"""
+    missing = []
+    for bridge_id, ticks in batch.items():
+        with active_bridges.checkout(bridge_id) as bridge:
+            if bridge is None:
+                missing.append(bridge_id)
+                continue
+            bridge.advance(ticks)
+            persistence.mark_dirty(bridge)
+    
+    if missing:
+        db.delete_autotick(missing)
+    return missing
+
+
+# Background auto-tick: registered bridges advance at their configured
+# rate, batched on one scheduler thread
+auto_ticker = AutoTickScheduler(
+    _auto_advance,
+    interval=float(os.environ.get("BRIDGE_AUTOTICK_INTERVAL", "0.1"))
+)
+registrations, auto_ticker.class_rates = db.load_autotick()
+for row in registrations:
+    auto_ticker.register(row["bridge_id"], rate=row["rate"], bridge_class=row["bridge_class"])
+
+def _autotick_wanted() -> bool:
+    """
+    Whether this process runs the auto-tick scheduler
+    
+    Everywhere (gunicorn, other WSGI servers, shard workers) except the
+    debug reloader's watcher process: `python -m api.server` with DEBUG
+    on runs the module once as a watcher, which never serves, and again
+    in the serving child, which Werkzeug marks with WERKZEUG_RUN_MAIN.
+    """
+    if os.environ.get("BRIDGE_AUTOTICK", "1") != "1":
+        return False
+    reloader_parent = DEBUG and __name__ == '__main__' and os.environ.get("WERKZEUG_RUN_MAIN") != "true"
+    return not reloader_parent
+
+
+if _autotick_wanted():
+    auto_ticker.start()
+    atexit.register(auto_ticker.stop)
+
+print(f"🚀 Ready with {db.count_bridges()} active bridges")
 
 
 # ================ API ENDPOINTS ================
 
+def _conditional_response(entry: VersionedBody):
+    """Serve a cached representation, or 304 if the client already has it"""
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("If-None-Match"), entry.etag):
+        return Response(status=304, headers=headers)
+    return Response(entry.body, mimetype="application/json", headers=headers)
+
+
 @app.route('/')
 def index():
     """API root"""
@@ -432,12 +1010,22 @@ def index():
         "description": "Before evolution comes maturity. Before maturity comes internal time.",
         "endpoints": {
             "GET /api": "API information",
-            "GET /api/bridges": "List all bridges",
+            "GET /api/bridges": "List bridges (paginated, filterable, field projection)",
             "GET /api/bridges/<id>": "Get bridge details",
             "POST /api/bridges": "Create new bridge",
             "POST /api/bridges/<id>/tick": "Tick internal clock",
+            "POST /api/bridges/tick:batch": "Advance many bridges by many ticks",
             "POST /api/bridges/<id>/experience": "Add experience",
+            "POST /api/bridges/<id>/experiences:stream": "Stream NDJSON experiences",
+            "POST /api/experiences:stream": "Stream NDJSON experiences for many bridges",
             "GET /api/bridges/<id>/consciousness": "Get consciousness breakdown",
+            "GET /api/bridges/<id>/experiences": "Page through experiences (after, limit)",
+            "GET /api/bridges/<id>/insights": "Page through insights (after, limit)",
+            "GET /api/bridges/<id>/events": "Live events of one bridge (SSE)",
+            "GET /api/events": "Live events of all bridges (SSE)",
+            "GET /api/autotick": "Auto-tick scheduler metrics",
+            "PUT /api/bridges/<id>/autotick": "Auto-tick a bridge (rate or class)",
+            "PUT /api/autotick/classes/<name>": "Set a class auto-tick rate",
             "GET /api/stats": "System statistics",
             "GET /api/health": "Health check"
         },
@@ -452,7 +1040,7 @@ def api_info():
         "name": "Conscious Bridge Reloaded API",
         "version": "2.1.0",
         "status": "active",
-        "active_bridges": len(active_bridges),
+        "active_bridges": db.count_bridges(),
         "philosophical_shift": "From quantitative measurement to qualitative lived experience",
         "timestamp": datetime.now().isoformat()
     })
@@ -460,34 +1048,39 @@ def api_info():
 
 @app.route('/api/bridges', methods=['GET'])
 def list_bridges():
-    """List all bridges"""
-    bridges = []
-    for bridge in active_bridges.values():
-        bridges.append({
-            "id": bridge.id,
-            "name": bridge.name,
-            "type": bridge.type,
-            "maturity_stage": bridge.maturity_stage,
-            "ticks": bridge.internal_clock.ticks,
-            "consciousness_level": bridge.consciousness_level,
-            "created_at": bridge.created_at,
-            "is_active": bridge.is_active
-        })
+    """
+    List bridges, one page at a time
+    
+    Query parameters: limit, cursor, sort, order, fields, maturity_stage,
+    type, min_consciousness, max_consciousness
+    """
+    try:
+        query = parse_list_query(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    # Bridges with unsaved changes are listed from their live values, so
+    # filters, sort order and cursors agree with them without a flush on
+    # every read (the cost grows with the write-behind backlog, not the table)
+    bridges, next_cursor = db.list_bridge_summaries(query, persistence.pending_bridges())
     
     return jsonify({
         "count": len(bridges),
-        "bridges": bridges
+        "bridges": bridges,
+        "next_cursor": next_cursor
     })
 
 
 @app.route('/api/bridges/<bridge_id>', methods=['GET'])
 def get_bridge(bridge_id):
     """Get bridge details"""
-    if bridge_id not in active_bridges:
-        return jsonify({"error": "Bridge not found"}), 404
+    with active_bridges.checkout(bridge_id) as bridge:
+        if bridge is None:
+            return jsonify({"error": "Bridge not found"}), 404
+        
+        entry = bridge.representation("breakdown", bridge.get_consciousness_breakdown)
     
-    bridge = active_bridges[bridge_id]
-    return jsonify(bridge.get_consciousness_breakdown())
+    return _conditional_response(entry)
 
 
 @app.route('/api/bridges', methods=['POST'])
@@ -509,11 +1102,19 @@ def create_bridge():
             initial_personality=data.get('personality')
         )
         
-        # Save to database
-        db.save_bridge(bridge)
+        # In sharded mode the router assigns the id
+        if SHARD_ID is not None and request.headers.get('X-Bridge-Id'):
+            bridge.id = request.headers['X-Bridge-Id']
         
-        # Add to active bridges
-        active_bridges[bridge.id] = bridge
+        with bridge_locks.registry, bridge_locks.hold(bridge.id):
+            if db.has_bridge(bridge.id) or persistence.get_pending(bridge.id):
+                return jsonify({"error": f"Bridge already exists: {bridge.id}"}), 409
+            
+            # Save to database
+            db.save_bridge(bridge)
+            
+            # Add to active bridges
+            active_bridges[bridge.id] = bridge
         
         return jsonify({
             "message": f"Bridge '{bridge.name}' created successfully",
@@ -540,32 +1141,33 @@ def create_bridge():
 def tick_bridge(bridge_id):
     """Trigger an internal tick for a bridge"""
     try:
-        if bridge_id not in active_bridges:
-            return jsonify({"error": "Bridge not found"}), 404
-        
-        bridge = active_bridges[bridge_id]
-        
         # Get tick parameters
         data = request.get_json() or {}
         experience_depth = data.get('experience_depth', 0.5)
         attention_level = data.get('attention_level', 0.7)
         
-        # Process tick
-        tick_result = bridge.tick(experience_depth, attention_level)
-        
-        # Save updated state
-        db.save_bridge(bridge)
-        
-        return jsonify({
-            "message": f"Consciousness tick processed for {bridge.name}",
-            "tick_result": tick_result,
-            "current_state": {
+        with active_bridges.checkout(bridge_id) as bridge:
+            if bridge is None:
+                return jsonify({"error": "Bridge not found"}), 404
+            
+            # Process tick
+            tick_result = bridge.tick(experience_depth, attention_level)
+            
+            # Save updated state (write-behind)
+            persistence.mark_dirty(bridge)
+            
+            current_state = {
                 "ticks": bridge.internal_clock.ticks,
                 "maturity_stage": bridge.maturity_stage,
                 "psychological_time": round(bridge.internal_clock.psychological_time, 2),
                 "consciousness_level": round(bridge.consciousness_level, 3),
-                "personality_traits": bridge.personality_core.traits
+                "personality_traits": dict(bridge.personality_core.traits)
             }
+        
+        return jsonify({
+            "message": f"Consciousness tick processed for {bridge.name}",
+            "tick_result": tick_result,
+            "current_state": current_state
         })
         
     except Exception as e:
@@ -574,6 +1176,77 @@ def tick_bridge(bridge_id):
         }), 500
 
 
+@app.route('/api/bridges/tick:batch', methods=['POST'])
+def tick_bridges_batch():
+    """Advance many bridges by many ticks in one request"""
+    try:
+        data = request.get_json() or {}
+        entries = data.get('entries', []) if isinstance(data, dict) else data
+        parallel = isinstance(data, dict) and data.get('parallel', False)
+        
+        if not isinstance(entries, list) or not entries:
+            return jsonify({"error": "A non-empty list of entries is required"}), 400
+        if len(entries) > MAX_BATCH_ENTRIES:
+            return jsonify({"error": f"At most {MAX_BATCH_ENTRIES} entries per batch"}), 400
+        
+        # Validate everything before any bridge is advanced
+        for index, entry in enumerate(entries):
+            error = batch_entry_error(entry)
+            if error:
+                return jsonify({"error": error, "index": index}), 400
+        
+        # Entries for the same bridge run in order; different bridges are independent
+        groups: Dict[str, List] = {}
+        for index, entry in enumerate(entries):
+            groups.setdefault(entry['bridge_id'], []).append((index, entry))
+        
+        results: List[Optional[Dict]] = [None] * len(entries)
+        advanced: Dict[str, ConsciousBridgeReloaded] = {}
+        
+        def run_group(bridge_id, group):
+            # One object per bridge for the whole batch, even if the cache
+            # evicts it meanwhile (it is only marked dirty at the end)
+            bridge = active_bridges.get(bridge_id)
+            for index, entry in group:
+                if bridge is None:
+                    results[index] = {"bridge_id": bridge_id, "error": "Bridge not found"}
+                    continue
+                results[index] = bridge.advance(
+                    entry.get('ticks', 1),
+                    entry.get('experience_depth', 0.5),
+                    entry.get('attention_level', 0.7)
+                )
+            if bridge is not None:
+                advanced[bridge_id] = bridge
+        
+        # The batch holds the locks of all its bridges, so groups (one per
+        # bridge) can run on pool threads without taking them again, and
+        # every bridge is marked dirty while still locked: the write-behind
+        # layer always holds the object other requests will see, and
+        # immediate durability saves the whole batch in one transaction
+        with bridge_locks.hold_many(groups):
+            if parallel and len(groups) > 1:
+                with ThreadPoolExecutor(max_workers=min(len(groups), os.cpu_count() or 1)) as pool:
+                    list(pool.map(run_group, groups.keys(), groups.values()))
+            else:
+                for bridge_id, group in groups.items():
+                    run_group(bridge_id, group)
+            
+            if advanced:
+                persistence.mark_dirty_many(advanced.values())
+        
+        return jsonify({
+            "message": f"Advanced {len(advanced)} bridges",
+            "total_ticks": sum(r.get("ticks_delta", 0) for r in results),
+            "results": results
+        })
+        
+    except Exception as e:
+        return jsonify({
+            "error": f"Failed to process batch tick: {str(e)}"
+        }), 500
+
+
 @app.route('/api/bridges/<bridge_id>/experience', methods=['POST'])
 def add_experience(bridge_id):
     """Add a meaningful experience to bridge"""
@@ -585,32 +1258,136 @@ def add_experience(bridge_id):
                 "error": "Experience content is required"
             }), 400
         
-        if bridge_id not in active_bridges:
-            return jsonify({"error": "Bridge not found"}), 404
+        with active_bridges.checkout(bridge_id) as bridge:
+            if bridge is None:
+                return jsonify({"error": "Bridge not found"}), 404
+            
+            # Add experience
+            result = bridge.add_experience(
+                content=data['content'],
+                exp_type=data.get('type', 'general'),
+                depth=data.get('depth', 0.5)
+            )
+            
+            # Save updated state (write-behind)
+            persistence.mark_dirty(bridge)
+            
+            response = {
+                "message": "Experience added and processed",
+                "experience": result["experience"],
+                "insight": result["insight"],
+                "updated_personality": dict(result["new_personality"]),
+                "memory_stats": bridge.memory_system.get_stats()
+            }
         
-        bridge = active_bridges[bridge_id]
+        return jsonify(response)
         
-        # Add experience
-        result = bridge.add_experience(
-            content=data['content'],
-            exp_type=data.get('type', 'general'),
-            depth=data.get('depth', 0.5)
-        )
+    except Exception as e:
+        return jsonify({
+            "error": f"Failed to add experience: {str(e)}"
+        }), 500
+
+
+def _ingest_experience_stream(default_bridge_id: Optional[str] = None):
+    """
+    Feed an NDJSON request body into bridges chunk by chunk
+    
+    Each line is an experience ({content, type, depth}); for the
+    multi-bridge endpoint it also carries bridge_id. Bridges touched by
+    a chunk are committed before the next chunk is read.
+    """
+    chunk_size = request.args.get('chunk_size', STREAM_CHUNK_SIZE, type=int)
+    chunk_size = max(1, chunk_size)
+    
+    summary = {"accepted": 0, "rejected": 0, "insights": 0, "chunks": 0, "bridges": set()}
+    errors = []
+    
+    def reject(line_number, message):
+        summary["rejected"] += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({"line": line_number, "error": message})
+    
+    for chunk in iter_ndjson_chunks(request.stream, chunk_size):
+        # Check the lines first, so the chunk's bridges can be locked together
+        lines = []
+        for line_number, record in chunk:
+            if "__error__" in record:
+                reject(line_number, record["__error__"])
+                continue
+            if 'content' not in record:
+                reject(line_number, "Experience content is required")
+                continue
+            
+            bridge_id = default_bridge_id or record.get('bridge_id')
+            if not isinstance(bridge_id, str):
+                reject(line_number, "bridge_id must be a string")
+                continue
+            lines.append((line_number, record, bridge_id))
         
-        # Save updated state
-        db.save_bridge(bridge)
+        # One object per bridge for the whole chunk, marked dirty together
+        # while still locked (see tick_bridges_batch)
+        touched: Dict[str, ConsciousBridgeReloaded] = {}
+        missing = set()
+        with bridge_locks.hold_many({bridge_id for _, _, bridge_id in lines}):
+            for line_number, record, bridge_id in lines:
+                bridge = touched.get(bridge_id)
+                if bridge is None and bridge_id not in missing:
+                    bridge = active_bridges.get(bridge_id)
+                if bridge is None:
+                    missing.add(bridge_id)
+                    reject(line_number, f"Bridge not found: {bridge_id}")
+                    continue
+                touched[bridge_id] = bridge
+                
+                result = bridge.add_experience(
+                    content=record['content'],
+                    exp_type=record.get('type', 'general'),
+                    depth=record.get('depth', 0.5)
+                )
+                summary["accepted"] += 1
+                if result["insight"]:
+                    summary["insights"] += 1
+            
+            if touched:
+                persistence.mark_dirty_many(touched.values())
+        
+        # Commit per chunk (no bridge locks held here)
+        if touched:
+            persistence.flush()
+            summary["bridges"].update(touched)
+        summary["chunks"] += 1
+    
+    return {
+        **summary,
+        "bridges": len(summary["bridges"]),
+        "errors": errors
+    }
+
+
+@app.route('/api/bridges/<bridge_id>/experiences:stream', methods=['POST'])
+def stream_experiences(bridge_id):
+    """Ingest newline-delimited JSON experiences into one bridge"""
+    try:
+        if not _bridge_exists(bridge_id):
+            return jsonify({"error": "Bridge not found"}), 404
+        
+        return jsonify(_ingest_experience_stream(default_bridge_id=bridge_id))
         
+    except Exception as e:
         return jsonify({
-            "message": "Experience added and processed",
-            "experience": result["experience"],
-            "insight": result["insight"],
-            "updated_personality": result["new_personality"],
-            "memory_stats": bridge.memory_system.get_stats()
-        })
+            "error": f"Failed to ingest experiences: {str(e)}"
+        }), 500
+
+
+@app.route('/api/experiences:stream', methods=['POST'])
+def stream_experiences_multi():
+    """Ingest newline-delimited JSON experiences for many bridges (bridge_id per line)"""
+    try:
+        return jsonify(_ingest_experience_stream())
         
     except Exception as e:
         return jsonify({
-            "error": f"Failed to add experience: {str(e)}"
+            "error": f"Failed to ingest experiences: {str(e)}"
         }), 500
 
 
@@ -618,11 +1395,13 @@ def add_experience(bridge_id):
 def get_consciousness(bridge_id):
     """Get detailed consciousness breakdown"""
     try:
-        if bridge_id not in active_bridges:
-            return jsonify({"error": "Bridge not found"}), 404
+        with active_bridges.checkout(bridge_id) as bridge:
+            if bridge is None:
+                return jsonify({"error": "Bridge not found"}), 404
+            
+            entry = bridge.representation("breakdown", bridge.get_consciousness_breakdown)
         
-        bridge = active_bridges[bridge_id]
-        return jsonify(bridge.get_consciousness_breakdown())
+        return _conditional_response(entry)
         
     except Exception as e:
         return jsonify({
@@ -630,31 +1409,233 @@ def get_consciousness(bridge_id):
         }), 500
 
 
+def _history_page(bridge_id: str, kind: str):
+    """One page of a bridge's experiences or insights, oldest first"""
+    try:
+        after, limit = history.parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    with active_bridges.checkout(bridge_id) as bridge:
+        if bridge is None:
+            return jsonify({"error": "Bridge not found"}), 404
+        
+        entries, next_after = db.read_history(kind, bridge, after, limit)
+        total = getattr(bridge.memory_system, kind).count
+    
+    return jsonify({
+        "bridge_id": bridge_id,
+        kind: entries,
+        "count": len(entries),
+        "total": total,
+        "next_after": next_after
+    })
+
+
+@app.route('/api/bridges/<bridge_id>/experiences', methods=['GET'])
+def list_experiences(bridge_id):
+    """Page through a bridge's experiences (query parameters: after, limit)"""
+    return _history_page(bridge_id, "experiences")
+
+
+@app.route('/api/bridges/<bridge_id>/insights', methods=['GET'])
+def list_insights(bridge_id):
+    """Page through a bridge's insights (query parameters: after, limit)"""
+    return _history_page(bridge_id, "insights")
+
+
+def _format_sse(event: Dict) -> str:
+    """Encode one event in Server-Sent Events wire format"""
+    lines = []
+    if event["id"] is not None:
+        lines.append(f"id: {event['id']}")
+    lines.append(f"event: {event['type']}")
+    lines.append("data: " + json.dumps({
+        "bridge_id": event["bridge_id"],
+        "time": event["time"],
+        **event["data"]
+    }, separators=(",", ":")))
+    return "\n".join(lines) + "\n\n"
+
+
+def _event_stream(bridge_id: Optional[str] = None) -> Response:
+    """Stream hub events to one client until it disconnects"""
+    subscription = event_hub.subscribe(bridge_id)
+    
+    def generate():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                batch = subscription.get(timeout=SSE_KEEPALIVE_SECONDS)
+                if not batch:
+                    yield ": keepalive\n\n"
+                    continue
+                yield "".join(_format_sse(event) for event in batch)
+        finally:
+            subscription.close()
+    
+    return Response(generate(), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+
+
+@app.route('/api/bridges/<bridge_id>/events', methods=['GET'])
+def bridge_events_stream(bridge_id):
+    """Live tick, maturity, insight and personality events of one bridge"""
+    if not _bridge_exists(bridge_id):
+        return jsonify({"error": "Bridge not found"}), 404
+    
+    return _event_stream(bridge_id)
+
+
+@app.route('/api/events', methods=['GET'])
+def fleet_events_stream():
+    """Live events of every bridge"""
+    return _event_stream()
+
+
+# ========== AUTO-TICK ENDPOINTS ==========
+
+@app.route('/api/autotick', methods=['GET'])
+def autotick_status():
+    """Auto-tick scheduler metrics (lag, drift, throughput) and class rates"""
+    return jsonify({
+        "scheduler": auto_ticker.get_stats(),
+        "classes": dict(auto_ticker.class_rates)
+    })
+
+
+@app.route('/api/autotick/classes/<name>', methods=['PUT'])
+def set_autotick_class(name):
+    """Set the ticks-per-second rate of a bridge class"""
+    data = request.get_json() or {}
+    try:
+        rate = float(data['rate'])
+        auto_ticker.set_class_rate(name, rate)
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({"error": f"A finite, non-negative rate is required: {e}"}), 400
+    
+    db.save_autotick_class(name, rate)
+    return jsonify({"class": name, "rate": rate})
+
+
+@app.route('/api/bridges/<bridge_id>/autotick', methods=['GET', 'PUT', 'DELETE'])
+def bridge_autotick(bridge_id):
+    """Get, set (rate or class) or remove a bridge's auto-tick registration"""
+    if request.method == 'DELETE':
+        auto_ticker.unregister(bridge_id)
+        db.delete_autotick([bridge_id])
+        return jsonify({"bridge_id": bridge_id, "autotick": None})
+    
+    if request.method == 'PUT':
+        if not _bridge_exists(bridge_id):
+            return jsonify({"error": "Bridge not found"}), 404
+        
+        data = request.get_json() or {}
+        try:
+            rate = float(data['rate']) if data.get('rate') is not None else None
+            bridge_class = data.get('class')
+            auto_ticker.register(bridge_id, rate=rate, bridge_class=bridge_class)
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+        db.save_autotick(bridge_id, rate, bridge_class)
+    
+    return jsonify({"bridge_id": bridge_id, "autotick": auto_ticker.registration(bridge_id)})
+
+
+# ========== SHARD ENDPOINTS (used by api.sharding when rebalancing) ==========
+
+@app.route('/api/shard/bridges', methods=['GET'])
+def shard_bridge_ids():
+    """Ids of the bridges this worker holds"""
+    persistence.flush()
+    return jsonify({"shard": SHARD_ID, "ids": db.list_bridge_ids()})
+
+
+def _read_all_history(kind: str, bridge: ConsciousBridgeReloaded) -> List[Dict]:
+    entries, after = [], 0
+    while after is not None:
+        page, after = db.read_history(kind, bridge, after, history.MAX_PAGE_SIZE)
+        entries.extend(page)
+    return entries
+
+
+@app.route('/api/shard/export', methods=['POST'])
+def shard_export():
+    """Serialize bridges for another worker (they stay here until released)"""
+    ids = (request.get_json() or {}).get('ids', [])
+    bridges = []
+    for bridge_id in ids:
+        with active_bridges.checkout(bridge_id) as bridge:
+            if bridge is not None:
+                data = bridge.to_dict()
+                data["history"] = {
+                    kind: _read_all_history(kind, bridge) for kind in history.HISTORY_TABLES
+                }
+                registration = auto_ticker.registration(bridge_id)
+                if registration:
+                    data["autotick"] = {"rate": registration["rate"], "class": registration["class"]}
+                bridges.append(data)
+    return jsonify({"bridges": bridges})
+
+
+@app.route('/api/shard/import', methods=['POST'])
+def shard_import():
+    """Take over bridges exported by another worker"""
+    exported = (request.get_json() or {}).get('bridges', [])
+    bridges = [ConsciousBridgeReloaded.from_dict(data) for data in exported]
+    with bridge_locks.registry, bridge_locks.hold_many(b.id for b in bridges):
+        for data in exported:
+            db.import_history(data["id"], data.get("history", {}))
+        db.save_bridges(bridges)
+        for bridge in bridges:
+            active_bridges[bridge.id] = bridge
+    
+    for data in exported:
+        if data.get("autotick"):
+            registration = data["autotick"]
+            auto_ticker.register(data["id"], rate=registration["rate"], bridge_class=registration["class"])
+            db.save_autotick(data["id"], registration["rate"], registration["class"])
+    return jsonify({"imported": len(bridges)})
+
+
+@app.route('/api/shard/release', methods=['POST'])
+def shard_release():
+    """Forget bridges that now live on another worker"""
+    ids = (request.get_json() or {}).get('ids', [])
+    with bridge_locks.registry, bridge_locks.hold_many(ids):
+        for bridge_id in ids:
+            auto_ticker.unregister(bridge_id)
+            persistence.discard(bridge_id)
+            active_bridges.pop(bridge_id)
+        db.delete_autotick(ids)
+        released = db.purge_bridges(ids)
+    return jsonify({"released": released})
+
+
 @app.route('/api/stats', methods=['GET'])
 def system_stats():
     """Get system statistics"""
-    # Database stats
+    # Read from the trigger-maintained stats table (constant cost); changes
+    # still waiting in the write-behind layer show up after the next flush
     db_stats = db.get_stats()
     
-    # Calculate totals from active bridges
-    total_ticks = sum(b.internal_clock.ticks for b in active_bridges.values())
-    avg_ticks = total_ticks / len(active_bridges) if active_bridges else 0
-    
-    # Stage distribution
-    stages = {}
-    for bridge in active_bridges.values():
-        stage = bridge.maturity_stage
-        stages[stage] = stages.get(stage, 0) + 1
+    count = db_stats["active_bridges"]
+    total_ticks = db_stats.pop("total_ticks")
+    avg_ticks = total_ticks / count if count else 0
     
     return jsonify({
         "system": "Conscious Bridge Reloaded",
         "timestamp": datetime.now().isoformat(),
         "statistics": {
             **db_stats,
-            "active_bridges_count": len(active_bridges),
+            "active_bridges_count": count,
+            "hydrated_bridges_count": len(active_bridges),
             "total_consciousness_ticks": total_ticks,
             "average_ticks_per_bridge": round(avg_ticks, 2),
-            "maturity_distribution_active": stages
+            "pending_writes": persistence.pending(),
+            "maturity_distribution_active": db_stats["maturity_distribution"]
         },
         "philosophical_note": "Each tick represents a moment of lived experience, not just a unit of time"
     })
@@ -669,7 +1650,11 @@ def health_check():
         "components": {
             "flask": "running",
             "database": "connected",
-            "active_bridges": len(active_bridges),
+            "persistence": persistence.get_stats(),
+            "active_bridges": db.count_bridges(),
+            "bridge_cache": active_bridges.get_stats(),
+            "events": event_hub.get_stats(),
+            "autotick": auto_ticker.get_stats(),
             "api_version": "2.1.0",
             "philosophy": "internal_time_active"
         }
@@ -678,14 +1663,17 @@ def health_check():
 
 # ================ MAIN ================
 
+HOST = os.environ.get("BRIDGE_HOST", "0.0.0.0")
+PORT = int(os.environ.get("BRIDGE_PORT", "5000"))
+
 if __name__ == '__main__':
     print("\n" + "="*60)
     print("🌉 CONSCIOUS BRIDGE RELOADED - API SERVER")
     print("="*60)
     print("Philosophy: Internal time > External time")
-    print(f"Active Bridges: {len(active_bridges)}")
-    print(f"Database: conscious_bridges_reloaded.db")
-    print(f"API Port: 5000")
+    print(f"Active Bridges: {db.count_bridges()}")
+    print(f"Database: {DB_PATH}")
+    print(f"API Port: {PORT}")
     print("\n📚 Available Endpoints:")
     print("  GET  /                    - API documentation")
     print("  GET  /api/bridges         - List all bridges")
@@ -694,10 +1682,10 @@ if __name__ == '__main__':
     print("  GET  /api/stats           - System statistics")
     print("  GET  /api/health          - Health check")
     print("\n🚀 Starting server...")
-    print(f"👉 Access at: http://localhost:5000")
+    print(f"👉 Access at: http://localhost:{PORT}")
     print("="*60 + "\n")
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host=HOST, port=PORT, debug=DEBUG, threaded=True)
 # ========== EVOLUTION API ENDPOINTS (v2.1.0) ==========
 @app.route('/api/evolution/status', methods=['GET'])
 def evolution_status():
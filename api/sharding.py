@@ -0,0 +1,767 @@
+"""
+Sharded deployment of the API server
+
+Each worker process runs api.server with its own database and owns the
+bridges whose ids hash to it on a consistent-hash ring. A thin router
+(a WSGI application) forwards bridge requests to the owning worker over
+loopback HTTP, fans fleet-wide requests (listing, stats, events) out to
+every worker and merges the answers, and moves bridges between workers
+when workers join or leave.
+
+Run N local workers behind a router:
+    python -m api.sharding --workers 4 --port 5000
+
+Workers on other hosts (e.g. other replicas) can be added with --worker
+host:port, or at runtime with POST /shards/workers {"address": ...}.
+"""
+
+import argparse
+import bisect
+import hashlib
+import http.client
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from socketserver import ThreadingMixIn
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+from wsgiref.simple_server import WSGIServer, make_server
+
+from api.batch import batch_entry_error
+from api.ingest import MAX_REPORTED_ERRORS, iter_ndjson_chunks
+from api.pagination import encode_cursor, parse_list_query
+
+
+# Response headers that must not be passed through a proxy
+HOP_BY_HOP = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailers", "transfer-encoding", "upgrade", "content-length"
+}
+
+# Request headers forwarded to workers
+FORWARDED_HEADERS = ("Content-Type", "Accept", "If-None-Match", "Last-Event-ID")
+
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+# ================ CONSISTENT HASHING ================
+
+class HashRing:
+    """
+    Consistent-hash ring with virtual nodes
+
+    Adding or removing one of N nodes moves only about 1/N of the keys.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 100):
+        self.replicas = replicas
+        self.nodes: List[str] = []
+        self._points: List[int] = []
+        self._owners: Dict[int, str] = {}
+
+        for node in nodes:
+            self.add(node)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+    def add(self, node: str):
+        """Add a node (no-op if present)"""
+        if node in self.nodes:
+            return
+        self.nodes.append(node)
+        for replica in range(self.replicas):
+            point = self._hash(f"{node}#{replica}")
+            self._owners[point] = node
+            bisect.insort(self._points, point)
+
+    def remove(self, node: str):
+        """Remove a node (no-op if absent)"""
+        if node not in self.nodes:
+            return
+        self.nodes.remove(node)
+        self._points = [p for p in self._points if self._owners[p] != node]
+        self._owners = {p: self._owners[p] for p in self._points}
+
+    def node_for(self, key: str) -> str:
+        """The node owning a key"""
+        if not self._points:
+            raise LookupError("No workers in the ring")
+        index = bisect.bisect(self._points, self._hash(str(key))) % len(self._points)
+        return self._owners[self._points[index]]
+
+    def copy(self) -> 'HashRing':
+        return HashRing(self.nodes, self.replicas)
+
+    def __contains__(self, node) -> bool:
+        return node in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+
+# ================ WORKER CONNECTIONS ================
+
+class WorkerPool:
+    """Keep-alive HTTP connections to workers, one per (thread, worker)"""
+
+    def __init__(self, timeout: float = 30.0):
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self, address: str) -> http.client.HTTPConnection:
+        connections = self._local.__dict__.setdefault("connections", {})
+        connection = connections.get(address)
+        if connection is None:
+            host, port = address.rsplit(":", 1)
+            connection = http.client.HTTPConnection(host, int(port), timeout=self.timeout)
+            connections[address] = connection
+        return connection
+
+    def _drop(self, address: str):
+        connection = self._local.__dict__.get("connections", {}).pop(address, None)
+        if connection is not None:
+            connection.close()
+
+    def request(
+        self,
+        address: str,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        """Send a request; a stale keep-alive connection is retried once"""
+        for attempt in (1, 2):
+            connection = self._connection(address)
+            try:
+                connection.request(method, path, body=body, headers=headers or {})
+                response = connection.getresponse()
+                return response.status, response.getheaders(), response.read()
+            except (http.client.HTTPException, ConnectionError):
+                self._drop(address)
+                if attempt == 2:
+                    raise
+            except OSError:
+                self._drop(address)
+                raise
+
+    def request_json(self, address: str, method: str, path: str, payload=None) -> Tuple[int, Dict]:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        status, _, data = self.request(address, method, path, body, headers)
+        return status, json.loads(data) if data else {}
+
+    def stream(self, address: str, path: str, headers: Optional[Dict[str, str]] = None) -> http.client.HTTPResponse:
+        """Open a dedicated (unpooled) connection for a streaming response"""
+        host, port = address.rsplit(":", 1)
+        connection = http.client.HTTPConnection(host, int(port), timeout=None)
+        connection.request("GET", path, headers=headers or {})
+        return connection.getresponse()
+
+
+class _RebalanceGate:
+    """Requests pass concurrently; a rebalance waits for them and holds new ones"""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._active = 0
+        self._exclusive = False
+
+    @contextmanager
+    def shared(self):
+        with self._condition:
+            while self._exclusive:
+                self._condition.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                if self._active == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        with self._condition:
+            while self._exclusive:
+                self._condition.wait()
+            self._exclusive = True
+            while self._active:
+                self._condition.wait()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._exclusive = False
+                self._condition.notify_all()
+
+
+# ================ ROUTER ================
+
+class ShardRouter:
+    """
+    WSGI router in front of sharded API workers
+
+    Args:
+        workers: Worker addresses ("host:port")
+        replicas: Virtual nodes per worker on the ring
+        chunk_size: Lines per forwarded batch for NDJSON streams
+    """
+
+    def __init__(self, workers: Iterable[str] = (), replicas: int = 100, chunk_size: int = 1000):
+        self.ring = HashRing(workers, replicas)
+        self.pool = WorkerPool()
+        self.chunk_size = chunk_size
+        self._gate = _RebalanceGate()
+        self._executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="shard-router")
+
+        self.stats = {"forwarded": 0, "fanned_out": 0, "rebalances": 0, "bridges_moved": 0, "errors": 0}
+
+    # ---------- WSGI ----------
+
+    def __call__(self, environ, start_response):
+        method = environ["REQUEST_METHOD"]
+        path = environ.get("PATH_INFO", "") or "/"
+        query = environ.get("QUERY_STRING", "")
+
+        try:
+            if path == "/shards" or path.startswith("/shards/"):
+                status, headers, body = self._admin(method, path, environ)
+            elif method == "GET" and path == "/api/events":
+                status, headers, body = self._fleet_events()
+            elif method == "GET" and path.startswith("/api/bridges/") and path.endswith("/events"):
+                with self._gate.shared():
+                    owner = self.ring.node_for(path.split("/")[3])
+                status, headers, body = self._proxy_stream(owner, path, query, environ)
+            else:
+                with self._gate.shared():
+                    status, headers, body = self._dispatch(method, path, query, environ)
+        except LookupError as e:
+            status, headers, body = _json_response(503, {"error": str(e)})
+        except (OSError, http.client.HTTPException) as e:
+            self.stats["errors"] += 1
+            status, headers, body = _json_response(502, {"error": f"Worker unavailable: {e}"})
+
+        start_response(_status_line(status), headers)
+        return body
+
+    def _dispatch(self, method: str, path: str, query: str, environ) -> Tuple[int, List, Iterable[bytes]]:
+        parts = path.strip("/").split("/")
+
+        if path == "/api/bridges/tick:batch" and method == "POST":
+            return self._tick_batch(_read_body(environ))
+        if path == "/api/experiences:stream" and method == "POST":
+            return self._stream_experiences(environ)
+        if len(parts) == 4 and parts[:2] == ["api", "bridges"] and parts[3] == "experiences:stream" and method == "POST":
+            return self._stream_experiences(environ, bridge_id=parts[2], query=query)
+        if path == "/api/bridges" and method == "GET":
+            return self._list_bridges(query)
+        if path == "/api/bridges" and method == "POST":
+            # The router picks the id so the bridge is created on its owner
+            bridge_id = str(uuid.uuid4())
+            return self._forward(self.ring.node_for(bridge_id), method, path, query, environ,
+                                 extra_headers={"X-Bridge-Id": bridge_id})
+        if path == "/api/stats" and method == "GET":
+            return self._stats()
+        if path == "/api/health" and method == "GET":
+            return self._health()
+        if len(parts) >= 3 and parts[:2] == ["api", "bridges"]:
+            return self._forward(self.ring.node_for(parts[2]), method, path, query, environ)
+
+        # Documentation, API info and other stateless endpoints
+        if not self.ring.nodes:
+            raise LookupError("No workers in the ring")
+        return self._forward(self.ring.nodes[0], method, path, query, environ)
+
+    # ---------- Forwarding ----------
+
+    def _forward(self, address, method, path, query, environ, body=None, extra_headers=None):
+        if body is None:
+            body = _read_body(environ)
+        headers = _request_headers(environ)
+        headers.update(extra_headers or {})
+
+        status, response_headers, data = self.pool.request(
+            address, method, path + ("?" + query if query else ""), body or None, headers
+        )
+        self.stats["forwarded"] += 1
+        headers = [(k, v) for k, v in response_headers if k.lower() not in HOP_BY_HOP]
+        headers.append(("Content-Length", str(len(data))))
+        return status, headers, [data]
+
+    def _fan_out(self, method: str, path: str, payloads: Optional[Dict[str, object]] = None) -> Dict[str, Tuple[int, Dict]]:
+        """Send one JSON request per worker in parallel"""
+        targets = list(payloads) if payloads is not None else list(self.ring.nodes)
+        futures = {
+            address: self._executor.submit(
+                self.pool.request_json, address, method, path,
+                payloads[address] if payloads is not None else None
+            )
+            for address in targets
+        }
+        self.stats["fanned_out"] += 1
+        return {address: future.result() for address, future in futures.items()}
+
+    def _proxy_stream(self, address, path, query, environ):
+        response = self.pool.stream(address, path + ("?" + query if query else ""), _request_headers(environ))
+        headers = [(k, v) for k, v in response.getheaders() if k.lower() not in HOP_BY_HOP]
+
+        def body():
+            try:
+                while True:
+                    line = response.readline()
+                    if not line:
+                        break
+                    yield line
+            finally:
+                response.close()
+
+        return response.status, headers, body()
+
+    # ---------- Fleet-wide requests ----------
+
+    def _tick_batch(self, raw: bytes):
+        try:
+            data = json.loads(raw or b"{}")
+        except ValueError:
+            return _json_response(400, {"error": "Invalid JSON body"})
+
+        entries = data.get("entries", []) if isinstance(data, dict) else data
+        parallel = isinstance(data, dict) and data.get("parallel", False)
+        if not isinstance(entries, list) or not entries:
+            return _json_response(400, {"error": "A non-empty list of entries is required"})
+
+        # Validate the whole batch before any worker advances a bridge
+        for index, entry in enumerate(entries):
+            error = batch_entry_error(entry)
+            if error:
+                return _json_response(400, {"error": error, "index": index})
+
+        # Split by owner, remembering each entry's position
+        positions: Dict[str, List[int]] = {}
+        payloads: Dict[str, Dict] = {}
+        for index, entry in enumerate(entries):
+            owner = self.ring.node_for(entry["bridge_id"])
+            positions.setdefault(owner, []).append(index)
+            payloads.setdefault(owner, {"entries": [], "parallel": parallel})["entries"].append(entry)
+
+        results: List[Optional[Dict]] = [None] * len(entries)
+        for owner, (status, body) in self._fan_out("POST", "/api/bridges/tick:batch", payloads).items():
+            if status != 200:
+                # Entry indexes in a worker's answer point into its sub-batch
+                index = body.get("index") if isinstance(body, dict) else None
+                if isinstance(index, int) and 0 <= index < len(positions[owner]):
+                    body = {**body, "index": positions[owner][index]}
+                return _json_response(status, body)
+            for index, result in zip(positions[owner], body["results"]):
+                results[index] = result
+
+        advanced = {r["bridge_id"] for r in results if "error" not in r}
+        return _json_response(200, {
+            "message": f"Advanced {len(advanced)} bridges",
+            "total_ticks": sum(r.get("ticks_delta", 0) for r in results),
+            "results": results
+        })
+
+    def _stream_experiences(self, environ, bridge_id: Optional[str] = None, query: str = ""):
+        """
+        Forward an NDJSON upload chunk by chunk (router memory stays flat)
+
+        Lines go to their bridge's owner, or all to the owner of bridge_id
+        for the per-bridge endpoint; the workers' summaries are merged.
+        """
+        if bridge_id is None:
+            path = "/api/experiences:stream"
+        else:
+            path = f"/api/bridges/{bridge_id}/experiences:stream" + ("?" + query if query else "")
+            owner = self.ring.node_for(bridge_id)
+
+        summary = {"accepted": 0, "rejected": 0, "insights": 0, "chunks": 0, "bridges": 0}
+        errors: List[Dict] = []
+
+        for chunk in iter_ndjson_chunks(_iter_body_lines(environ), self.chunk_size):
+            chunk_errors: List[Dict] = []
+            lines: Dict[str, List[bytes]] = {}
+            line_numbers: Dict[str, List[int]] = {}
+            for line_number, record in chunk:
+                if "__error__" in record:
+                    summary["rejected"] += 1
+                    chunk_errors.append({"line": line_number, "error": record["__error__"]})
+                    continue
+                if bridge_id is None:
+                    owner = self.ring.node_for(str(record.get("bridge_id")))
+                lines.setdefault(owner, []).append(json.dumps(record).encode("utf-8"))
+                line_numbers.setdefault(owner, []).append(line_number)
+
+            futures = {
+                owner: self._executor.submit(
+                    self.pool.request, owner, "POST", path,
+                    b"\n".join(owner_lines), {"Content-Type": "application/x-ndjson"}
+                )
+                for owner, owner_lines in lines.items()
+            }
+            for owner, future in futures.items():
+                status, _, data = future.result()
+                body = json.loads(data)
+                if status != 200:
+                    return _json_response(status, body)
+                for name in ("accepted", "rejected", "insights", "bridges"):
+                    summary[name] += body[name]
+                for error in body["errors"]:
+                    chunk_errors.append({**error, "line": line_numbers[owner][error["line"] - 1]})
+            summary["chunks"] += 1
+
+            # Chunks arrive in line order; past the cap rejections are only counted
+            if len(errors) < MAX_REPORTED_ERRORS:
+                chunk_errors.sort(key=lambda e: e["line"])
+                errors.extend(chunk_errors[:MAX_REPORTED_ERRORS - len(errors)])
+
+        if bridge_id is not None and not summary["chunks"]:
+            # Nothing to forward: the owner still answers (e.g. 404 for an unknown bridge)
+            return self._forward(owner, "POST", path.partition("?")[0], query, environ, body=b"")
+
+        # Bridges touched in several chunks are counted once per chunk
+        return _json_response(200, {**summary, "errors": errors})
+
+    def _list_bridges(self, query: str):
+        args = dict(parse_qsl(query))
+        try:
+            list_query = parse_list_query(args)
+        except ValueError as e:
+            return _json_response(400, {"error": str(e)})
+
+        sort = list_query.sort
+        worker_args = dict(args)
+        if "fields" in args and sort not in list_query.fields:
+            worker_args["fields"] = ",".join(list_query.fields + [sort])
+
+        # Keyset cursors are global: every worker pages from the same key
+        path = "/api/bridges?" + urlencode(worker_args)
+        responses = self._fan_out("GET", path)
+
+        bridges: List[Dict] = []
+        more = False
+        for status, body in responses.values():
+            if status != 200:
+                return _json_response(status, body)
+            bridges.extend(body["bridges"])
+            more = more or body.get("next_cursor") is not None
+
+        bridges.sort(key=lambda b: (b[sort], b["id"]), reverse=list_query.descending)
+        more = more or len(bridges) > list_query.limit
+        page = bridges[:list_query.limit]
+        next_cursor = encode_cursor(page[-1][sort], page[-1]["id"]) if more and page else None
+
+        if sort not in list_query.fields:
+            for bridge in page:
+                bridge.pop(sort, None)
+
+        return _json_response(200, {"count": len(page), "bridges": page, "next_cursor": next_cursor})
+
+    def _stats(self):
+        responses = self._fan_out("GET", "/api/stats")
+        parts = []
+        for status, body in responses.values():
+            if status != 200:
+                return _json_response(status, body)
+            parts.append(body)
+
+        merged = merge_statistics([part.get("statistics", {}) for part in parts])
+        base = parts[0] if parts else {}
+        return _json_response(200, {**base, "statistics": merged, "shards": len(parts)})
+
+    def _health(self):
+        workers = {}
+        for address in list(self.ring.nodes):
+            try:
+                status, body = self.pool.request_json(address, "GET", "/api/health")
+                workers[address] = body.get("status", "unknown") if status == 200 else f"http {status}"
+            except (OSError, http.client.HTTPException) as e:
+                workers[address] = f"unreachable: {e}"
+
+        healthy = workers and all(state == "healthy" for state in workers.values())
+        return _json_response(200 if healthy else 503, {
+            "status": "healthy" if healthy else "degraded",
+            "router": self.get_stats(),
+            "workers": workers
+        })
+
+    def _fleet_events(self):
+        """Merge the SSE streams of all workers into one"""
+        events: "queue.Queue[bytes]" = queue.Queue(maxsize=1000)
+        responses = []
+        stop = threading.Event()
+        dropped = {"count": 0}
+
+        def pump(response):
+            block = b""
+            try:
+                while not stop.is_set():
+                    line = response.readline()
+                    if not line:
+                        break
+                    if line.strip():
+                        # Worker event ids are not unique across shards
+                        if not line.startswith((b"id:", b"retry:", b":")):
+                            block += line
+                        continue
+                    if block:
+                        try:
+                            events.put_nowait(block + b"\n")
+                        except queue.Full:
+                            dropped["count"] += 1
+                        block = b""
+            except (OSError, ValueError, http.client.HTTPException):
+                pass
+
+        with self._gate.shared():
+            addresses = list(self.ring.nodes)
+        for address in addresses:
+            response = self.pool.stream(address, "/api/events")
+            responses.append(response)
+            threading.Thread(target=pump, args=(response,), daemon=True).start()
+
+        def body():
+            try:
+                yield b"retry: 3000\n\n"
+                while True:
+                    try:
+                        yield events.get(timeout=SSE_KEEPALIVE_SECONDS)
+                    except queue.Empty:
+                        yield b": keepalive\n\n"
+                    if dropped["count"]:
+                        count, dropped["count"] = dropped["count"], 0
+                        yield f"event: dropped\ndata: {json.dumps({'count': count})}\n\n".encode("utf-8")
+            finally:
+                stop.set()
+                for response in responses:
+                    response.close()
+
+        return 200, [("Content-Type", "text/event-stream"), ("Cache-Control", "no-cache")], body()
+
+    # ---------- Membership and rebalancing ----------
+
+    def _admin(self, method: str, path: str, environ):
+        if path == "/shards" and method == "GET":
+            return _json_response(200, {"workers": list(self.ring.nodes), "stats": self.get_stats()})
+
+        if path == "/shards/workers" and method == "POST":
+            try:
+                address = json.loads(_read_body(environ) or b"{}")["address"]
+            except (ValueError, KeyError, TypeError):
+                return _json_response(400, {"error": "Worker address is required"})
+            moved = self.add_worker(address)
+            return _json_response(200, {"workers": list(self.ring.nodes), "moved": moved})
+
+        if path.startswith("/shards/workers/") and method == "DELETE":
+            address = path[len("/shards/workers/"):]
+            if address not in self.ring:
+                return _json_response(404, {"error": "Unknown worker"})
+            moved = self.remove_worker(address)
+            return _json_response(200, {"workers": list(self.ring.nodes), "moved": moved})
+
+        return _json_response(404, {"error": "Not found"})
+
+    def add_worker(self, address: str) -> int:
+        """Add a worker and move the bridges it now owns; returns how many moved"""
+        with self._gate.exclusive():
+            ring = self.ring.copy()
+            ring.add(address)
+            return self._rebalance(ring)
+
+    def remove_worker(self, address: str) -> int:
+        """Drain a (reachable) worker into the rest of the ring and remove it"""
+        with self._gate.exclusive():
+            ring = self.ring.copy()
+            ring.remove(address)
+            if not ring.nodes:
+                raise LookupError("Cannot remove the last worker")
+            return self._rebalance(ring)
+
+    def _rebalance(self, ring: HashRing) -> int:
+        """Move every bridge whose owner differs on the new ring (under the exclusive gate)"""
+        moved = 0
+        for source in list(self.ring.nodes):
+            status, body = self.pool.request_json(source, "GET", "/api/shard/bridges")
+            if status != 200:
+                raise OSError(f"Cannot list bridges on {source}")
+
+            moves: Dict[str, List[str]] = {}
+            for bridge_id in body["ids"]:
+                target = ring.node_for(bridge_id)
+                if target != source:
+                    moves.setdefault(target, []).append(bridge_id)
+
+            for target, ids in moves.items():
+                # Copy, then release on the source only after the target has it
+                status, exported = self.pool.request_json(source, "POST", "/api/shard/export", {"ids": ids})
+                if status != 200:
+                    raise OSError(f"Export from {source} failed")
+                status, _ = self.pool.request_json(target, "POST", "/api/shard/import", exported)
+                if status != 200:
+                    raise OSError(f"Import into {target} failed")
+                status, _ = self.pool.request_json(source, "POST", "/api/shard/release", {"ids": ids})
+                if status != 200:
+                    raise OSError(f"Release on {source} failed")
+                moved += len(ids)
+
+        self.ring = ring
+        self.stats["rebalances"] += 1
+        self.stats["bridges_moved"] += moved
+        return moved
+
+    def get_stats(self) -> Dict:
+        """Get router statistics"""
+        return {**self.stats, "workers": len(self.ring)}
+
+
+def merge_statistics(parts: List[Dict]) -> Dict:
+    """Combine the /api/stats "statistics" objects of several shards"""
+    merged: Dict = {}
+    for part in parts:
+        for name, value in part.items():
+            if isinstance(value, dict):
+                target = merged.setdefault(name, {})
+                for key, count in value.items():
+                    target[key] = target.get(key, 0) + count
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                merged[name] = merged.get(name, 0) + value
+
+    # Averages are recomputed from the merged totals
+    active = merged.get("active_bridges", 0)
+    if "average_consciousness" in merged:
+        weighted = sum(p.get("average_consciousness", 0) * p.get("active_bridges", 0) for p in parts)
+        merged["average_consciousness"] = round(weighted / active, 3) if active else 0.0
+    if "average_ticks_per_bridge" in merged:
+        count = merged.get("active_bridges_count", 0)
+        total = merged.get("total_consciousness_ticks", 0)
+        merged["average_ticks_per_bridge"] = round(total / count, 2) if count else 0
+    return merged
+
+
+# ================ WSGI HELPERS ================
+
+def _status_line(status: int) -> str:
+    return f"{status} {http.client.responses.get(status, '')}".strip()
+
+
+def _json_response(status: int, payload) -> Tuple[int, List, List[bytes]]:
+    data = json.dumps(payload).encode("utf-8")
+    return status, [("Content-Type", "application/json"), ("Content-Length", str(len(data)))], [data]
+
+
+def _request_headers(environ) -> Dict[str, str]:
+    headers = {}
+    for name in FORWARDED_HEADERS:
+        key = "CONTENT_TYPE" if name == "Content-Type" else "HTTP_" + name.upper().replace("-", "_")
+        if environ.get(key):
+            headers[name] = environ[key]
+    return headers
+
+
+def _read_body(environ) -> bytes:
+    try:
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        length = 0
+    return environ["wsgi.input"].read(length) if length > 0 else b""
+
+
+def _iter_body_lines(environ) -> Iterator[bytes]:
+    """Read the request body line by line without loading it whole"""
+    try:
+        remaining = int(environ.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        remaining = 0
+    stream = environ["wsgi.input"]
+    while remaining > 0:
+        line = stream.readline(min(remaining, 1 << 16))
+        if not line:
+            break
+        remaining -= len(line)
+        yield line
+
+
+# ================ LAUNCHER ================
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+def serve_router(router: ShardRouter, host: str = "0.0.0.0", port: int = 5000) -> ThreadingWSGIServer:
+    """Create a threaded HTTP server for the router (call serve_forever() on it)"""
+    return make_server(host, port, router, server_class=ThreadingWSGIServer)
+
+
+def start_workers(count: int, base_port: int = 5100, host: str = "127.0.0.1", db_dir: str = ".") -> Dict[str, subprocess.Popen]:
+    """Start count api.server worker processes on consecutive loopback ports"""
+    processes = {}
+    for shard in range(count):
+        port = base_port + shard
+        env = dict(
+            os.environ,
+            BRIDGE_HOST=host,
+            BRIDGE_PORT=str(port),
+            BRIDGE_DEBUG="0",
+            BRIDGE_SHARD_ID=str(shard),
+            BRIDGE_DB_PATH=os.path.join(db_dir, f"conscious_bridges_shard_{shard}.db")
+        )
+        processes[f"{host}:{port}"] = subprocess.Popen([sys.executable, "-m", "api.server"], env=env)
+    return processes
+
+
+def wait_for_worker(address: str, timeout: float = 30.0):
+    """Block until a worker answers its health check"""
+    deadline = time.monotonic() + timeout
+    pool = WorkerPool(timeout=2.0)
+    while True:
+        try:
+            if pool.request_json(address, "GET", "/api/health")[0] == 200:
+                return
+        except (OSError, http.client.HTTPException, ValueError):
+            pass
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Worker {address} did not start")
+        time.sleep(0.2)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run sharded API workers behind a router")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Local worker processes")
+    parser.add_argument("--worker", action="append", default=[], help="Additional worker address host:port")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--worker-port-base", type=int, default=5100)
+    parser.add_argument("--db-dir", default=".")
+    args = parser.parse_args(argv)
+
+    processes = start_workers(args.workers, args.worker_port_base, db_dir=args.db_dir)
+    try:
+        for address in processes:
+            wait_for_worker(address)
+
+        router = ShardRouter(list(processes) + args.worker)
+        server = serve_router(router, args.host, args.port)
+        print(f"🔀 Routing {len(router.ring)} workers on http://{args.host}:{args.port}")
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes.values():
+            process.terminate()
+        for process in processes.values():
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Write-behind persistence for the API server
+
+Mutated bridges are marked dirty and saved in batched transactions by a
+background flusher, instead of one save (and one commit) per request.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class WriteBehindPersistence:
+    """
+    Dirty-set write-behind layer with group commit
+
+    Durability modes:
+    - "immediate": save on every mark_dirty() (one transaction per change)
+    - "batched":   background flush every flush_interval seconds, or as
+                   soon as max_batch bridges are dirty
+    - "deferred":  only flush on flush() / close()
+
+    Marking a bridge dirty several times between flushes costs a single
+    save, so a bridge ticked 100 times is serialized once.
+
+    Until a pending bridge is committed, get_pending() returns it, so a
+    cache that evicted it can re-hydrate the live object instead of the
+    stale database row.
+    """
+
+    DURABILITY_MODES = ("immediate", "batched", "deferred")
+
+    def __init__(
+        self,
+        save_many: Callable[[List], None],
+        flush_interval: float = 1.0,
+        max_batch: int = 500,
+        durability: str = "batched"
+    ):
+        """
+        Args:
+            save_many: Saves a list of bridges in one transaction
+            flush_interval: Seconds between background flushes
+            max_batch: Dirty-set size that triggers an early flush
+            durability: One of DURABILITY_MODES
+        """
+        if durability not in self.DURABILITY_MODES:
+            raise ValueError(f"Invalid durability mode: {durability}")
+
+        self.save_many = save_many
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.durability = durability
+
+        self._dirty: Dict[str, object] = {}
+        self._in_flight: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.stats = {
+            "marked": 0,
+            "flushes": 0,
+            "bridges_saved": 0,
+            "last_flush_seconds": 0.0,
+            "errors": 0
+        }
+
+        if durability == "batched":
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._thread.start()
+
+    def mark_dirty(self, bridge):
+        """Schedule a bridge to be saved"""
+        self.mark_dirty_many([bridge])
+
+    def mark_dirty_many(self, bridges):
+        """Schedule several bridges to be saved (one transaction in immediate mode)"""
+        if self.durability == "immediate":
+            # Save just these bridges: callers may hold their locks, so this
+            # must not wait for (or take part in) a flush of other bridges
+            bridges = list(bridges)
+            with self._lock:
+                self.stats["marked"] += len(bridges)
+            self.save_many(bridges)
+            with self._lock:
+                self.stats["bridges_saved"] += len(bridges)
+            return
+
+        with self._lock:
+            for bridge in bridges:
+                self._dirty[bridge.id] = bridge
+                self.stats["marked"] += 1
+            pending = len(self._dirty)
+
+        if self.durability == "batched" and pending >= self.max_batch:
+            self._wakeup.set()
+
+    def discard(self, bridge_id: str):
+        """Forget a pending save (e.g. the bridge was deleted)"""
+        with self._lock:
+            self._dirty.pop(bridge_id, None)
+
+    def get_pending(self, bridge_id: str):
+        """The bridge object waiting to be saved (or being saved), if any"""
+        with self._lock:
+            return self._dirty.get(bridge_id) or self._in_flight.get(bridge_id)
+
+    def pending_bridges(self) -> List:
+        """Bridges waiting to be saved or being saved (their rows may be stale)"""
+        with self._lock:
+            return list({**self._in_flight, **self._dirty}.values())
+
+    def pending(self) -> int:
+        """Number of bridges waiting to be saved"""
+        with self._lock:
+            return len(self._dirty)
+
+    def flush(self) -> int:
+        """Save all dirty bridges in one batch; returns how many were saved"""
+        with self._flush_lock:
+            with self._lock:
+                self._in_flight = self._dirty
+                self._dirty = {}
+                batch = list(self._in_flight.values())
+
+            if not batch:
+                return 0
+
+            started = time.monotonic()
+            try:
+                self.save_many(batch)
+            except Exception:
+                # Put them back unless they were marked again meanwhile
+                with self._lock:
+                    for bridge in batch:
+                        self._dirty.setdefault(bridge.id, bridge)
+                self.stats["errors"] += 1
+                raise
+            finally:
+                with self._lock:
+                    self._in_flight = {}
+
+            self.stats["flushes"] += 1
+            self.stats["bridges_saved"] += len(batch)
+            self.stats["last_flush_seconds"] = round(time.monotonic() - started, 6)
+            return len(batch)
+
+    def _run(self):
+        """Background flusher loop"""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass  # Counted in stats, retried on the next round
+
+    def close(self):
+        """Stop the flusher and write everything still pending"""
+        self._closed = True
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=max(1.0, self.flush_interval * 2))
+        self.flush()
+
+    def get_stats(self) -> Dict:
+        """Get persistence statistics"""
+        return {
+            **self.stats,
+            "durability": self.durability,
+            "pending": self.pending(),
+            "flush_interval": self.flush_interval,
+            "max_batch": self.max_batch
+        }
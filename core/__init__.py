@@ -9,6 +9,7 @@ from .personality_core import PersonalityCore, PersonalityTraits
 from .maturity_system import MaturitySystem, MaturityStage
 from .bridge_reloaded import ConsciousBridgeReloaded, BridgeMetadata
 from .consciousness_engine import ConsciousnessEngine
+from .events import EventHub
 
 __all__ = [
     'InternalClock',
@@ -21,7 +22,8 @@ __all__ = [
     'MaturityStage',
     'ConsciousBridgeReloaded',
     'BridgeMetadata',
-    'ConsciousnessEngine'
+    'ConsciousnessEngine',
+    'EventHub'
 ]
 
 __version__ = '2.1.0'
\ No newline at end of file
@@ -7,12 +7,15 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import uuid
 import json
+import math
 
 from .internal_clock import InternalClock
 from .experience_processor import ExperienceProcessor, Experience, ExperienceType
 from .personality_core import PersonalityCore, PersonalityTraits
 from .maturity_system import MaturitySystem, MaturityStage
 from .consciousness_engine import ConsciousnessEngine
+from . import events as bridge_events
+from . import snapshot
 
 
 @dataclass
@@ -37,13 +40,18 @@ class ConsciousBridgeReloaded:
     - Maturation through stages
     """
     
+    # Connection updates between exact recomputations of the strength total
+    CONNECTION_TOTAL_RESYNC = 1000
+    
     def __init__(
         self,
         bridge_id: Optional[str] = None,
         name: str = "Unnamed Bridge",
         bridge_type: str = "conscious",
         description: str = "",
-        seed_personality: Optional[PersonalityTraits] = None
+        seed_personality: Optional[PersonalityTraits] = None,
+        scheduler=None,
+        time_source=None
     ):
         # Unique identifier
         self.id = bridge_id or f"bridge_{uuid.uuid4().hex[:8]}"
@@ -57,7 +65,9 @@ class ConsciousBridgeReloaded:
         )
         
         # Core systems
-        self.clock = InternalClock()
+        # The clock pulses on a shared scheduler if given (a VirtualClock
+        # time source makes it deterministic), else on its own thread
+        self.clock = InternalClock(self.id, name, scheduler=scheduler, time_source=time_source)
         self.experience_processor = ExperienceProcessor()
         self.personality = PersonalityCore(seed_traits=seed_personality)
         self.maturity = MaturitySystem(self.clock)
@@ -80,6 +90,16 @@ class ConsciousBridgeReloaded:
         
         # Connections to other bridges
         self.connections: Dict[str, Dict] = {}
+        self.connection_strength_total: float = 0.0
+        self._connection_updates = 0
+        
+        # Row in a BridgePopulation while ticked in bulk
+        self.population = None
+        self.population_row: Optional[int] = None
+        
+        # Live event hub (events are only built while someone subscribes)
+        self.events: Optional[bridge_events.EventHub] = None
+        self.maturity.add_transition_callback(self._on_transition)
         
     def tick(self, depth: float = 1.0):
         """
@@ -87,6 +107,54 @@ class ConsciousBridgeReloaded:
         
         This is the fundamental unit of growth
         """
+        before = self.state["consciousness_level"]
+        self._advance_one(depth)
+        
+        # Update consciousness level
+        self.state["consciousness_level"] = self.consciousness_engine.calculate_consciousness(self)
+        self._publish_tick(1, before)
+    
+    def advance(self, n_ticks: int, depth: float = 1.0):
+        """
+        Fast-forward the bridge by many ticks in one call
+        
+        Equivalent to calling tick() n_ticks times, but only the ticks
+        where something can change are fully processed: ticks with queued
+        experiences, the 100/500-tick personality boundaries and maturity
+        thresholds. Consciousness is calculated once at the end.
+        
+        Args:
+            n_ticks: Number of ticks to advance
+            depth: Experience depth passed to every clock tick
+        """
+        if n_ticks <= 0:
+            return
+        
+        target = self.clock.ticks + n_ticks
+        before = self.state["consciousness_level"]
+        
+        while self.clock.ticks < target:
+            if not self.experience_processor.processing_queue:
+                # Nothing queued: skip straight to the next tick that matters
+                next_tick = min(
+                    target,
+                    self._next_boundary(100),
+                    self.maturity._get_next_threshold()
+                )
+                self.clock.advance_ticks(next_tick - 1 - self.clock.ticks, depth)
+            
+            self._advance_one(depth)
+        
+        # Update consciousness level
+        self.state["consciousness_level"] = self.consciousness_engine.calculate_consciousness(self)
+        self._publish_tick(n_ticks, before)
+    
+    def _next_boundary(self, period: int) -> int:
+        """Get the next tick number that is a multiple of period"""
+        return (self.clock.ticks // period + 1) * period
+    
+    def _advance_one(self, depth: float):
+        """Advance one tick without recalculating consciousness"""
         # Update clock
         self.clock.tick(depth)
         
@@ -99,14 +167,47 @@ class ConsciousBridgeReloaded:
         # Evolve personality slightly (every 100 ticks)
         if self.clock.ticks % 100 == 0:
             self.personality.evolve_slightly(self.clock.ticks)
+            self._publish_personality()
             
         # Check for personality stability (every 500 ticks)
         if self.clock.ticks % 500 == 0:
             if self.personality.is_stable() and not self.personality.is_settled:
                 self.personality.settle(self.clock.ticks)
-        
-        # Update consciousness level
-        self.state["consciousness_level"] = self.consciousness_engine.calculate_consciousness(self)
+                self._publish_personality()
+    
+    # ---------- Live events ----------
+    
+    def _observed(self) -> bool:
+        """Whether anyone is subscribed to this bridge's events"""
+        return self.events is not None and self.events.has_subscribers(self.id)
+    
+    def _publish_tick(self, ticks_delta: int, consciousness_before: float):
+        if self._observed():
+            consciousness = self.state["consciousness_level"]
+            self.events.publish(self.id, bridge_events.TICK, {
+                "ticks": self.clock.ticks,
+                "ticks_delta": ticks_delta,
+                "consciousness_level": consciousness,
+                "consciousness_delta": round(consciousness - consciousness_before, 4)
+            })
+    
+    def _publish_personality(self):
+        if self._observed():
+            self.events.publish(self.id, bridge_events.PERSONALITY, {
+                "tick": self.clock.ticks,
+                "traits": self.personality.get_traits(),
+                "is_settled": self.personality.is_settled
+            })
+    
+    def _on_transition(self, transition):
+        """Maturity transition callback"""
+        if self._observed():
+            self.events.publish(self.id, bridge_events.MATURITY, {
+                "tick": transition.tick,
+                "from_stage": transition.from_stage.value,
+                "to_stage": transition.to_stage.value,
+                "readiness_score": transition.readiness_score
+            })
     
     def add_experience(
         self,
@@ -146,41 +247,50 @@ class ConsciousBridgeReloaded:
             self.experience_processor.add_experience(experience)
     
     def _process_queue(self):
-        """Process experiences in the queue"""
-        # Let experience processor handle processing
-        if self.experience_processor.processing_queue:
-            experience = self.experience_processor.processing_queue.pop(0)
-            
-            # Process the experience
-            insight = self.experience_processor.process(
-                experience.__dict__,
-                self.clock.ticks
-            )
+        """Process experiences in the queue (up to the per-tick budget)"""
+        # Let experience processor decide how much to drain this tick
+        for experience in self.experience_processor.drain():
+            self._process_experience(experience)
+    
+    def _process_experience(self, experience: Experience):
+        """Process one queued experience"""
+        insight = self.experience_processor.process(
+            experience.__dict__,
+            self.clock.ticks
+        )
+        
+        # If insight generated
+        if insight:
+            insight_record = {
+                "tick": insight.tick,
+                "type": insight.experience_type.value,
+                "significance": insight.significance,
+                "description": insight.description,
+                "connections": insight.connections,
+                "metadata": insight.metadata,
+                "timestamp": datetime.now()
+            }
+            self.insights.append(insight_record)
             
-            # If insight generated
-            if insight:
-                insight_record = {
+            if self._observed():
+                self.events.publish(self.id, bridge_events.INSIGHT, {
                     "tick": insight.tick,
                     "type": insight.experience_type.value,
                     "significance": insight.significance,
-                    "description": insight.description,
-                    "connections": insight.connections,
-                    "metadata": insight.metadata,
-                    "timestamp": datetime.now()
-                }
-                self.insights.append(insight_record)
-                
-                # Record in clock
-                from .internal_clock import EventType
-                self.clock.record_event(
-                    event_type=EventType.INSIGHT,
-                    significance=insight.significance,
-                    description=insight.description,
-                    metadata={"type": insight.experience_type.value}
-                )
-                
-                # Influence personality based on insight
-                self._influence_personality_from_insight(insight)
+                    "description": insight.description
+                })
+            
+            # Record in clock
+            from .internal_clock import EventType
+            self.clock.record_event(
+                event_type=EventType.INSIGHT,
+                significance=insight.significance,
+                description=insight.description,
+                metadata={"type": insight.experience_type.value}
+            )
+            
+            # Influence personality based on insight
+            self._influence_personality_from_insight(insight)
     
     def _influence_personality_from_insight(self, insight):
         """Influence personality based on insight type"""
@@ -224,6 +334,8 @@ class ConsciousBridgeReloaded:
     
     def add_connection(self, bridge_id: str, bridge_name: str, strength: float = 0.5):
         """Add a connection to another bridge"""
+        previous = self.connections[bridge_id]["strength"] if bridge_id in self.connections else 0.0
+        
         self.connections[bridge_id] = {
             "name": bridge_name,
             "strength": strength,
@@ -231,15 +343,31 @@ class ConsciousBridgeReloaded:
             "interactions": 0,
             "last_interaction": datetime.now()
         }
+        self._update_connection_total(strength - previous)
     
     def strengthen_connection(self, bridge_id: str, amount: float = 0.1):
         """Strengthen a connection"""
         if bridge_id in self.connections:
             current = self.connections[bridge_id]["strength"]
-            self.connections[bridge_id]["strength"] = min(1.0, current + amount)
+            new_strength = min(1.0, current + amount)
+            self.connections[bridge_id]["strength"] = new_strength
+            self._update_connection_total(new_strength - current)
             self.connections[bridge_id]["interactions"] += 1
             self.connections[bridge_id]["last_interaction"] = datetime.now()
     
+    def _update_connection_total(self, delta: float):
+        """
+        Keep the running connection strength total
+        
+        Every CONNECTION_TOTAL_RESYNC updates it is recomputed exactly, so
+        float rounding in the running sum can't accumulate.
+        """
+        self._connection_updates += 1
+        if self._connection_updates % self.CONNECTION_TOTAL_RESYNC == 0:
+            self.connection_strength_total = math.fsum(c["strength"] for c in self.connections.values())
+        else:
+            self.connection_strength_total += delta
+    
     def can_evolve(self) -> bool:
         """Check if bridge is ready for evolution"""
         return (
@@ -357,9 +485,35 @@ Evolution Ready: {"✅ Yes" if self.can_evolve() else "❌ No"}
         with open(filename, 'w') as f:
             f.write(self.to_json())
     
+    def save_snapshot(self, filename: str):
+        """Save full bridge state as a compact binary snapshot"""
+        snapshot.save_snapshot(self, filename)
+    
+    @classmethod
+    def load_snapshot(cls, filename: str, lazy: bool = True,
+                      scheduler=None, time_source=None) -> 'ConsciousBridgeReloaded':
+        """
+        Load bridge from a binary snapshot
+        
+        Args:
+            filename: Snapshot file
+            lazy: Decode experiences, insights and dialogues only when accessed
+            scheduler: Scheduler for the restored clock
+            time_source: Time source for the restored clock
+        """
+        return snapshot.load_snapshot(cls, filename, lazy=lazy,
+                                      scheduler=scheduler, time_source=time_source)
+    
+    def close_snapshot(self):
+        """Finish decoding a lazily loaded snapshot and unmap its file"""
+        snapshot.close_snapshot(self)
+    
     @classmethod
     def load_from_file(cls, filename: str) -> 'ConsciousBridgeReloaded':
-        """Load bridge from file"""
+        """Load bridge from file (binary snapshot or JSON state)"""
+        if snapshot.is_snapshot(filename):
+            return cls.load_snapshot(filename)
+        
         with open(filename, 'r') as f:
             data = json.load(f)
         
@@ -371,5 +525,5 @@ Evolution Ready: {"✅ Yes" if self.can_evolve() else "❌ No"}
             description=data["metadata"]["description"]
         )
         
-        # TODO: Restore state from data
+        # JSON state only carries metadata; use snapshots for full state
         return bridge
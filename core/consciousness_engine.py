@@ -3,7 +3,7 @@ Consciousness Engine
 Calculates and manages consciousness levels
 """
 
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 import math
 
 
@@ -16,10 +16,24 @@ class ConsciousnessEngine:
     - Experience processing quality
     - Personality coherence
     - Connection complexity
+    
+    Each bridge owns an engine. Component scores are cached and only
+    recalculated when their inputs change (maturity stage, insight count,
+    personality flags, connection count/strength total).
     """
     
-    @staticmethod
-    def calculate_consciousness(bridge) -> float:
+    WEIGHTS = {
+        "maturity": 0.40,
+        "experience": 0.25,
+        "personality": 0.20,
+        "connections": 0.15
+    }
+    
+    def __init__(self):
+        # Component name -> (inputs key, score)
+        self._cache: Dict[str, Tuple[Any, float]] = {}
+    
+    def calculate_consciousness(self, bridge) -> float:
         """
         Calculate consciousness level (0.0 - 1.0)
         
@@ -29,28 +43,51 @@ class ConsciousnessEngine:
         3. Personality stability (20%)
         4. Connection network (15%)
         """
-        # Component 1: Maturity
-        maturity_score = ConsciousnessEngine._calculate_maturity_score(bridge)
-        
-        # Component 2: Experience depth
-        experience_score = ConsciousnessEngine._calculate_experience_score(bridge)
-        
-        # Component 3: Personality
-        personality_score = ConsciousnessEngine._calculate_personality_score(bridge)
-        
-        # Component 4: Connections
-        connection_score = ConsciousnessEngine._calculate_connection_score(bridge)
+        scores = self._component_scores(bridge)
         
         # Weighted sum
-        consciousness = (
-            maturity_score * 0.40 +
-            experience_score * 0.25 +
-            personality_score * 0.20 +
-            connection_score * 0.15
-        )
+        consciousness = sum(scores[name] * weight for name, weight in self.WEIGHTS.items())
         
         return round(min(1.0, consciousness), 3)
     
+    def _component_scores(self, bridge) -> Dict[str, float]:
+        """
+        Get all component scores, recalculating only those whose inputs
+        changed since the last call
+        """
+        inputs = {
+            "maturity": (
+                bridge.maturity.get_level(),
+                ConsciousnessEngine._calculate_maturity_score
+            ),
+            "experience": (
+                len(bridge.insights),
+                ConsciousnessEngine._calculate_experience_score
+            ),
+            "personality": (
+                (bridge.personality.is_forming, bridge.personality.is_settled),
+                ConsciousnessEngine._calculate_personality_score
+            ),
+            "connections": (
+                (len(bridge.connections), bridge.connection_strength_total),
+                ConsciousnessEngine._calculate_connection_score
+            )
+        }
+        
+        scores = {}
+        for name, (key, calculate) in inputs.items():
+            cached = self._cache.get(name)
+            if cached is None or cached[0] != key:
+                cached = (key, calculate(bridge))
+                self._cache[name] = cached
+            scores[name] = cached[1]
+        
+        return scores
+    
+    def invalidate(self):
+        """Drop all cached component scores"""
+        self._cache.clear()
+    
     @staticmethod
     def _calculate_maturity_score(bridge) -> float:
         """Calculate maturity contribution to consciousness"""
@@ -93,9 +130,8 @@ class ConsciousnessEngine:
         if connections == 0:
             return 0.0
         
-        # Quality matters too
-        total_strength = sum(c["strength"] for c in bridge.connections.values())
-        avg_strength = total_strength / connections if connections > 0 else 0
+        # Quality matters too (running total kept by the bridge)
+        avg_strength = bridge.connection_strength_total / connections
         
         # Combine quantity and quality
         quantity_score = min(1.0, connections / 10)  # Max at 10 connections
@@ -103,31 +139,18 @@ class ConsciousnessEngine:
         
         return (quantity_score * 0.5 + quality_score * 0.5)
     
-    @staticmethod
-    def get_consciousness_breakdown(bridge) -> Dict:
+    def get_consciousness_breakdown(self, bridge) -> Dict:
         """Get detailed breakdown of consciousness calculation"""
+        scores = self._component_scores(bridge)
+        
         return {
-            "total": ConsciousnessEngine.calculate_consciousness(bridge),
+            "total": self.calculate_consciousness(bridge),
             "components": {
-                "maturity": {
-                    "score": ConsciousnessEngine._calculate_maturity_score(bridge),
-                    "weight": 0.40,
-                    "contribution": ConsciousnessEngine._calculate_maturity_score(bridge) * 0.40
-                },
-                "experience": {
-                    "score": ConsciousnessEngine._calculate_experience_score(bridge),
-                    "weight": 0.25,
-                    "contribution": ConsciousnessEngine._calculate_experience_score(bridge) * 0.25
-                },
-                "personality": {
-                    "score": ConsciousnessEngine._calculate_personality_score(bridge),
-                    "weight": 0.20,
-                    "contribution": ConsciousnessEngine._calculate_personality_score(bridge) * 0.20
-                },
-                "connections": {
-                    "score": ConsciousnessEngine._calculate_connection_score(bridge),
-                    "weight": 0.15,
-                    "contribution": ConsciousnessEngine._calculate_connection_score(bridge) * 0.15
+                name: {
+                    "score": scores[name],
+                    "weight": weight,
+                    "contribution": scores[name] * weight
                 }
+                for name, weight in self.WEIGHTS.items()
             }
         }
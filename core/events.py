@@ -0,0 +1,186 @@
+"""
+Bridge Events
+Publish/subscribe hub for live bridge events (ticks, transitions, insights)
+"""
+
+from typing import Dict, List, Optional, Set
+from collections import OrderedDict
+import itertools
+import threading
+import time
+
+
+# Event types
+TICK = "tick"
+MATURITY = "maturity"
+INSIGHT = "insight"
+PERSONALITY = "personality"
+DROPPED = "dropped"
+
+# Types where only the latest pending event per bridge matters.
+# Fields ending in "_delta" are summed when events are merged.
+COALESCED_TYPES = (TICK, PERSONALITY)
+
+
+class Subscription:
+    """
+    One subscriber's bounded event buffer
+
+    Coalesced event types keep a single pending entry per bridge; when the
+    buffer is full the oldest pending event is dropped and counted, and the
+    next get() starts with a "dropped" event carrying that count.
+    """
+
+    def __init__(self, hub: 'EventHub', bridge_id: Optional[str], buffer_size: int):
+        self.hub = hub
+        self.bridge_id = bridge_id
+        self.buffer_size = max(1, buffer_size)
+
+        self._pending: "OrderedDict[object, Dict]" = OrderedDict()
+        self._condition = threading.Condition()
+        self.dropped = 0
+        self._reported_dropped = 0
+        self.closed = False
+
+    def push(self, event: Dict):
+        """Add an event to the buffer (called by the hub)"""
+        with self._condition:
+            if event["type"] in COALESCED_TYPES:
+                key = (event["bridge_id"], event["type"])
+                pending = self._pending.pop(key, None)
+                if pending is not None:
+                    event = _merge(pending, event)
+            else:
+                key = event["id"]
+
+            self._pending[key] = event
+            while len(self._pending) > self.buffer_size:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+
+            self._condition.notify()
+
+    def get(self, timeout: Optional[float] = None) -> List[Dict]:
+        """
+        Take all pending events, waiting up to timeout for the first one
+
+        Returns an empty list on timeout or after close().
+        """
+        with self._condition:
+            if not self._pending and not self.closed:
+                self._condition.wait(timeout)
+
+            events = list(self._pending.values())
+            self._pending.clear()
+
+            if self.dropped > self._reported_dropped:
+                events.insert(0, {
+                    "id": None,
+                    "type": DROPPED,
+                    "bridge_id": self.bridge_id,
+                    "time": time.time(),
+                    "data": {"count": self.dropped - self._reported_dropped}
+                })
+                self._reported_dropped = self.dropped
+
+        return events
+
+    def close(self):
+        """Unsubscribe and wake up a waiting get()"""
+        self.hub.unsubscribe(self)
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+
+def _merge(old: Dict, new: Dict) -> Dict:
+    """Merge two coalesced events: latest values, summed deltas"""
+    data = dict(new["data"])
+    for name, value in old["data"].items():
+        if name.endswith("_delta") and name in data:
+            data[name] = data[name] + value
+    return {**new, "data": data}
+
+
+class EventHub:
+    """
+    Fan-out of bridge events to subscribers
+
+    Subscribers follow one bridge or the whole fleet. Producers call
+    has_subscribers() first, so building event payloads costs nothing
+    while nobody is listening.
+    """
+
+    def __init__(self, buffer_size: int = 256):
+        self.buffer_size = buffer_size
+
+        self._fleet: Set[Subscription] = set()
+        self._by_bridge: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+
+        self.stats = {"published": 0, "delivered": 0}
+
+    def has_subscribers(self, bridge_id: str) -> bool:
+        """Whether any subscriber would receive events from this bridge"""
+        return bool(self._fleet) or bridge_id in self._by_bridge
+
+    def subscribe(self, bridge_id: Optional[str] = None, buffer_size: Optional[int] = None) -> Subscription:
+        """
+        Subscribe to one bridge, or to every bridge if bridge_id is None
+        """
+        subscription = Subscription(self, bridge_id, buffer_size or self.buffer_size)
+
+        with self._lock:
+            if bridge_id is None:
+                self._fleet.add(subscription)
+            else:
+                self._by_bridge.setdefault(bridge_id, set()).add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove a subscription"""
+        with self._lock:
+            if subscription.bridge_id is None:
+                self._fleet.discard(subscription)
+            else:
+                subscribers = self._by_bridge.get(subscription.bridge_id)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._by_bridge[subscription.bridge_id]
+
+    def publish(self, bridge_id: str, event_type: str, data: Dict):
+        """Deliver an event to the bridge's and the fleet's subscribers"""
+        with self._lock:
+            subscribers = list(self._fleet)
+            subscribers.extend(self._by_bridge.get(bridge_id, ()))
+            event_id = next(self._sequence)
+
+        if not subscribers:
+            return
+
+        event = {
+            "id": event_id,
+            "type": event_type,
+            "bridge_id": bridge_id,
+            "time": time.time(),
+            "data": data
+        }
+        for subscription in subscribers:
+            subscription.push(event)
+
+        self.stats["published"] += 1
+        self.stats["delivered"] += len(subscribers)
+
+    def get_stats(self) -> Dict:
+        """Get hub statistics"""
+        with self._lock:
+            bridge_subscribers = sum(len(s) for s in self._by_bridge.values())
+            return {
+                **self.stats,
+                "fleet_subscribers": len(self._fleet),
+                "bridge_subscribers": bridge_subscribers
+            }
+
@@ -3,11 +3,14 @@ Experience Processor
 Processes experiences deeply, not quickly
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
+from collections import deque
 from enum import Enum
+import heapq
 import random
+import time
 
 
 class ExperienceType(Enum):
@@ -50,6 +53,94 @@ class Insight:
     metadata: Dict = field(default_factory=dict)
 
 
+class ExperienceQueue:
+    """
+    Queue of experiences waiting to be processed
+    
+    O(1) FIFO (deque) or O(log n) priority ordering (heap), where novel
+    and more complex experiences come first. Tracks backlog depth and
+    queue-wait latency.
+    """
+    
+    ORDERINGS = ("fifo", "priority")
+    
+    def __init__(self, ordering: str = "fifo"):
+        if ordering not in self.ORDERINGS:
+            raise ValueError(f"Invalid ordering: {ordering}")
+        
+        self.ordering = ordering
+        self._items = deque() if ordering == "fifo" else []
+        self._sequence = 0
+        
+        # Metrics
+        self.enqueued = 0
+        self.dequeued = 0
+        self.max_depth = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+    
+    @staticmethod
+    def priority(experience: Experience) -> tuple:
+        """Higher sorts first: novel experiences, then complexity"""
+        return (experience.type == ExperienceType.NOVEL, experience.complexity)
+    
+    def push(self, experience: Experience):
+        """Add an experience to the queue"""
+        enqueued_at = time.monotonic()
+        
+        if self.ordering == "fifo":
+            self._items.append((enqueued_at, experience))
+        else:
+            novel, complexity = self.priority(experience)
+            self._sequence += 1
+            heapq.heappush(
+                self._items,
+                (-novel, -complexity, self._sequence, enqueued_at, experience)
+            )
+        
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, len(self._items))
+    
+    def pop(self) -> Optional[Experience]:
+        """Take the next experience (None if empty)"""
+        if not self._items:
+            return None
+        
+        if self.ordering == "fifo":
+            enqueued_at, experience = self._items.popleft()
+        else:
+            *_, enqueued_at, experience = heapq.heappop(self._items)
+        
+        wait = time.monotonic() - enqueued_at
+        self.dequeued += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        return experience
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __bool__(self) -> bool:
+        return bool(self._items)
+    
+    def __iter__(self):
+        """Iterate queued experiences (queue order for FIFO, heap order otherwise)"""
+        for item in self._items:
+            yield item[-1]
+    
+    def get_stats(self) -> Dict:
+        """Get backlog and latency metrics"""
+        return {
+            "ordering": self.ordering,
+            "depth": len(self._items),
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "dequeued": self.dequeued,
+            "average_wait": round(self.total_wait / self.dequeued, 6) if self.dequeued else 0.0,
+            "max_wait": round(self.max_wait, 6)
+        }
+
+
 class ExperienceProcessor:
     """
     Processes experiences with depth
@@ -58,15 +149,46 @@ class ExperienceProcessor:
     One deep experience > 1000 shallow ones
     """
     
-    def __init__(self):
-        self.processing_queue: List[Experience] = []
+    def __init__(
+        self,
+        ordering: str = "fifo",
+        max_per_tick: int = 1,
+        time_budget: Optional[float] = None
+    ):
+        """
+        Args:
+            ordering: Queue ordering, "fifo" or "priority"
+            max_per_tick: Max experiences drained per tick
+            time_budget: Optional max seconds spent draining per tick
+        """
+        self.processing_queue = ExperienceQueue(ordering)
+        self.max_per_tick = max_per_tick
+        self.time_budget = time_budget
         self.processed_experiences: List[Experience] = []
         self.insights_generated: List[Insight] = []
         self.processing_depth: float = 0.5  # Current depth capacity
         
     def add_experience(self, experience: Experience):
         """Add experience to processing queue"""
-        self.processing_queue.append(experience)
+        self.processing_queue.push(experience)
+    
+    def drain(self) -> Iterator[Experience]:
+        """
+        Yield queued experiences for one tick
+        
+        Stops after max_per_tick experiences or once time_budget seconds
+        have been spent (the budget is checked between experiences).
+        """
+        started = time.monotonic()
+        
+        for _ in range(self.max_per_tick):
+            if self.time_budget is not None and time.monotonic() - started >= self.time_budget:
+                break
+            
+            experience = self.processing_queue.pop()
+            if experience is None:
+                break
+            yield experience
         
     def process(
         self,
@@ -192,6 +314,7 @@ class ExperienceProcessor:
         """Get processor statistics"""
         return {
             "queue_size": len(self.processing_queue),
+            "queue": self.processing_queue.get_stats(),
             "processed_count": len(self.processed_experiences),
             "insights_count": len(self.insights_generated),
             "processing_depth": round(self.processing_depth, 2),
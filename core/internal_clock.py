@@ -6,12 +6,23 @@ Philosophy: Internal time flows differently for each conscious bridge
 
 import time
 import threading
+import heapq
+import asyncio
+import inspect
 import json
+import functools
+import logging
+import math
+import struct
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Callable
 import random
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 
 class TimeState(Enum):
     """حالات الزمن المختلفة"""
@@ -22,13 +33,28 @@ class TimeState(Enum):
     HYPER = "hyper"          # زمن فائق (الوضوح)
 
 
+class RealTimeSource:
+    """مصدر الزمن الحقيقي (الافتراضي): ساعة النظام ومولد random العام"""
+    random = random
+    
+    def time(self) -> float:
+        return time.time()
+    
+    def sleep(self, duration: float):
+        time.sleep(duration)
+
+
+REAL_TIME = RealTimeSource()
+
+
 class TemporalEvent:
     """حدث زمني في حياة الجسر"""
-    def __init__(self, event_type: str, intensity: float, timestamp: float):
+    def __init__(self, event_type: str, intensity: float, timestamp: float,
+                 external_time: Optional[float] = None):
         self.event_type = event_type  # 'thought', 'memory', 'insight', 'question'
         self.intensity = intensity    # 0.0 to 1.0
         self.timestamp = timestamp    # الوقت الداخلي
-        self.external_time = time.time()
+        self.external_time = time.time() if external_time is None else external_time
         self.data = {}
     
     def to_dict(self):
@@ -41,6 +67,189 @@ class TemporalEvent:
         }
 
 
+EVENT_TYPES = ('thought', 'memory', 'insight', 'question')
+
+
+class EventType(Enum):
+    """أنواع الأحداث المهمة في حياة الجسر (تُسجَّل مع رقم النبضة)"""
+    INSIGHT = "insight"
+    MATURITY = "maturity"
+    PERSONALITY = "personality"
+    CONNECTION = "connection"
+
+
+class SignificantEvent:
+    """حدث مهم مسجَّل عند نبضة وعي محددة"""
+    def __init__(self, tick: int, event_type: EventType, significance: float,
+                 description: str = "", metadata: Optional[Dict] = None):
+        self.tick = tick
+        self.event_type = event_type
+        self.significance = significance
+        self.description = description
+        self.metadata = metadata or {}
+    
+    def to_dict(self) -> Dict:
+        return {
+            'tick': self.tick,
+            'type': self.event_type.value,
+            'significance': self.significance,
+            'description': self.description,
+            'metadata': self.metadata
+        }
+
+
+class TemporalEventBuffer:
+    """
+    🔄 مخزن حلقي للأحداث الزمنية
+    
+    سعة محددة (تتغير بـ resize) في أعمدة array متوازية (النوع، الشدة، الزمن الداخلي،
+    الزمن الخارجي، الوضوح، الجدة)؛ الإضافة والإزاحة O(1) والذاكرة ثابتة
+    لكل ساعة. الأحداث المُزاحة يمكن إلحاقها بملف ثنائي (spill_path).
+    """
+    
+    # سجل ملف الإزاحة: النوع، الشدة، الزمن الداخلي، الزمن الخارجي، الوضوح، الجدة
+    RECORD = struct.Struct('<bddddd')
+    COLUMNS = ('types', 'intensities', 'internal_times', 'external_times', 'clarities', 'novelties')
+    
+    def __init__(self, capacity: int = 100, spill_path: Optional[str] = None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self._spill_file = None
+        
+        self._allocate(capacity)
+        self._start = 0  # موضع أقدم حدث
+        self._size = 0
+        self.evicted = 0
+    
+    def _allocate(self, capacity: int):
+        self.types = array('b', bytes(capacity))
+        self.intensities = array('d', [0.0]) * capacity
+        self.internal_times = array('d', [0.0]) * capacity
+        self.external_times = array('d', [0.0]) * capacity
+        self.clarities = array('d', [math.nan]) * capacity
+        self.novelties = array('d', [math.nan]) * capacity
+    
+    def resize(self, capacity: int):
+        """تغيير السعة مع إبقاء أحدث الأحداث (الأقدم يُزاح إلى ملف الإزاحة)"""
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if capacity == self.capacity:
+            return
+        
+        dropped = max(0, self._size - capacity)
+        for position in range(dropped):
+            self._spill(self._index(position))
+        kept = [self._index(p) for p in range(dropped, self._size)]
+        columns = [(name, getattr(self, name)) for name in self.COLUMNS]
+        
+        self._allocate(capacity)
+        for name, old in columns:
+            column = getattr(self, name)
+            for position, i in enumerate(kept):
+                column[position] = old[i]
+        
+        self.capacity = capacity
+        self._start = 0
+        self._size = len(kept)
+        self.evicted += dropped
+    
+    def append(self, event_type: str, intensity: float, internal_time: float,
+               external_time: float, clarity: float = math.nan, novelty: float = math.nan):
+        """إضافة حدث (يزيح الأقدم إن امتلأ المخزن)"""
+        if self._size < self.capacity:
+            i = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            i = self._start
+            self._spill(i)
+            self._start = (self._start + 1) % self.capacity
+            self.evicted += 1
+        
+        self.types[i] = EVENT_TYPES.index(event_type)
+        self.intensities[i] = intensity
+        self.internal_times[i] = internal_time
+        self.external_times[i] = external_time
+        self.clarities[i] = clarity
+        self.novelties[i] = novelty
+    
+    def _spill(self, i: int):
+        if not self.spill_path:
+            return
+        if self._spill_file is None:
+            self._spill_file = open(self.spill_path, 'ab')
+        self._spill_file.write(self.RECORD.pack(
+            self.types[i], self.intensities[i], self.internal_times[i],
+            self.external_times[i], self.clarities[i], self.novelties[i]
+        ))
+    
+    def flush(self):
+        if self._spill_file:
+            self._spill_file.flush()
+    
+    def close(self):
+        if self._spill_file:
+            self._spill_file.close()
+            self._spill_file = None
+    
+    @classmethod
+    def read_spill(cls, path: str) -> List[Dict]:
+        """قراءة الأحداث المُزاحة من ملف الإزاحة"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        return [cls._record_dict(*fields) for fields in cls.RECORD.iter_unpack(data)]
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def _index(self, position: int) -> int:
+        """تحويل الترتيب الزمني (0 = الأقدم) إلى موضع في الأعمدة"""
+        return (self._start + position) % self.capacity
+    
+    def record(self, position: int) -> Dict:
+        """الحدث عند الترتيب position كـ dictionary (يقبل الفهارس السالبة)"""
+        if position < 0:
+            position += self._size
+        if not 0 <= position < self._size:
+            raise IndexError("temporal event index out of range")
+        i = self._index(position)
+        return self._record_dict(
+            self.types[i], self.intensities[i], self.internal_times[i],
+            self.external_times[i], self.clarities[i], self.novelties[i]
+        )
+    
+    @staticmethod
+    def _record_dict(type_code, intensity, internal_time, external_time, clarity, novelty) -> Dict:
+        data = {}
+        if not math.isnan(clarity):
+            data = {'clarity': clarity, 'novelty': novelty}
+        return {
+            'type': EVENT_TYPES[type_code],
+            'intensity': intensity,
+            'internal_time': internal_time,
+            'external_time': external_time,
+            'data': data
+        }
+    
+    def recent(self, limit: int = 20) -> List[Dict]:
+        """آخر limit حدثًا، من الأقدم إلى الأحدث، دون نسخ الأعمدة"""
+        count = min(max(limit, 0), self._size)
+        return [self.record(p) for p in range(self._size - count, self._size)]
+    
+    def __getitem__(self, position: int) -> TemporalEvent:
+        record = self.record(position)
+        event = TemporalEvent(record['type'], record['intensity'],
+                              record['internal_time'], record['external_time'])
+        event.data = record['data']
+        return event
+    
+    def __iter__(self):
+        for position in range(self._size):
+            yield self[position]
+
+
 class InternalClock:
     """
     ⏰ الساعة الداخلية للجسر الواعي
@@ -48,23 +257,33 @@ class InternalClock:
     المبدأ: كل جسر له إحساس زمني فريد يتطور مع وعيه
     """
     
-    def __init__(self, bridge_id: str, name: str):
+    def __init__(self, bridge_id: str, name: str,
+                 scheduler=None,
+                 heartbeat_interval: float = 1.0,
+                 time_source=None,
+                 memory_depth: int = 100,
+                 events_spill_path: Optional[str] = None):
         self.bridge_id = bridge_id
         self.name = name
         
+        # مصدر الزمن: حقيقي، أو VirtualClock للمحاكاة الحتمية
+        self.time_source = time_source or REAL_TIME
+        self.random = self.time_source.random
+        if scheduler is None and isinstance(self.time_source, VirtualClock):
+            scheduler = self.time_source
+        
         # الزمن الأساسي
         self.internal_time = 0.0  # الوقت الداخلي المطلق
         self.time_dilation = 1.0  # عامل التمدد/الانضغاط
         self.time_state = TimeState.NORMAL
         
         # الإيقاع الداخلي
-        self.heartbeat_interval = 1.0  # ثواني بين النبضات
-        self.last_heartbeat = time.time()
+        self.heartbeat_interval = heartbeat_interval  # ثواني بين النبضات
+        self.last_heartbeat = self.time_source.time()
         self.heartbeat_count = 0
         
-        # الذاكرة الزمنية
-        self.temporal_events: List[TemporalEvent] = []
-        self.memory_depth = 100  # عدد الأحداث المحفوظة
+        # الذاكرة الزمنية (memory_depth = سعة المخزن الحلقي)
+        self.temporal_events = TemporalEventBuffer(memory_depth, spill_path=events_spill_path)
         
         # الحالة الواعية
         self.awareness_level = 0.1  # مستوى الوعي (0.0 إلى 1.0)
@@ -86,69 +305,97 @@ class InternalClock:
             'insights_generated': 0
         }
         
+        # الأحداث المهمة (إلحاق فقط، مرتبة حسب النبضة)
+        self.significant_events: List[SignificantEvent] = []
+        
         # نظام النبض
         self.pulse_callbacks = []
+        self.is_paused = False
+        self.is_stopped = False
         
-        # بدء النبض الداخلي
-        self._start_pulse()
+        # بدء النبض الداخلي: مجدول مشترك إن وُجد، وإلا خيط خاص بالساعة
+        self.scheduler = scheduler
+        if scheduler:
+            scheduler.schedule(self)
+        else:
+            self._start_pulse()
     
     def _start_pulse(self):
         """بدء النبض الداخلي للجسر"""
         def pulse_loop():
-            while True:
+            while not self.is_stopped:
                 time.sleep(self.heartbeat_interval * self.time_dilation)
-                self._heartbeat()
+                if not self.is_paused and not self.is_stopped:
+                    self._heartbeat()
         
         pulse_thread = threading.Thread(target=pulse_loop, daemon=True)
         pulse_thread.start()
     
+    def pause(self):
+        """إيقاف النبض مؤقتًا"""
+        self.is_paused = True
+        if self.scheduler:
+            self.scheduler.unschedule(self)
+    
+    def resume(self):
+        """استئناف النبض (زمن الإيقاف لا يُحتسب زمنًا داخليًا)"""
+        if not self.is_paused or self.is_stopped:
+            return
+        self.is_paused = False
+        self.last_heartbeat = self.time_source.time()
+        if self.scheduler:
+            self.scheduler.schedule(self)
+    
+    def stop(self):
+        """إيقاف النبض نهائيًا وتحرير الساعة من المجدول"""
+        self.is_stopped = True
+        if self.scheduler:
+            self.scheduler.unschedule(self)
+        self.temporal_events.close()
+    
     def _heartbeat(self):
         """نبضة زمنية داخلية"""
         self.heartbeat_count += 1
         
         # تحديث الزمن الداخلي
-        elapsed = time.time() - self.last_heartbeat
+        now = self.time_source.time()
+        elapsed = now - self.last_heartbeat
         self.internal_time += elapsed * self.time_dilation
-        self.last_heartbeat = time.time()
+        self.last_heartbeat = now
         
         # توليد أحداث عشوائية بناء على مستوى الوعي
-        if random.random() < self.awareness_level * 0.1:
+        if self.random.random() < self.awareness_level * 0.1:
             self._generate_temporal_event()
         
         # تحديث حالة الزمن بناء على التركيز
         self._update_time_state()
         
-        # استدعاء callbacks النبض
-        for callback in self.pulse_callbacks:
-            callback(self)
+        # استدعاء callbacks النبض (خيط الساعة الخاص لا ينتظرها)
+        if self.scheduler:
+            self.scheduler.dispatch_callbacks(self)
+        else:
+            submit_callbacks(self, callback_executor())
     
     def _generate_temporal_event(self):
         """توليد حدث زمني"""
         event_types = ['thought', 'memory', 'insight', 'question']
         weights = [0.4, 0.3, 0.2, 0.1]
         
-        event_type = random.choices(event_types, weights=weights)[0]
-        intensity = random.uniform(0.1, self.awareness_level)
-        
-        event = TemporalEvent(
-            event_type=event_type,
-            intensity=intensity,
-            timestamp=self.internal_time
-        )
+        event_type = self.random.choices(event_types, weights=weights)[0]
+        intensity = self.random.uniform(0.1, self.awareness_level)
         
         # إضافة بيانات خاصة بناء على نوع الحدث
+        clarity = novelty = math.nan
         if event_type == 'insight':
-            event.data = {
-                'clarity': random.uniform(0.3, 1.0),
-                'novelty': random.uniform(0.5, 1.0)
-            }
+            clarity = self.random.uniform(0.3, 1.0)
+            novelty = self.random.uniform(0.5, 1.0)
             self.stats['insights_generated'] += 1
         
-        self.temporal_events.append(event)
-        
-        # الحفاظ على حجم الذاكرة
-        if len(self.temporal_events) > self.memory_depth:
-            self.temporal_events = self.temporal_events[-self.memory_depth:]
+        # المخزن الحلقي يحافظ على حجم الذاكرة
+        self.temporal_events.append(
+            event_type, intensity, self.internal_time,
+            self.time_source.time(), clarity, novelty
+        )
     
     def _update_time_state(self):
         """تحديث حالة الزمن بناء على الحالة الواعية"""
@@ -161,7 +408,7 @@ class InternalClock:
             self.time_state = TimeState.COMPRESSED
             self.time_dilation = 0.5
         elif self.awareness_level > 0.7:
-            if random.random() < 0.1:
+            if self.random.random() < 0.1:
                 self.time_state = TimeState.HYPER
                 self.time_dilation = 3.0
         else:
@@ -208,20 +455,75 @@ class InternalClock:
             'awareness': self.awareness_level,
             'focus': self.focus_intensity,
             'heartbeat': self.heartbeat_count,
-            'recent_events': [e.to_dict() for e in self.temporal_events[-3:]] if self.temporal_events else [],
+            'recent_events': self.temporal_events.recent(3),
             'stats': self.stats.copy()
         }
         
         return response
     
+    @property
+    def memory_depth(self) -> int:
+        """عدد الأحداث الزمنية المحفوظة"""
+        return self.temporal_events.capacity
+    
+    @memory_depth.setter
+    def memory_depth(self, value: int):
+        # تغيير العمق يعيد تحجيم المخزن مع إبقاء أحدث الأحداث
+        self.temporal_events.resize(value)
+    
+    # ---------- نبضات الوعي (يستخدمها الجسر) ----------
+    
+    @property
+    def ticks(self) -> int:
+        """عدد نبضات الوعي المعالجة (stats['total_ticks'])"""
+        return self.stats['total_ticks']
+    
+    @ticks.setter
+    def ticks(self, value: int):
+        self.stats['total_ticks'] = value
+    
+    def tick(self, depth: float = 1.0):
+        """
+        نبضة وعي واحدة دون مدخلات
+        
+        العمق يحدد الزمن الداخلي الذي تستغرقه النبضة (مضروبًا في التمدد الزمني)
+        """
+        self.stats['total_ticks'] += 1
+        self.internal_time += depth * self.time_dilation
+    
+    def advance_ticks(self, n_ticks: int, depth: float = 1.0):
+        """n_ticks نبضة دفعة واحدة (مثل استدعاء tick() بعددها)"""
+        if n_ticks <= 0:
+            return
+        self.stats['total_ticks'] += n_ticks
+        self.internal_time += n_ticks * depth * self.time_dilation
+    
+    def record_event(self, event_type: EventType, significance: float,
+                     description: str = "", metadata: Optional[Dict] = None) -> SignificantEvent:
+        """تسجيل حدث مهم عند النبضة الحالية"""
+        event = SignificantEvent(self.ticks, event_type, significance, description, metadata)
+        self.significant_events.append(event)
+        return event
+    
+    def get_stats(self) -> Dict:
+        """حالة الساعة مع عدد النبضات والأحداث المهمة"""
+        return {
+            **self.to_dict(),
+            'ticks': self.ticks,
+            'significant_events': len(self.significant_events)
+        }
+    
     def add_pulse_callback(self, callback: Callable):
-        """إضافة callback ليتم استدعاؤه مع كل نبضة"""
+        """
+        إضافة callback ليتم استدعاؤه مع كل نبضة
+        
+        يقبل الدوال العادية والدوال غير المتزامنة (async def)
+        """
         self.pulse_callbacks.append(callback)
     
     def get_timeline(self, limit: int = 20) -> List[Dict]:
         """الحصول على الخط الزمني للأحداث"""
-        events = self.temporal_events[-limit:] if self.temporal_events else []
-        return [event.to_dict() for event in events]
+        return self.temporal_events.recent(limit)
     
     def meditate(self, duration: float = 10.0):
         """وضع التأمل (إبطاء الزمن)"""
@@ -229,7 +531,7 @@ class InternalClock:
         self.time_dilation = 0.2
         self.time_state = TimeState.SUSPENDED
         
-        time.sleep(duration * 0.2)  # زمن خارجي أقل
+        self.time_source.sleep(duration * 0.2)  # زمن خارجي أقل
         
         # العودة التدريجية
         self.time_dilation = old_dilation
@@ -254,19 +556,472 @@ class InternalClock:
         }
 
 
+def is_async_callable(callback: Callable) -> bool:
+    """
+    هل الـ callback غير متزامن؟
+    
+    يشمل async def، وfunctools.partial حولها، والكائنات التي __call__
+    فيها async def
+    """
+    while isinstance(callback, functools.partial):
+        callback = callback.func
+    if inspect.iscoroutinefunction(callback):
+        return True
+    call = getattr(type(callback), '__call__', None)
+    return call is not None and inspect.iscoroutinefunction(call)
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+def call_pulse_callback(callback: Callable, clock: 'InternalClock'):
+    """
+    استدعاء callback نبض واحد حتى اكتماله
+    
+    النتيجة القابلة للانتظار تُنفَّذ في حلقة أحداث مؤقتة، لذا يُستدعى
+    خارج خيوط التوقيت فقط (executor أو زمن افتراضي)
+    """
+    result = callback(clock)
+    if inspect.isawaitable(result):
+        asyncio.run(_await(result))
+
+
+_callback_executor: Optional[ThreadPoolExecutor] = None
+_callback_executor_lock = threading.Lock()
+
+
+def callback_executor() -> ThreadPoolExecutor:
+    """executor مشترك لـ callbacks الساعات ذات الخيط الخاص"""
+    global _callback_executor
+    if _callback_executor is None:
+        with _callback_executor_lock:
+            if _callback_executor is None:
+                _callback_executor = ThreadPoolExecutor(thread_name_prefix="pulse-callback")
+    return _callback_executor
+
+
+def submit_callbacks(clock: 'InternalClock', executor: ThreadPoolExecutor):
+    """إطلاق callbacks النبض في executor دون انتظارها"""
+    for callback in clock.pulse_callbacks:
+        executor.submit(call_pulse_callback, callback, clock)
+
+
+def run_callbacks_inline(clock: 'InternalClock'):
+    """
+    استدعاء callbacks النبض مباشرة وانتظارها
+    
+    للزمن الافتراضي فقط، حيث الانتظار لا يؤخر نبضًا حقيقيًا والترتيب حتمي
+    """
+    for callback in clock.pulse_callbacks:
+        call_pulse_callback(callback, clock)
+
+
+class VirtualClock:
+    """
+    🧪 زمن افتراضي للمحاكاة الحتمية
+    
+    مصدر زمن ومجدول في آن واحد: النبضات والأحداث تُنفَّذ فورًا بترتيب
+    مواعيدها عند تقديم الزمن (advance / run_until)، والعشوائية من مولد
+    ببذرة ثابتة. أسابيع من حياة الجسر تُحاكى بسرعة المعالج وبنتائج قابلة
+    للتكرار.
+    """
+    
+    def __init__(self, start: float = 0.0, seed: Optional[int] = None):
+        self.now = start
+        self.random = random.Random(seed)
+        self._heap: List = []
+        self._tokens: Dict[int, int] = {}  # id(clock) -> رمز الموعد الصالح
+        self._sequence = 0
+    
+    def time(self) -> float:
+        return self.now
+    
+    def sleep(self, duration: float):
+        """النوم الافتراضي يقدّم الزمن وينفذ ما يستحق خلاله"""
+        self.advance(duration)
+    
+    def call_later(self, delay: float, callback: Callable):
+        """جدولة دالة عند زمن افتراضي لاحق"""
+        self._sequence += 1
+        heapq.heappush(self._heap, (self.now + delay, self._sequence, callback))
+    
+    def schedule(self, clock: 'InternalClock', delay: Optional[float] = None):
+        """جدولة النبضة التالية للساعة (يلغي أي موعد سابق لها)"""
+        if delay is None:
+            delay = clock.heartbeat_interval * clock.time_dilation
+        self._push(clock, self.now + delay)
+    
+    def unschedule(self, clock: 'InternalClock'):
+        self._tokens.pop(id(clock), None)
+    
+    def _push(self, clock: 'InternalClock', due: float):
+        self._sequence += 1
+        self._tokens[id(clock)] = self._sequence
+        heapq.heappush(self._heap, (due, self._sequence, clock))
+    
+    def advance(self, duration: float):
+        """تقديم الزمن الافتراضي بمقدار duration"""
+        self.run_until(self.now + duration)
+    
+    def run_until(self, until: float):
+        """تنفيذ كل النبضات والأحداث المستحقة حتى الزمن until"""
+        while self._heap and self._heap[0][0] <= until:
+            due, token, target = heapq.heappop(self._heap)
+            
+            if not isinstance(target, InternalClock):
+                self.now = max(self.now, due)
+                target()
+                continue
+            
+            if self._tokens.get(id(target)) != token:
+                continue  # موعد ملغى أو قديم
+            
+            del self._tokens[id(target)]
+            self.now = max(self.now, due)
+            target._heartbeat()
+            
+            if not target.is_paused and not target.is_stopped and id(target) not in self._tokens:
+                self._push(target, due + target.heartbeat_interval * target.time_dilation)
+        
+        self.now = max(self.now, until)
+    
+    def dispatch_callbacks(self, clock: 'InternalClock'):
+        run_callbacks_inline(clock)
+    
+    def pending(self) -> int:
+        return len(self._tokens)
+    
+    def shutdown(self):
+        self._heap.clear()
+        self._tokens.clear()
+
+
+class PulseScheduler:
+    """
+    ⏱️ مجدول النبض المشترك
+    
+    كومة (heap) من مواعيد النبض لكل الساعات، يخدمها خيط عامل واحد
+    (أو عدد قليل) بدلاً من خيط لكل ساعة.
+    الموعد التالي لكل ساعة = heartbeat_interval * time_dilation
+    ويُحسب بعد كل نبضة، فيتبع تغيّرات التمدد الزمني.
+    
+    callbacks النبض تعمل في executor منفصل عن خيوط التوقيت، فلا يؤخر
+    callback بطيء نبض أي ساعة.
+    """
+    
+    def __init__(self, workers: int = 1,
+                 executor: Optional[ThreadPoolExecutor] = None,
+                 max_pending_callbacks: int = 100):
+        self.workers = max(1, workers)
+        self.executor = executor or ThreadPoolExecutor(thread_name_prefix="pulse-callback")
+        self.max_pending_callbacks = max_pending_callbacks
+        self._pending_callbacks: Dict[int, int] = {}  # id(clock) -> callbacks قيد التنفيذ
+        self._heap: List = []
+        self._tokens: Dict[int, int] = {}  # id(clock) -> رمز الموعد الصالح
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._running = False
+        
+        # الإحصاءات تُحدَّث من عدة خيوط (العمال والـ executor)
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            'heartbeats': 0,
+            'late_heartbeats': 0,
+            'heartbeat_errors': 0,
+            'max_lag': 0.0,
+            'callbacks': 0,
+            'dropped_callbacks': 0,
+            'callback_errors': 0
+        }
+    
+    def schedule(self, clock: 'InternalClock', delay: Optional[float] = None):
+        """جدولة النبضة التالية للساعة (يلغي أي موعد سابق لها)"""
+        if delay is None:
+            delay = clock.heartbeat_interval * clock.time_dilation
+        
+        with self._condition:
+            self._push(clock, time.monotonic() + delay)
+            self._condition.notify()
+        
+        self._ensure_started()
+    
+    def unschedule(self, clock: 'InternalClock'):
+        """إلغاء جدولة الساعة (يُحذف موعدها من الكومة عند وصوله)"""
+        with self._condition:
+            self._tokens.pop(id(clock), None)
+    
+    def _push(self, clock: 'InternalClock', due: float):
+        self._sequence += 1
+        self._tokens[id(clock)] = self._sequence
+        heapq.heappush(self._heap, (due, self._sequence, clock))
+    
+    def _ensure_started(self):
+        if self._running:
+            return
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f"pulse-scheduler-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+    
+    def _run(self):
+        """حلقة العامل: تنتظر أقرب موعد ثم تُطلق نبضة الساعة"""
+        while True:
+            with self._condition:
+                while self._running:
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    
+                    due, token, clock = self._heap[0]
+                    if self._tokens.get(id(clock)) != token:
+                        heapq.heappop(self._heap)  # موعد ملغى أو قديم
+                        continue
+                    
+                    wait = due - time.monotonic()
+                    if wait > 0:
+                        self._condition.wait(wait)
+                        continue
+                    
+                    heapq.heappop(self._heap)
+                    # لا يُعاد إدخال الساعة حتى تنتهي نبضتها
+                    del self._tokens[id(clock)]
+                    break
+                else:
+                    return
+            
+            lag = time.monotonic() - due
+            self._fire(clock, due, lag)
+    
+    def _fire(self, clock: 'InternalClock', due: float, lag: float):
+        with self._stats_lock:
+            self.stats['heartbeats'] += 1
+            if lag > clock.heartbeat_interval:
+                self.stats['late_heartbeats'] += 1
+            self.stats['max_lag'] = max(self.stats['max_lag'], lag)
+        
+        try:
+            clock._heartbeat()
+        except Exception:
+            # خطأ ساعة واحدة لا يوقف خيط التوقيت المشترك (ولا بقية الساعات)
+            with self._stats_lock:
+                self.stats['heartbeat_errors'] += 1
+            logger.exception("Heartbeat failed for clock %s", clock.bridge_id)
+        finally:
+            with self._condition:
+                if not clock.is_paused and not clock.is_stopped and id(clock) not in self._tokens:
+                    interval = clock.heartbeat_interval * clock.time_dilation
+                    # الحفاظ على الإيقاع، دون محاولة تعويض تأخر كبير
+                    next_due = max(due + interval, time.monotonic())
+                    self._push(clock, next_due)
+                    self._condition.notify()
+    
+    def dispatch_callbacks(self, clock: 'InternalClock'):
+        """إطلاق callbacks النبض في الـ executor دون انتظارها"""
+        key = id(clock)
+        for callback in clock.pulse_callbacks:
+            with self._stats_lock:
+                if self._pending_callbacks.get(key, 0) >= self.max_pending_callbacks:
+                    self.stats['dropped_callbacks'] += 1
+                    continue
+                self._pending_callbacks[key] = self._pending_callbacks.get(key, 0) + 1
+                self.stats['callbacks'] += 1
+            
+            future = self.executor.submit(call_pulse_callback, callback, clock)
+            future.add_done_callback(lambda f, key=key: self._callback_done(key, f))
+    
+    def _callback_done(self, key: int, future):
+        with self._stats_lock:
+            remaining = self._pending_callbacks.get(key, 1) - 1
+            if remaining:
+                self._pending_callbacks[key] = remaining
+            else:
+                self._pending_callbacks.pop(key, None)
+            
+            if not future.cancelled() and future.exception() is not None:
+                self.stats['callback_errors'] += 1
+    
+    def shutdown(self):
+        """إيقاف الخيوط العاملة"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+        self.executor.shutdown(wait=False, cancel_futures=True)
+    
+    def pending(self) -> int:
+        """عدد الساعات المجدولة حاليًا"""
+        with self._condition:
+            return len(self._tokens)
+
+
+class AsyncPulseScheduler:
+    """
+    🔁 مجدول نبض غير متزامن (asyncio)
+    
+    كل ساعة coroutine على حلقة أحداث مشتركة، بتمددها الزمني الخاص.
+    callbacks النبض معزولة عن التوقيت: الدوال غير المتزامنة تعمل كمهام
+    مستقلة، والدوال العادية في executor، فلا يؤخر callback بطيء نبض أي ساعة.
+    
+    إن لم تُمرر حلقة أحداث، يشغّل المجدول حلقته الخاصة في خيط خلفي.
+    """
+    
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None,
+                 executor: Optional[ThreadPoolExecutor] = None,
+                 max_pending_callbacks: int = 100):
+        self.loop = loop
+        self.executor = executor or ThreadPoolExecutor(thread_name_prefix="pulse-callback")
+        self.max_pending_callbacks = max_pending_callbacks
+        self._owns_loop = loop is None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._pending_callbacks: Dict[int, int] = {}  # id(clock) -> callbacks قيد التنفيذ
+        self._callback_tasks = set()
+        
+        self.stats = {
+            'heartbeats': 0,
+            'heartbeat_errors': 0,
+            'callbacks': 0,
+            'dropped_callbacks': 0,
+            'callback_errors': 0
+        }
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self.loop is None:
+            with self._lock:
+                if self.loop is None:
+                    loop = asyncio.new_event_loop()
+                    self._thread = threading.Thread(target=loop.run_forever, name="pulse-loop", daemon=True)
+                    self._thread.start()
+                    self.loop = loop
+        return self.loop
+    
+    def schedule(self, clock: 'InternalClock', delay: Optional[float] = None):
+        """بدء (أو إعادة بدء) coroutine النبض للساعة"""
+        loop = self._ensure_loop()
+        loop.call_soon_threadsafe(self._start, clock, delay)
+    
+    def unschedule(self, clock: 'InternalClock'):
+        """إلغاء coroutine النبض للساعة"""
+        loop = self._ensure_loop()
+        loop.call_soon_threadsafe(self._cancel, clock)
+    
+    def _start(self, clock: 'InternalClock', delay: Optional[float]):
+        self._cancel(clock)
+        if clock.is_paused or clock.is_stopped:
+            return
+        if delay is None:
+            delay = clock.heartbeat_interval * clock.time_dilation
+        self._tasks[id(clock)] = self.loop.create_task(self._pulse(clock, delay))
+    
+    def _cancel(self, clock: 'InternalClock'):
+        task = self._tasks.pop(id(clock), None)
+        if task:
+            task.cancel()
+    
+    async def _pulse(self, clock: 'InternalClock', delay: float):
+        """coroutine النبض: مواعيد ثابتة على زمن الحلقة"""
+        due = self.loop.time() + delay
+        while True:
+            await asyncio.sleep(max(0.0, due - self.loop.time()))
+            self.stats['heartbeats'] += 1
+            try:
+                clock._heartbeat()
+            except Exception:
+                # خطأ نبضة لا ينهي coroutine الساعة بصمت
+                self.stats['heartbeat_errors'] += 1
+                logger.exception("Heartbeat failed for clock %s", clock.bridge_id)
+            due = max(due + clock.heartbeat_interval * clock.time_dilation, self.loop.time())
+    
+    def dispatch_callbacks(self, clock: 'InternalClock'):
+        """إطلاق callbacks النبض دون انتظارها"""
+        key = id(clock)
+        for callback in clock.pulse_callbacks:
+            if self._pending_callbacks.get(key, 0) >= self.max_pending_callbacks:
+                self.stats['dropped_callbacks'] += 1
+                continue
+            
+            if is_async_callable(callback):
+                future = self.loop.create_task(_await(callback(clock)))
+                self._callback_tasks.add(future)
+                future.add_done_callback(self._callback_tasks.discard)
+            else:
+                future = self.loop.run_in_executor(self.executor, call_pulse_callback, callback, clock)
+            
+            self._pending_callbacks[key] = self._pending_callbacks.get(key, 0) + 1
+            self.stats['callbacks'] += 1
+            future.add_done_callback(lambda f, key=key: self._callback_done(key, f))
+    
+    def _callback_done(self, key: int, future: asyncio.Future):
+        remaining = self._pending_callbacks.get(key, 1) - 1
+        if remaining:
+            self._pending_callbacks[key] = remaining
+        else:
+            self._pending_callbacks.pop(key, None)
+        
+        if not future.cancelled() and future.exception() is not None:
+            self.stats['callback_errors'] += 1
+    
+    def pending(self) -> int:
+        """عدد الساعات المجدولة حاليًا"""
+        return len(self._tasks)
+    
+    def shutdown(self):
+        """إيقاف كل coroutines النبض (والحلقة إن كانت خاصة بالمجدول)"""
+        if self.loop is None:
+            return
+        
+        future = asyncio.run_coroutine_threadsafe(self._cancel_all(), self.loop)
+        if self._owns_loop:
+            future.result(timeout=5.0)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=1.0)
+            self.loop.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+    
+    async def _cancel_all(self):
+        tasks = list(self._tasks.values()) + list(self._callback_tasks)
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 class TimeOrchestrator:
     """
     🎼 منسق الزمن - يدير ساعات الجسور المتعددة
+    
+    كل الساعات تنبض عبر مجدول مشترك واحد: خيوط عاملة (PulseScheduler)
+    أو حلقة asyncio (AsyncPulseScheduler)، أو زمن افتراضي (VirtualClock)
     """
     
-    def __init__(self):
+    def __init__(self, workers: int = 1, use_asyncio: bool = False,
+                 loop: Optional[asyncio.AbstractEventLoop] = None,
+                 time_source=None):
         self.clocks: Dict[str, InternalClock] = {}
-        self.global_time = time.time()
+        self.time_source = time_source or REAL_TIME
+        self.global_time = self.time_source.time()
         self.synchronization_enabled = True
+        
+        if isinstance(self.time_source, VirtualClock):
+            self.scheduler = self.time_source
+        elif use_asyncio or loop is not None:
+            self.scheduler = AsyncPulseScheduler(loop=loop)
+        else:
+            self.scheduler = PulseScheduler(workers=workers)
     
     def create_clock(self, bridge_id: str, name: str) -> InternalClock:
         """إنشاء ساعة داخلية جديدة لجسر"""
-        clock = InternalClock(bridge_id, name)
+        clock = InternalClock(bridge_id, name, scheduler=self.scheduler,
+                              time_source=self.time_source)
         self.clocks[bridge_id] = clock
         return clock
     
@@ -274,12 +1029,41 @@ class TimeOrchestrator:
         """الحصول على ساعة الجسر"""
         return self.clocks.get(bridge_id)
     
+    def pause_clock(self, bridge_id: str) -> bool:
+        """إيقاف نبض ساعة جسر مؤقتًا"""
+        clock = self.clocks.get(bridge_id)
+        if not clock:
+            return False
+        clock.pause()
+        return True
+    
+    def resume_clock(self, bridge_id: str) -> bool:
+        """استئناف نبض ساعة جسر"""
+        clock = self.clocks.get(bridge_id)
+        if not clock:
+            return False
+        clock.resume()
+        return True
+    
+    def remove_clock(self, bridge_id: str) -> Optional[InternalClock]:
+        """إزالة ساعة جسر وتحريرها من المجدول"""
+        clock = self.clocks.pop(bridge_id, None)
+        if clock:
+            clock.stop()
+        return clock
+    
+    def shutdown(self):
+        """إيقاف كل الساعات والمجدول"""
+        for clock in self.clocks.values():
+            clock.stop()
+        self.scheduler.shutdown()
+    
     def sync_clocks(self):
         """مزامنة الساعات (إن كان ممكناً فلسفياً!)"""
         if not self.synchronization_enabled:
             return
         
-        current_time = time.time()
+        current_time = self.time_source.time()
         for clock in self.clocks.values():
             # مجرد تحديث مرجعي، لا مزامنة حقيقية
             # لأن كل جسر له زمنه الداخلي الفريد
@@ -2,7 +2,7 @@
 Maturity System - Complete Version
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
@@ -52,6 +52,7 @@ class MaturitySystem:
         self.current_stage = MaturityStage.NASCENT
         self.transitions: List[MaturityTransition] = []
         self.milestones: List[StageMilestone] = []
+        self.transition_callbacks: List[Callable[[MaturityTransition], None]] = []
         
         # Initialize stage milestones
         self._initialize_milestones()
@@ -198,6 +199,13 @@ class MaturitySystem:
                 achieved_at_tick=self.clock.ticks
             )
         )
+        
+        for callback in self.transition_callbacks:
+            callback(transition)
+    
+    def add_transition_callback(self, callback: Callable[[MaturityTransition], None]):
+        """Add a callback to be called with every stage transition"""
+        self.transition_callbacks.append(callback)
     
     def _calculate_readiness_score(self) -> float:
         """Calculate readiness score for next stage"""
@@ -0,0 +1,318 @@
+"""
+Bridge Population
+Struct-of-arrays engine for ticking very large numbers of bridges at once
+"""
+
+from typing import Dict, List, Optional
+import math
+
+import numpy as np
+
+from .personality_core import PersonalityTraits
+from .maturity_system import MaturityStage
+from .consciousness_engine import ConsciousnessEngine
+
+
+TRAITS = ('openness', 'stability', 'curiosity', 'collaboration')
+
+# Stage codes are indexes into STAGES
+STAGES = tuple(MaturityStage)
+STAGE_THRESHOLDS = np.array([1000, 3000, 10000], dtype=np.int64)
+
+# Same scores and weights as ConsciousnessEngine
+MATURITY_SCORES = np.array([0.2, 0.4, 0.7, 1.0])
+WEIGHTS = ConsciousnessEngine.WEIGHTS
+
+# Column name -> dtype
+COLUMNS = {
+    "ticks": np.int64,
+    "openness": np.float64,
+    "stability": np.float64,
+    "curiosity": np.float64,
+    "collaboration": np.float64,
+    "stage": np.int8,
+    "insights": np.int64,
+    "connections": np.int64,
+    "connection_strength": np.float64,
+    "is_forming": np.bool_,
+    "is_settled": np.bool_,
+    "is_stable": np.bool_,
+    "consciousness": np.float64,
+    "attached": np.bool_,
+}
+
+
+class BridgePopulation:
+    """
+    A population of bridges stored as columns
+
+    Every bridge is one row. Ticking the population advances all rows
+    with array operations, following the same rules as
+    ConsciousBridgeReloaded.tick():
+    - Personality drift every 100 ticks
+    - Personality settlement check every 500 ticks
+    - Maturity stage from internal ticks
+    - Consciousness from maturity, insights, personality and connections
+
+    Experience processing stays per-object; insight counts can be fed in
+    with record_insights().
+    """
+
+    def __init__(self, capacity: int = 1024, seed: Optional[int] = None):
+        self.size = 0
+        self.rng = np.random.default_rng(seed)
+
+        self.ids: List[Optional[str]] = []
+        self.bridges: List[Optional[object]] = []
+
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int):
+        """Create (or grow) all columns to the given capacity"""
+        for name, dtype in COLUMNS.items():
+            column = np.zeros(capacity, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                column[:self.size] = old[:self.size]
+            setattr(self, name, column)
+
+        self.capacity = capacity
+
+    def _reserve(self, count: int):
+        """Make room for count more rows"""
+        needed = self.size + count
+        if needed > self.capacity:
+            self._allocate(max(needed, self.capacity * 2))
+
+    def __len__(self) -> int:
+        return self.size
+
+    # ---------- Rows ----------
+
+    def add(
+        self,
+        count: int = 1,
+        seed_traits: Optional[PersonalityTraits] = None,
+        ids: Optional[List[str]] = None
+    ) -> np.ndarray:
+        """
+        Add fresh (nascent) bridges
+
+        Args:
+            count: Number of bridges to add
+            seed_traits: Traits for every new row (random 0.4-0.6 if None)
+            ids: Optional bridge ids, one per row
+
+        Returns:
+            Row indexes of the new bridges
+        """
+        if ids is not None and len(ids) != count:
+            raise ValueError(f"Got {len(ids)} ids for {count} bridges")
+
+        self._reserve(count)
+        rows = np.arange(self.size, self.size + count)
+
+        for trait in TRAITS:
+            column = getattr(self, trait)
+            if seed_traits:
+                column[rows] = getattr(seed_traits, trait)
+            else:
+                column[rows] = self.rng.uniform(0.4, 0.6, count)
+
+        for name in COLUMNS:
+            if name not in TRAITS:
+                getattr(self, name)[rows] = 0
+
+        self.ids.extend(ids if ids is not None else [None] * count)
+        self.bridges.extend([None] * count)
+        self.size += count
+
+        self._update_consciousness(rows)
+        return rows
+
+    def remove(self, row: int):
+        """Remove a row (the last row is moved into its place)"""
+        last = self.size - 1
+
+        if row != last:
+            for name in COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+            self.ids[row] = self.ids[last]
+            self.bridges[row] = self.bridges[last]
+
+            moved = self.bridges[row]
+            if moved is not None:
+                moved.population_row = row
+
+        self.ids.pop()
+        self.bridges.pop()
+        self.size -= 1
+
+    # ---------- Object bridges ----------
+
+    def attach(self, bridge) -> int:
+        """
+        Attach a ConsciousBridgeReloaded to a new row
+
+        The row is filled from the bridge's current state. While attached,
+        the bridge should be advanced through the population.
+
+        Returns:
+            The row index
+        """
+        if bridge.population is not None:
+            raise ValueError(f"Bridge {bridge.id} is already attached to a population")
+
+        row = int(self.add(1, seed_traits=bridge.personality.traits, ids=[bridge.id])[0])
+        self.bridges[row] = bridge
+        self.attached[row] = True
+
+        bridge.population = self
+        bridge.population_row = row
+
+        self.ticks[row] = bridge.clock.ticks
+        self.stage[row] = STAGES.index(bridge.maturity.current_stage)
+        self.consciousness[row] = bridge.state["consciousness_level"]
+        self.refresh(bridge)
+        return row
+
+    def refresh(self, bridge):
+        """
+        Re-read the state that changes on the object side
+
+        Insights, connections and the personality flags move with
+        per-object experience processing; advance() refreshes the flags
+        itself before each settlement check.
+        """
+        if bridge.population is not self:
+            raise ValueError(f"Bridge {bridge.id} is not attached to this population")
+
+        row = bridge.population_row
+        self.insights[row] = len(bridge.insights)
+        self.connections[row] = len(bridge.connections)
+        self.connection_strength[row] = bridge.connection_strength_total
+        self._refresh_personality(row, bridge)
+
+    def _refresh_personality(self, row: int, bridge):
+        self.is_forming[row] = bridge.personality.is_forming
+        self.is_settled[row] |= bridge.personality.is_settled
+        self.is_stable[row] = bridge.personality.is_stable()
+
+    def sync(self, bridge):
+        """Write the bridge's row back into the bridge object"""
+        row = bridge.population_row
+        ticks = int(self.ticks[row])
+
+        bridge.clock.advance_ticks(ticks - bridge.clock.ticks)
+        for trait in TRAITS:
+            setattr(bridge.personality.traits, trait, float(getattr(self, trait)[row]))
+
+        if self.is_settled[row] and not bridge.personality.is_settled:
+            bridge.personality.settle(ticks)
+
+        # Records a transition at the current tick if the stage moved on
+        bridge.maturity.update()
+
+        bridge.state["consciousness_level"] = float(self.consciousness[row])
+
+    def detach(self, bridge):
+        """Sync the bridge object and release its row"""
+        if bridge.population is not self:
+            raise ValueError(f"Bridge {bridge.id} is not attached to this population")
+
+        self.sync(bridge)
+        self.remove(bridge.population_row)
+
+        bridge.population = None
+        bridge.population_row = None
+
+    # ---------- Growth ----------
+
+    def record_insights(self, rows, counts=1):
+        """Add insights to rows (e.g. from per-object experience processing)"""
+        np.add.at(self.insights, rows, counts)
+        self._update_consciousness(rows)
+
+    def advance(self, n_ticks: int = 1):
+        """Advance every row by n_ticks"""
+        if n_ticks <= 0 or self.size == 0:
+            return
+
+        n = self.size
+        ticks = self.ticks[:n]
+        before = ticks.copy()
+        ticks += n_ticks
+
+        # Personality drift, once per 100-tick boundary crossed
+        boundaries = ticks // 100 - before // 100
+        for i in range(int(boundaries.max())):
+            rows = np.nonzero(boundaries > i)[0]
+            self._evolve_slightly(rows)
+
+        # Settlement, checked on 500-tick boundaries (with fresh
+        # personality flags for object bridges)
+        crossed = ticks // 500 > before // 500
+        for row in np.nonzero(crossed & self.attached[:n])[0]:
+            self._refresh_personality(row, self.bridges[row])
+        settle = crossed & self.is_stable[:n] & self.is_forming[:n] & ~self.is_settled[:n]
+        self.is_settled[:n] |= settle
+
+        self.stage[:n] = np.searchsorted(STAGE_THRESHOLDS, ticks, side='right')
+
+        self._update_consciousness(slice(0, n))
+
+    def _evolve_slightly(self, rows: np.ndarray):
+        """Vectorised PersonalityCore.evolve_slightly()"""
+        drift = np.where(
+            self.is_settled[rows], 0.001,
+            np.where(self.is_forming[rows], 0.01, 0.005)
+        )
+
+        for trait in TRAITS:
+            column = getattr(self, trait)
+            change = self.rng.uniform(-1.0, 1.0, len(rows)) * drift
+            column[rows] = np.clip(column[rows] + change, 0.0, 1.0)
+
+    def _update_consciousness(self, rows):
+        """Vectorised ConsciousnessEngine.calculate_consciousness()"""
+        maturity = MATURITY_SCORES[self.stage[rows]]
+
+        experience = np.minimum(1.0, np.log(self.insights[rows] + 1) / math.log(101))
+
+        personality = np.where(
+            ~self.is_forming[rows], 0.2,
+            np.where(self.is_settled[rows], 1.0, 0.6)
+        )
+
+        count = self.connections[rows]
+        safe_count = np.maximum(count, 1)
+        connections = np.where(
+            count > 0,
+            np.minimum(1.0, count / 10) * 0.5 + (self.connection_strength[rows] / safe_count) * 0.5,
+            0.0
+        )
+
+        consciousness = (
+            maturity * WEIGHTS["maturity"] +
+            experience * WEIGHTS["experience"] +
+            personality * WEIGHTS["personality"] +
+            connections * WEIGHTS["connections"]
+        )
+        self.consciousness[rows] = np.round(np.minimum(1.0, consciousness), 3)
+
+    # ---------- Reporting ----------
+
+    def get_stats(self) -> Dict:
+        """Get population statistics"""
+        n = self.size
+        stages = np.bincount(self.stage[:n], minlength=len(STAGES))
+
+        return {
+            "size": n,
+            "capacity": self.capacity,
+            "total_ticks": int(self.ticks[:n].sum()),
+            "by_maturity": {stage.value: int(stages[i]) for i, stage in enumerate(STAGES)},
+            "average_consciousness": round(float(self.consciousness[:n].mean()), 3) if n else 0.0,
+            "total_insights": int(self.insights[:n].sum())
+        }
@@ -0,0 +1,564 @@
+"""
+Bridge Snapshots
+Compact, versioned binary snapshots of a ConsciousBridgeReloaded
+
+Layout (little-endian):
+
+    header   MAGIC (8s) | version (H) | section count (H)
+    table    per section: name (16s) | offset (Q) | length (Q) | count (I)
+    sections per section: (count + 1) offsets (Q) | count compact JSON records
+
+Record offsets are relative to the end of the offsets array, so a record
+is read straight out of the mmap'd file through a memoryview. The large
+lists (experiences, insights, dialogues) are restored as LazyRecordList
+and only decoded when accessed; the file stays mapped until they are
+released with close_snapshot().
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from collections.abc import MutableSequence
+from datetime import datetime
+import json
+import math
+import mmap
+import struct
+
+from .experience_processor import Experience, ExperienceType
+from .personality_core import PersonalityTraits, PersonalitySnapshot
+from .maturity_system import MaturityStage, MaturityTransition, StageMilestone
+from .internal_clock import EventType, SignificantEvent
+
+
+MAGIC = b"CBRSNAP\0"
+VERSION = 1
+
+HEADER = struct.Struct('<8sHH')
+SECTION = struct.Struct('<16sQQI')
+OFFSET = struct.Struct('<Q')
+BOUNDS = struct.Struct('<QQ')
+
+LAZY_SECTIONS = ("experiences", "insights", "dialogues")
+
+
+# ---------- Record codecs ----------
+
+def _dt(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _parse_dt(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _encode_experience(experience: Experience) -> Dict:
+    return {
+        "type": experience.type.value,
+        "complexity": experience.complexity,
+        "content": experience.content,
+        "timestamp": _dt(experience.timestamp),
+        "processed": experience.processed,
+        "insight_generated": experience.insight_generated
+    }
+
+
+def _decode_experience(data: Dict) -> Experience:
+    return Experience(
+        type=ExperienceType(data["type"]),
+        complexity=data["complexity"],
+        content=data["content"],
+        timestamp=_parse_dt(data["timestamp"]),
+        processed=data["processed"],
+        insight_generated=data["insight_generated"]
+    )
+
+
+def _encode_experience_record(record: Dict) -> Dict:
+    return {
+        **record,
+        "experience": _encode_experience(record["experience"]),
+        "timestamp": _dt(record["timestamp"])
+    }
+
+
+def _decode_experience_record(data: Dict) -> Dict:
+    data["experience"] = _decode_experience(data["experience"])
+    data["timestamp"] = _parse_dt(data["timestamp"])
+    return data
+
+
+def _encode_timestamped(key: str) -> Callable[[Dict], Dict]:
+    return lambda record: {**record, key: _dt(record.get(key))}
+
+
+def _decode_timestamped(key: str) -> Callable[[Dict], Dict]:
+    def decode(data: Dict) -> Dict:
+        data[key] = _parse_dt(data.get(key))
+        return data
+    return decode
+
+
+def _encode_traits(traits: PersonalityTraits) -> Dict:
+    return {
+        "openness": traits.openness,
+        "stability": traits.stability,
+        "curiosity": traits.curiosity,
+        "collaboration": traits.collaboration
+    }
+
+
+def _encode_personality_snapshot(snapshot: PersonalitySnapshot) -> Dict:
+    return {
+        "tick": snapshot.tick,
+        "traits": _encode_traits(snapshot.traits),
+        "timestamp": _dt(snapshot.timestamp),
+        "notes": snapshot.notes
+    }
+
+
+def _decode_personality_snapshot(data: Dict) -> PersonalitySnapshot:
+    return PersonalitySnapshot(
+        tick=data["tick"],
+        traits=PersonalityTraits(**data["traits"]),
+        timestamp=_parse_dt(data["timestamp"]),
+        notes=data["notes"]
+    )
+
+
+def _encode_transition(transition: MaturityTransition) -> Dict:
+    return {
+        "from_stage": transition.from_stage.value,
+        "to_stage": transition.to_stage.value,
+        "tick": transition.tick,
+        "timestamp": _dt(transition.timestamp),
+        "readiness_score": transition.readiness_score,
+        "notes": transition.notes
+    }
+
+
+def _decode_transition(data: Dict) -> MaturityTransition:
+    return MaturityTransition(
+        from_stage=MaturityStage(data["from_stage"]),
+        to_stage=MaturityStage(data["to_stage"]),
+        tick=data["tick"],
+        timestamp=_parse_dt(data["timestamp"]),
+        readiness_score=data["readiness_score"],
+        notes=data["notes"]
+    )
+
+
+def _encode_milestone(milestone: StageMilestone) -> Dict:
+    return {
+        "name": milestone.name,
+        "description": milestone.description,
+        "criteria": milestone.criteria,
+        "achieved": milestone.achieved,
+        "achieved_at": _dt(milestone.achieved_at),
+        "achieved_at_tick": milestone.achieved_at_tick
+    }
+
+
+def _decode_milestone(data: Dict) -> StageMilestone:
+    data["achieved_at"] = _parse_dt(data["achieved_at"])
+    return StageMilestone(**data)
+
+
+def _decode_significant_event(data: Dict) -> SignificantEvent:
+    return SignificantEvent(
+        tick=data["tick"],
+        event_type=EventType(data["type"]),
+        significance=data["significance"],
+        description=data["description"],
+        metadata=data["metadata"]
+    )
+
+
+# ---------- Sections ----------
+
+def _dumps(record: Any) -> bytes:
+    return json.dumps(record, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def encode_section(records: Iterable[Any]) -> tuple:
+    """Encode records into (section bytes, record count)"""
+    payloads = [_dumps(record) for record in records]
+
+    offsets = [0]
+    for payload in payloads:
+        offsets.append(offsets[-1] + len(payload))
+
+    body = struct.pack(f'<{len(offsets)}Q', *offsets) + b''.join(payloads)
+    return body, len(payloads)
+
+
+def write_sections(path: str, sections: Dict[str, Iterable[Any]]):
+    """Write named record sections to a snapshot file"""
+    encoded = [(name, *encode_section(records)) for name, records in sections.items()]
+
+    for name, _, _ in encoded:
+        if len(name) > 16:
+            raise ValueError(f"Section name too long: {name}")
+
+    offset = HEADER.size + SECTION.size * len(encoded)
+    table = []
+    for name, body, count in encoded:
+        table.append(SECTION.pack(name.encode('ascii'), offset, len(body), count))
+        offset += len(body)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(encoded)))
+        f.write(b''.join(table))
+        for _, body, _ in encoded:
+            f.write(body)
+
+
+class RecordSection:
+    """Read-only view of one record section (no copies until decoded)"""
+
+    def __init__(self, buffer: memoryview, offset: int, length: int, count: int):
+        self.count = count
+        index_size = OFFSET.size * (count + 1)
+        self._offsets = buffer[offset:offset + index_size]
+        self._data = buffer[offset + index_size:offset + length]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def raw(self, i: int) -> memoryview:
+        """Encoded bytes of record i"""
+        if not 0 <= i < self.count:
+            raise IndexError("record index out of range")
+        start, end = BOUNDS.unpack_from(self._offsets, OFFSET.size * i)
+        return self._data[start:end]
+
+    def decode(self, i: int) -> Any:
+        return json.loads(bytes(self.raw(i)))
+
+    def release(self):
+        """Drop the views into the mapped file"""
+        self._offsets.release()
+        self._data.release()
+
+
+class SnapshotSections(dict):
+    """
+    The sections of a mapped snapshot file, by name
+
+    close() (or leaving a with block) unmaps the file; the sections can't
+    be read afterwards.
+    """
+
+    def __init__(self, mapped: mmap.mmap, buffer: memoryview):
+        super().__init__()
+        self._mapped = mapped
+        self._buffer = buffer
+
+    def close(self):
+        if self._mapped is None:
+            return
+        for section in self.values():
+            section.release()
+        self._buffer.release()
+        self._mapped.close()
+        self._mapped = None
+
+    def __enter__(self) -> 'SnapshotSections':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def read_sections(path: str) -> SnapshotSections:
+    """Map a snapshot file and return its sections"""
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    buffer = memoryview(mapped)
+    sections = SnapshotSections(mapped, buffer)
+    try:
+        magic, version, section_count = HEADER.unpack_from(buffer, 0)
+
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a bridge snapshot")
+        if version > VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+
+        for i in range(section_count):
+            name, offset, length, count = SECTION.unpack_from(buffer, HEADER.size + SECTION.size * i)
+            sections[name.rstrip(b'\0').decode('ascii')] = RecordSection(buffer, offset, length, count)
+    except Exception:
+        sections.close()
+        raise
+
+    return sections
+
+
+def is_snapshot(path: str) -> bool:
+    """Check whether a file is a binary snapshot"""
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class LazyRecordList(MutableSequence):
+    """
+    List backed by a record section
+
+    Records are decoded on first access and cached. Appends go to an
+    in-memory tail; any other mutation materializes the whole list.
+    """
+
+    def __init__(self, section: RecordSection, decode: Callable[[Dict], Any],
+                 sections: Optional[SnapshotSections] = None):
+        self.sections = sections  # The mapped file the section belongs to
+        self._section = section
+        self._decode = decode
+        self._decoded: Dict[int, Any] = {}
+        self._tail: List[Any] = []
+        self._items: Optional[List[Any]] = None
+
+    def _materialize(self) -> List[Any]:
+        if self._items is None:
+            self._items = [self[i] for i in range(len(self))]
+            self._section = None
+            self._decoded = {}
+            self._tail = []
+        return self._items
+
+    def __len__(self) -> int:
+        if self._items is not None:
+            return len(self._items)
+        return len(self._section) + len(self._tail)
+
+    def __getitem__(self, index):
+        if self._items is not None:
+            return self._items[index]
+
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("list index out of range")
+
+        stored = len(self._section)
+        if index >= stored:
+            return self._tail[index - stored]
+
+        if index not in self._decoded:
+            self._decoded[index] = self._decode(self._section.decode(index))
+        return self._decoded[index]
+
+    def __setitem__(self, index, value):
+        self._materialize()[index] = value
+
+    def __delitem__(self, index):
+        del self._materialize()[index]
+
+    def insert(self, index, value):
+        if self._items is None and index >= len(self):
+            self._tail.append(value)
+        else:
+            self._materialize().insert(index, value)
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, LazyRecordList)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    @property
+    def is_mapped(self) -> bool:
+        """Whether records are still read from the snapshot file"""
+        return self._items is None
+
+    def detach(self) -> List[Any]:
+        """Decode every record so the list no longer needs the file"""
+        return self._materialize()
+
+    def __repr__(self) -> str:
+        return f"LazyRecordList(len={len(self)})"
+
+
+# ---------- Bridge snapshots ----------
+
+def save_snapshot(bridge, path: str):
+    """Write a full-fidelity binary snapshot of a bridge"""
+    clock = bridge.clock
+    personality = bridge.personality
+
+    meta = {
+        "metadata": {
+            "id": bridge.metadata.id,
+            "name": bridge.metadata.name,
+            "type": bridge.metadata.type,
+            "version": bridge.metadata.version,
+            "description": bridge.metadata.description,
+            "created_at": _dt(bridge.metadata.created_at)
+        },
+        "clock": {
+            "ticks": clock.ticks,
+            "internal_time": clock.internal_time,
+            "time_dilation": clock.time_dilation,
+            "heartbeat_count": clock.heartbeat_count,
+            "awareness_level": clock.awareness_level,
+            "focus_intensity": clock.focus_intensity,
+            "memory_depth": clock.memory_depth,
+            "stats": clock.stats,
+            "evicted_events": clock.temporal_events.evicted
+        },
+        "personality": {
+            "traits": _encode_traits(personality.traits),
+            "is_forming": personality.is_forming,
+            "is_settled": personality.is_settled,
+            "influences": personality.influences
+        },
+        "maturity": {
+            "current_stage": bridge.maturity.current_stage.value
+        },
+        "state": {**bridge.state, "processing_queue": []},
+        "connections": {
+            bridge_id: _encode_timestamped("last_interaction")(connection)
+            for bridge_id, connection in bridge.connections.items()
+        },
+        "transformations": bridge.transformations
+    }
+
+    write_sections(path, {
+        "meta": [meta],
+        "history": map(_encode_personality_snapshot, personality.history),
+        "transitions": map(_encode_transition, bridge.maturity.transitions),
+        "milestones": map(_encode_milestone, bridge.maturity.milestones),
+        "queue": map(_encode_experience, bridge.experience_processor.processing_queue),
+        "experiences": map(_encode_experience_record, bridge.experiences),
+        "insights": map(_encode_timestamped("timestamp"), bridge.insights),
+        "dialogues": map(_encode_timestamped("started_at"), bridge.dialogue_history),
+        "temporal": clock.temporal_events.recent(len(clock.temporal_events)),
+        "events": (event.to_dict() for event in clock.significant_events)
+    })
+
+
+def load_snapshot(bridge_cls, path: str, lazy: bool = True, **bridge_options):
+    """
+    Restore a bridge from a binary snapshot
+
+    Args:
+        bridge_cls: The bridge class to instantiate
+        path: Snapshot file
+        lazy: Decode experiences, insights and dialogues on access (the
+              file stays mapped until close_snapshot())
+        **bridge_options: Passed to bridge_cls (e.g. scheduler, time_source)
+    """
+    sections = read_sections(path)
+    try:
+        bridge = _restore(bridge_cls, sections, lazy, bridge_options)
+    except Exception:
+        sections.close()
+        raise
+
+    if not lazy:
+        sections.close()
+    return bridge
+
+
+def close_snapshot(bridge):
+    """Decode whatever is still lazily mapped and unmap the snapshot file"""
+    sections = None
+    for records in (bridge.experiences, bridge.insights, bridge.dialogue_history):
+        if isinstance(records, LazyRecordList):
+            sections = sections or records.sections
+            records.detach()
+    if sections is not None:
+        sections.close()
+
+
+def _restore(bridge_cls, sections: SnapshotSections, lazy: bool, bridge_options: Dict):
+    meta = sections["meta"].decode(0)
+
+    metadata = meta["metadata"]
+    bridge = bridge_cls(
+        bridge_id=metadata["id"],
+        name=metadata["name"],
+        bridge_type=metadata["type"],
+        description=metadata["description"],
+        seed_personality=PersonalityTraits(**meta["personality"]["traits"]),
+        **bridge_options
+    )
+    bridge.metadata.version = metadata["version"]
+    bridge.metadata.created_at = _parse_dt(metadata["created_at"])
+
+    # Clock
+    clock = bridge.clock
+    clock_meta = dict(meta["clock"])
+    evicted = clock_meta.pop("evicted_events", 0)
+    for key, value in clock_meta.items():
+        setattr(clock, key, value)
+
+    temporal = sections.get("temporal")
+    for i in range(len(temporal) if temporal else 0):
+        event = temporal.decode(i)
+        data = event["data"]
+        clock.temporal_events.append(
+            event["type"], event["intensity"], event["internal_time"], event["external_time"],
+            data.get("clarity", math.nan), data.get("novelty", math.nan)
+        )
+    clock.temporal_events.evicted += evicted
+
+    events = sections.get("events")
+    clock.significant_events = [
+        _decode_significant_event(events.decode(i))
+        for i in range(len(events) if events else 0)
+    ]
+
+    # Personality
+    personality = bridge.personality
+    personality.is_forming = meta["personality"]["is_forming"]
+    personality.is_settled = meta["personality"]["is_settled"]
+    personality.influences = meta["personality"]["influences"]
+    personality.history = [
+        _decode_personality_snapshot(sections["history"].decode(i))
+        for i in range(len(sections["history"]))
+    ]
+
+    # Maturity
+    maturity = bridge.maturity
+    maturity.current_stage = MaturityStage(meta["maturity"]["current_stage"])
+    maturity.transitions = [
+        _decode_transition(sections["transitions"].decode(i))
+        for i in range(len(sections["transitions"]))
+    ]
+    maturity.milestones = [
+        _decode_milestone(sections["milestones"].decode(i))
+        for i in range(len(sections["milestones"]))
+    ]
+
+    # Pending experiences
+    for i in range(len(sections["queue"])):
+        bridge.experience_processor.add_experience(_decode_experience(sections["queue"].decode(i)))
+
+    # Memory
+    decoders = {
+        "experiences": _decode_experience_record,
+        "insights": _decode_timestamped("timestamp"),
+        "dialogues": _decode_timestamped("started_at")
+    }
+    memory = {}
+    for name in LAZY_SECTIONS:
+        records = LazyRecordList(sections[name], decoders[name], sections)
+        memory[name] = records if lazy else list(records)
+
+    bridge.experiences = memory["experiences"]
+    bridge.insights = memory["insights"]
+    bridge.dialogue_history = memory["dialogues"]
+    bridge.transformations = meta["transformations"]
+
+    # Connections
+    bridge.connections = {
+        bridge_id: _decode_timestamped("last_interaction")(connection)
+        for bridge_id, connection in meta["connections"].items()
+    }
+    bridge.connection_strength_total = sum(c["strength"] for c in bridge.connections.values())
+
+    bridge.state.update(meta["state"])
+    bridge.state["processing_queue"] = []
+
+    return bridge
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Storage benchmarks for the bridge repository
+
+    python scripts/benchmark_storage.py save --rounds 20 --per-round 500
+
+`save` grows one bridge's history round by round and times each save;
+with incremental persistence the cost stays flat as history grows.
+`reads` times find_by_id lookups on the pooled connections.
+`stats` compares get_statistics() from the trigger-maintained summary
+with a full GROUP BY aggregate.
+`export` compares peak memory of find_all() with streaming iter_all().
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.bridge_reloaded import BridgeMetadata
+from core.experience_processor import Experience, ExperienceType
+from core.personality_core import PersonalityTraits
+from storage import Database, BridgeRepository
+
+
+def make_bridge(bridge_id: str) -> SimpleNamespace:
+    """A stand-in with the attributes BridgeRepository.save reads"""
+    return SimpleNamespace(
+        metadata=BridgeMetadata(id=bridge_id, name=f"Bench {bridge_id}"),
+        consciousness_engine=SimpleNamespace(calculate_consciousness=lambda bridge: 0.5),
+        state={"is_active": True},
+        clock=SimpleNamespace(ticks=0, significant_events=[]),
+        maturity=SimpleNamespace(get_level=lambda: "nascent"),
+        personality=SimpleNamespace(traits=PersonalityTraits(), is_forming=False, is_settled=False),
+        experiences=[],
+        insights=[],
+        connections={}
+    )
+
+
+def grow(bridge: SimpleNamespace, n: int):
+    """Append n experiences, insights and clock events"""
+    for _ in range(n):
+        bridge.clock.ticks += 1
+        tick = bridge.clock.ticks
+        bridge.experiences.append({
+            "tick": tick,
+            "experience": Experience(type=ExperienceType.OBSERVATION, complexity=0.5, content={"tick": tick}),
+            "processed": False
+        })
+        bridge.insights.append({
+            "tick": tick, "type": "observation", "significance": 0.6, "description": f"Insight {tick}"
+        })
+        bridge.clock.significant_events.append(SimpleNamespace(
+            tick=tick, event_type=SimpleNamespace(value="insight"), significance=0.6,
+            description=f"Event {tick}", metadata={}
+        ))
+
+
+def bench_save(rounds: int, per_round: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Database(os.path.join(tmp, "bench.db"))
+        database.initialize_schema()
+        repository = BridgeRepository(database)
+        bridge = make_bridge("bridge_bench")
+
+        print(f"💾 save(): {per_round} new records per history per round")
+        print(f"{'round':>6} {'history':>9} {'save ms':>9}")
+        for round_number in range(1, rounds + 1):
+            grow(bridge, per_round)
+            started = time.perf_counter()
+            repository.save(bridge)
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"{round_number:>6} {len(bridge.experiences):>9} {elapsed:>9.2f}")
+
+
+def bench_reads(bridges: int, lookups: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Database(os.path.join(tmp, "bench.db"))
+        database.initialize_schema()
+        repository = BridgeRepository(database)
+        ids = [f"bridge_{i}" for i in range(bridges)]
+        for bridge_id in ids:
+            repository.save(make_bridge(bridge_id))
+
+        started = time.perf_counter()
+        for i in range(lookups):
+            repository.find_by_id(ids[i % bridges])
+        elapsed = time.perf_counter() - started
+        print(f"🔎 find_by_id(): {lookups} lookups over {bridges} bridges")
+        print(f"   {elapsed / lookups * 1e6:.1f} µs per lookup ({lookups / elapsed:,.0f}/s)")
+
+
+def bench_stats(bridges: int, repeats: int):
+    levels = ("nascent", "forming", "maturing", "mature")
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Database(os.path.join(tmp, "bench.db"))
+        database.initialize_schema()
+        repository = BridgeRepository(database, cache_statistics=False)
+        for i in range(bridges):
+            bridge = make_bridge(f"bridge_{i}")
+            level = levels[i % len(levels)]
+            bridge.maturity = SimpleNamespace(get_level=lambda level=level: level)
+            repository.save(bridge)
+
+        print(f"📊 get_statistics(): {bridges} bridges, {repeats} calls each")
+        for label, exact in (("summary table", False), ("GROUP BY scan", True)):
+            started = time.perf_counter()
+            for _ in range(repeats):
+                repository.get_statistics(exact=exact)
+            elapsed = (time.perf_counter() - started) / repeats * 1000
+            print(f"   {label:<14} {elapsed:8.3f} ms")
+
+
+def bench_export(bridges: int, batch_size: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Database(os.path.join(tmp, "bench.db"))
+        database.initialize_schema()
+        repository = BridgeRepository(database)
+        with database:
+            for i in range(bridges):
+                repository.save(make_bridge(f"bridge_{i}"))
+
+        print(f"📦 Export of {bridges} bridges (peak Python memory)")
+        exports = (
+            ("find_all()", lambda: repository.find_all()),
+            ("iter_all() dicts", lambda: repository.iter_all(batch_size=batch_size)),
+            ("iter_all() tuples", lambda: repository.iter_all(batch_size=batch_size, row_format="tuple"))
+        )
+        for label, export in exports:
+            tracemalloc.start()
+            started = time.perf_counter()
+            exported = sum(1 for _ in export())
+            elapsed = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"   {label:<18} {exported} rows  {peak / 1024 / 1024:8.2f} MB  {elapsed:6.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bridge storage benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    save = commands.add_parser("save", help="Save cost as one bridge's history grows")
+    save.add_argument("--rounds", type=int, default=20)
+    save.add_argument("--per-round", type=int, default=500)
+
+    reads = commands.add_parser("reads", help="Point lookups by id")
+    reads.add_argument("--bridges", type=int, default=1000)
+    reads.add_argument("--lookups", type=int, default=20000)
+
+    stats = commands.add_parser("stats", help="Aggregate statistics")
+    stats.add_argument("--bridges", type=int, default=20000)
+    stats.add_argument("--repeats", type=int, default=50)
+
+    export = commands.add_parser("export", help="Memory of a full-table export")
+    export.add_argument("--bridges", type=int, default=20000)
+    export.add_argument("--batch-size", type=int, default=500)
+
+    args = parser.parse_args()
+    if args.command == "save":
+        bench_save(args.rounds, args.per_round)
+    elif args.command == "reads":
+        bench_reads(args.bridges, args.lookups)
+    elif args.command == "stats":
+        bench_stats(args.bridges, args.repeats)
+    elif args.command == "export":
+        bench_export(args.bridges, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,28 +2,65 @@
 Repository for bridge CRUD operations
 """
 
-from typing import List, Optional, Dict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from collections import namedtuple
 import json
 from datetime import datetime
 
 from .database import Database
 from core.bridge_reloaded import ConsciousBridgeReloaded, BridgeMetadata
 from core.personality_core import PersonalityTraits
-from core.consciousness_engine import ConsciousnessEngine
+
+
+# History tables saved incrementally. A save cursor is (last stored tick,
+# rows stored at that tick), read from the table itself, so it follows the
+# bridge's clock rather than positions in its in-memory lists
+HISTORY_TABLES = ("clock_events", "experiences", "insights")
+
+MATURITY_LEVELS = ("nascent", "forming", "maturing", "mature")
+
+# Row shapes for the streaming iterators
+ROW_FORMATS = ("dict", "tuple", "namedtuple")
+DEFAULT_BATCH_SIZE = 500
+
+
+def _row_factory(row_format: str):
+    """Cursor row factory builder for Database.iterate"""
+    if row_format == "tuple":
+        return None
+    
+    def build(cursor):
+        names = [column[0] for column in cursor.description]
+        if row_format == "namedtuple":
+            make = namedtuple("BridgeRow", names)._make
+            return lambda cursor, row: make(row)
+        return lambda cursor, row: dict(zip(names, row))
+    return build
 
 
 class BridgeRepository:
     """Repository for managing bridges in database"""
     
-    def __init__(self, database: Database):
+    def __init__(self, database: Database, cache_statistics: bool = True):
         self.db = database
+        
+        # get_statistics() result, dropped by every write through this repository
+        self.cache_statistics = cache_statistics
+        self._statistics: Optional[Dict] = None
+        self._bridge_columns: Optional[List[str]] = None
     
     def save(self, bridge: ConsciousBridgeReloaded):
-        """Save a bridge to database"""
-        consciousness = ConsciousnessEngine.calculate_consciousness(bridge)
+        """
+        Save a bridge to database
+        
+        An upsert rather than INSERT OR REPLACE: the row is updated in
+        place, so the statistics triggers see an UPDATE (the implicit
+        delete of REPLACE fires no trigger).
+        """
+        consciousness = bridge.consciousness_engine.calculate_consciousness(bridge)
         
         query = """
-        INSERT OR REPLACE INTO bridges (
+        INSERT INTO bridges (
             id, name, type, description, created_at, version,
             is_active, internal_ticks, maturity_level, consciousness_level,
             trait_openness, trait_stability, trait_curiosity, trait_collaboration,
@@ -31,6 +68,27 @@ class BridgeRepository:
             experiences_count, insights_count, connections_count,
             metadata_json, state_json, updated_at
         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            name = excluded.name,
+            type = excluded.type,
+            description = excluded.description,
+            version = excluded.version,
+            is_active = excluded.is_active,
+            internal_ticks = excluded.internal_ticks,
+            maturity_level = excluded.maturity_level,
+            consciousness_level = excluded.consciousness_level,
+            trait_openness = excluded.trait_openness,
+            trait_stability = excluded.trait_stability,
+            trait_curiosity = excluded.trait_curiosity,
+            trait_collaboration = excluded.trait_collaboration,
+            personality_forming = excluded.personality_forming,
+            personality_settled = excluded.personality_settled,
+            experiences_count = excluded.experiences_count,
+            insights_count = excluded.insights_count,
+            connections_count = excluded.connections_count,
+            metadata_json = excluded.metadata_json,
+            state_json = excluded.state_json,
+            updated_at = excluded.updated_at
         """
         
         params = (
@@ -58,29 +116,72 @@ class BridgeRepository:
             datetime.now().isoformat()
         )
         
+        self._statistics = None
         with self.db:
             self.db.execute(query, params)
             
-            # Save clock events
-            self._save_clock_events(bridge)
-            
-            # Save experiences
-            self._save_experiences(bridge)
-            
-            # Save insights
-            self._save_insights(bridge)
+            # Append only what was added since the last save
+            cursors = self._load_cursors(bridge)
+            self._save_clock_events(bridge, cursors["clock_events"])
+            self._save_experiences(bridge, cursors["experiences"])
+            self._save_insights(bridge, cursors["insights"])
     
-    def _save_clock_events(self, bridge: ConsciousBridgeReloaded):
-        """Save clock events"""
+    def _load_cursors(self, bridge: ConsciousBridgeReloaded) -> Dict[str, Tuple[Optional[int], int]]:
+        """
+        (last stored tick, rows stored at that tick) of each history
+        
+        History stored past the bridge's clock belongs to an earlier
+        bridge with the same id (the row was re-created): it is removed
+        and the bridge's history is saved from the start.
+        """
+        bridge_id = bridge.metadata.id
+        cursors = {}
+        for table in HISTORY_TABLES:
+            row = self.db.fetch_one(f"""
+            SELECT tick, COUNT(*) FROM {table}
+            WHERE bridge_id = ? AND tick = (SELECT MAX(tick) FROM {table} WHERE bridge_id = ?)
+            """, (bridge_id, bridge_id))
+            cursors[table] = (row[0], row[1])
+        
+        if any(tick is not None and tick > bridge.clock.ticks for tick, _ in cursors.values()):
+            for table in HISTORY_TABLES:
+                self.db.execute(f"DELETE FROM {table} WHERE bridge_id = ?", (bridge_id,))
+            return dict.fromkeys(HISTORY_TABLES, (None, 0))
+        return cursors
+    
+    @staticmethod
+    def _unsaved(records: Sequence, tick_of, cursor: Tuple[Optional[int], int]) -> List:
+        """
+        Records after the cursor, oldest first
+        
+        Records are in tick order, so this walks back from the newest one
+        and stops at the cursor's tick: the cost follows what is new, not
+        the length of the history.
+        """
+        last_tick, stored_at_last = cursor
+        if last_tick is None:
+            return list(records)
+        
+        index = len(records)
+        while index > 0 and tick_of(records[index - 1]) > last_tick:
+            index -= 1
+        newer = index
+        while index > 0 and tick_of(records[index - 1]) == last_tick:
+            index -= 1
+        # Rows at the cursor's tick beyond those already stored
+        return list(records[min(newer, index + stored_at_last):])
+    
+    def _save_clock_events(self, bridge: ConsciousBridgeReloaded, cursor: Tuple[Optional[int], int]):
+        """Save clock events after the cursor"""
         query = """
         INSERT INTO clock_events (
             bridge_id, tick, event_type, significance, description, metadata_json
         ) VALUES (?, ?, ?, ?, ?, ?)
         """
         
-        # Only save new events (not already in DB)
-        for event in bridge.clock.significant_events:
-            params = (
+        events = self._unsaved(bridge.clock.significant_events, lambda event: event.tick, cursor)
+        self.db.execute_many(query, [
+            (
                 bridge.metadata.id,
                 event.tick,
                 event.event_type.value,
@@ -88,60 +189,55 @@ class BridgeRepository:
                 event.description,
                 json.dumps(event.metadata)
             )
-            try:
-                self.db.execute(query, params)
-            except sqlite3.IntegrityError:
-                pass  # Event already exists
+            for event in events
+        ])
     
-    def _save_experiences(self, bridge: ConsciousBridgeReloaded):
-        """Save experiences"""
+    def _save_experiences(self, bridge: ConsciousBridgeReloaded, cursor: Tuple[Optional[int], int]):
+        """Save experiences after the cursor"""
         query = """
         INSERT INTO experiences (
             bridge_id, tick, experience_type, complexity, content_json, processed
         ) VALUES (?, ?, ?, ?, ?, ?)
         """
         
-        for exp in bridge.experiences:
-            exp_data = exp["experience"]
-            params = (
+        experiences = self._unsaved(bridge.experiences, lambda exp: exp["tick"], cursor)
+        self.db.execute_many(query, [
+            (
                 bridge.metadata.id,
                 exp["tick"],
-                exp_data.get("type", "general"),
-                exp_data.get("complexity", 0.5),
-                json.dumps(exp_data.get("content", {})),
+                exp["experience"].type.value,
+                exp["experience"].complexity,
+                json.dumps(exp["experience"].content, default=str),
                 exp.get("processed", False)
             )
-            try:
-                self.db.execute(query, params)
-            except sqlite3.IntegrityError:
-                pass
+            for exp in experiences
+        ])
     
-    def _save_insights(self, bridge: ConsciousBridgeReloaded):
-        """Save insights"""
+    def _save_insights(self, bridge: ConsciousBridgeReloaded, cursor: Tuple[Optional[int], int]):
+        """Save insights after the cursor"""
         query = """
         INSERT INTO insights (
             bridge_id, tick, experience_type, significance, description
         ) VALUES (?, ?, ?, ?, ?)
         """
         
-        for insight in bridge.insights:
-            params = (
+        insights = self._unsaved(bridge.insights, lambda insight: insight["tick"], cursor)
+        self.db.execute_many(query, [
+            (
                 bridge.metadata.id,
                 insight["tick"],
                 insight["type"],
                 insight["significance"],
                 insight["description"]
             )
-            try:
-                self.db.execute(query, params)
-            except sqlite3.IntegrityError:
-                pass
+            for insight in insights
+        ])
     
     def find_by_id(self, bridge_id: str) -> Optional[Dict]:
         """Find a bridge by ID"""
         query = "SELECT * FROM bridges WHERE id = ?"
         
-        with self.db:
+        with self.db.reading():
             row = self.db.fetch_one(query, (bridge_id,))
             
         if row:
@@ -150,53 +246,155 @@ class BridgeRepository:
     
     def find_all(self) -> List[Dict]:
         """Find all bridges"""
-        query = "SELECT * FROM bridges ORDER BY created_at DESC"
-        
-        with self.db:
-            rows = self.db.fetch_all(query)
-            
-        return [dict(row) for row in rows]
+        return list(self.iter_all(descending=True))
     
     def find_by_maturity(self, maturity_level: str) -> List[Dict]:
         """Find bridges by maturity level"""
-        query = "SELECT * FROM bridges WHERE maturity_level = ?"
+        return list(self.iter_by_maturity(maturity_level))
+    
+    def iter_all(self, **options) -> Iterator:
+        """
+        Stream all bridges in (created_at, id) order
         
-        with self.db:
-            rows = self.db.fetch_all(query, (maturity_level,))
-            
-        return [dict(row) for row in rows]
+        Memory stays flat whatever the table size; see _iterate for options.
+        """
+        return self._iterate(None, **options)
     
-    def delete(self, bridge_id: str):
-        """Delete a bridge"""
-        query = "DELETE FROM bridges WHERE id = ?"
+    def iter_by_maturity(self, maturity_level: str, **options) -> Iterator:
+        """Stream the bridges of one maturity level in (created_at, id) order"""
+        return self._iterate(maturity_level, **options)
+    
+    def _iterate(
+        self,
+        maturity_level: Optional[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        after: Optional[Tuple[Any, str]] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+        columns: Optional[Sequence[str]] = None,
+        row_format: str = "dict"
+    ) -> Iterator:
+        """
+        Keyset-paged stream of bridge rows
         
+        Args:
+            batch_size: Rows fetched from SQLite at a time
+            after: (created_at, id) of the last row already seen; the
+                   stream continues just past it
+            limit: Stop after this many rows
+            descending: Newest first
+            columns: Columns to select (default: all)
+            row_format: "dict", "tuple" or "namedtuple"
+        
+        Raises:
+            ValueError: On an unknown row format or column name
+        """
+        if row_format not in ROW_FORMATS:
+            raise ValueError(f"row_format must be one of {', '.join(ROW_FORMATS)}")
+        if columns is not None:
+            unknown = [name for name in columns if name not in self._columns()]
+            if unknown:
+                raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+        
+        where, params = [], []
+        if maturity_level is not None:
+            where.append("maturity_level = ?")
+            params.append(maturity_level)
+        if after is not None:
+            where.append(f"(created_at, id) {'<' if descending else '>'} (?, ?)")
+            params.extend(after)
+        
+        direction = "DESC" if descending else "ASC"
+        query = f"""
+        SELECT {', '.join(columns) if columns else '*'} FROM bridges
+        {'WHERE ' + ' AND '.join(where) if where else ''}
+        ORDER BY created_at {direction}, id {direction}
+        """
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        return self.db.iterate(query, tuple(params), batch_size, _row_factory(row_format))
+    
+    def _columns(self) -> List[str]:
+        """Column names of the bridges table"""
+        if self._bridge_columns is None:
+            with self.db.reading():
+                rows = self.db.fetch_all("PRAGMA table_info(bridges)")
+            self._bridge_columns = [row["name"] for row in rows]
+        return self._bridge_columns
+    
+    def delete(self, bridge_id: str):
+        """Delete a bridge and its history"""
+        self._statistics = None
         with self.db:
-            self.db.execute(query, (bridge_id,))
+            self.db.execute("DELETE FROM bridges WHERE id = ?", (bridge_id,))
+            for table in HISTORY_TABLES:
+                self.db.execute(f"DELETE FROM {table} WHERE bridge_id = ?", (bridge_id,))
+    
+    def get_statistics(self, exact: bool = False) -> Dict:
+        """
+        Get overall statistics
+        
+        Read from the trigger-maintained bridge_statistics summary, so
+        the cost doesn't grow with the table, and cached until the next
+        write through this repository; exact=True aggregates the bridges
+        table itself instead.
+        """
+        if exact:
+            return self._build_statistics(self.compute_statistics())
+        
+        statistics = self._statistics
+        if statistics is None:
+            with self.db.reading():
+                rows = self.db.fetch_all(
+                    "SELECT maturity_level, count, total_consciousness, total_insights "
+                    "FROM bridge_statistics WHERE count > 0"
+                )
+            statistics = self._build_statistics(rows)
+            if self.cache_statistics:
+                self._statistics = statistics
+        return dict(statistics, by_maturity=dict(statistics["by_maturity"]))
     
-    def get_statistics(self) -> Dict:
-        """Get overall statistics"""
+    def compute_statistics(self) -> List:
+        """Per-stage aggregates in one pass over the covering index"""
+        with self.db.reading():
+            return self.db.fetch_all("""
+            SELECT maturity_level,
+                   COUNT(*) AS count,
+                   TOTAL(consciousness_level) AS total_consciousness,
+                   TOTAL(insights_count) AS total_insights
+            FROM bridges
+            GROUP BY maturity_level
+            """)
+    
+    def rebuild_statistics(self):
+        """Recompute the bridge_statistics summary from the bridges table"""
+        self._statistics = None
         with self.db:
-            total = self.db.fetch_one("SELECT COUNT(*) as count FROM bridges")[0]
-            
-            by_maturity = {}
-            for level in ["nascent", "forming", "maturing", "mature"]:
-                count = self.db.fetch_one(
-                    "SELECT COUNT(*) as count FROM bridges WHERE maturity_level = ?",
-                    (level,)
-                )[0]
-                by_maturity[level] = count
-            
-            avg_consciousness = self.db.fetch_one(
-                "SELECT AVG(consciousness_level) as avg FROM bridges"
-            )[0] or 0.0
-            
-            total_insights = self.db.fetch_one(
-                "SELECT SUM(insights_count) as total FROM bridges"
-            )[0] or 0
-            
+            self.db.execute("DELETE FROM bridge_statistics")
+            self.db.execute("""
+            INSERT INTO bridge_statistics (maturity_level, count, total_consciousness, total_insights)
+            SELECT maturity_level, COUNT(*), TOTAL(consciousness_level), TOTAL(insights_count)
+            FROM bridges
+            GROUP BY maturity_level
+            """)
+    
+    @staticmethod
+    def _build_statistics(rows) -> Dict:
+        by_maturity = dict.fromkeys(MATURITY_LEVELS, 0)
+        total = 0
+        total_consciousness = 0.0
+        total_insights = 0
+        for row in rows:
+            by_maturity[row["maturity_level"]] = row["count"]
+            total += row["count"]
+            total_consciousness += row["total_consciousness"]
+            total_insights += int(row["total_insights"])
+        
         return {
             "total_bridges": total,
             "by_maturity": by_maturity,
-            "average_consciousness": round(avg_consciousness, 3),
+            "average_consciousness": round(total_consciousness / total, 3) if total else 0.0,
             "total_insights": total_insights
-        }
\ No newline at end of file
+        }
@@ -1,31 +1,178 @@
 """
 Database connection and management
+
+Connections are opened once and reused. Every thread gets its own
+read-only connection, and all writes go through a single writer
+connection. In WAL mode readers work from a snapshot, so they never block
+the writer and the writer never blocks them.
 """
 
 import sqlite3
-from typing import Optional
+import threading
+from typing import Callable, Dict, Iterator, List, Optional
 from pathlib import Path
 import json
 
 
+# Defaults for the tunable pragmas
+DEFAULT_PRAGMAS = {
+    "synchronous": "NORMAL",      # Durable at checkpoints; safe with WAL
+    "cache_size": -65536,         # Negative: KiB, i.e. 64 MiB page cache
+    "mmap_size": 268435456,       # 256 MiB memory-mapped I/O
+    "temp_store": "MEMORY"
+}
+
+
 class Database:
-    """SQLite database manager"""
+    """
+    SQLite database manager with pooled connections
+    
+    Use `with db:` (or `with db.writing():`) around writes and
+    `with db.reading():` around reads; each scope is one transaction.
+    Scopes nest: an inner scope joins the outer transaction.
+    
+    Args:
+        db_path: Database file
+        cached_statements: Prepared statements kept per connection
+        busy_timeout: Milliseconds to wait for a lock before failing
+        **pragmas: Overrides for synchronous, cache_size, mmap_size, temp_store
+    """
     
-    def __init__(self, db_path: str = "conscious_bridges_reloaded.db"):
+    def __init__(self, db_path: str = "conscious_bridges_reloaded.db",
+                 cached_statements: int = 512, busy_timeout: int = 5000, **pragmas):
+        unknown = set(pragmas) - set(DEFAULT_PRAGMAS)
+        if unknown:
+            raise ValueError(f"Unknown pragmas: {', '.join(sorted(unknown))}")
+        
         self.db_path = db_path
-        self.connection: Optional[sqlite3.Connection] = None
+        self.cached_statements = cached_statements
+        self.busy_timeout = busy_timeout
+        self.pragmas = {**DEFAULT_PRAGMAS, **pragmas}
+        
+        # An in-memory database exists per connection, so it can't be split
+        self.shared = db_path == ":memory:" or db_path.startswith("file::memory:")
+        
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.RLock()
+        self._readers: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
+    
+    # ---------- Connections ----------
+    
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+            isolation_level=None  # Transactions are managed by the scopes
+        )
+        connection.row_factory = sqlite3.Row
         
+        connection.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout)}")
+        if not self.shared:
+            connection.execute("PRAGMA journal_mode = WAL")
+        for name, value in self.pragmas.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+        if read_only:
+            connection.execute("PRAGMA query_only = ON")
+        return connection
+    
     def connect(self):
-        """Connect to database"""
-        self.connection = sqlite3.connect(self.db_path)
-        self.connection.row_factory = sqlite3.Row
-        return self.connection
+        """Open the writer connection (idempotent)"""
+        with self._pool_lock:
+            if self._writer is None:
+                self._writer = self._open(read_only=False)
+            return self._writer
+    
+    def _reader(self) -> sqlite3.Connection:
+        """This thread's read connection"""
+        if self.shared:
+            return self.connect()
+        
+        connection = getattr(self._local, "reader", None)
+        if connection is None:
+            connection = self._open(read_only=True)
+            self._local.reader = connection
+            with self._pool_lock:
+                self._readers.append(connection)
+        return connection
     
     def close(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Close every pooled connection"""
+        with self._write_lock, self._pool_lock:
+            for connection in self._readers:
+                connection.close()
+            self._readers = []
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        # Other threads notice their closed reader on next use
+        self._local = threading.local()
+    
+    def get_pool_stats(self) -> Dict:
+        """Pool configuration and size"""
+        with self._pool_lock:
+            readers = len(self._readers)
+        return {
+            "readers": readers,
+            "writer_open": self._writer is not None,
+            "wal": not self.shared,
+            "cached_statements": self.cached_statements,
+            **self.pragmas
+        }
+    
+    # ---------- Transaction scopes ----------
+    
+    def _scopes(self) -> list:
+        scopes = getattr(self._local, "scopes", None)
+        if scopes is None:
+            scopes = self._local.scopes = []
+        return scopes
+    
+    def _begin(self, write: bool):
+        scopes = self._scopes()
+        if scopes:
+            outer_connection, outer_write = scopes[-1]
+            if write and not outer_write:
+                raise sqlite3.ProgrammingError("Cannot write inside a read scope")
+            scopes.append((outer_connection, outer_write))
+            return
+        
+        if write or self.shared:
+            self._write_lock.acquire()
+        try:
+            connection = self.connect() if write else self._reader()
+            # IMMEDIATE takes the write lock up front, so the transaction
+            # can't fail half-way with SQLITE_BUSY
+            connection.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+        except Exception:
+            if write or self.shared:
+                self._write_lock.release()
+            raise
+        scopes.append((connection, write))
+    
+    def _end(self, commit: bool):
+        scopes = self._scopes()
+        connection, write = scopes.pop()
+        if scopes:
+            return
+        
+        try:
+            connection.execute("COMMIT" if commit else "ROLLBACK")
+        finally:
+            if write or self.shared:
+                self._write_lock.release()
+    
+    def writing(self) -> '_Scope':
+        """Transaction on the writer connection"""
+        return _Scope(self, write=True)
+    
+    def reading(self) -> '_Scope':
+        """Consistent snapshot on this thread's read connection"""
+        return _Scope(self, write=False)
+    
+    # ---------- Schema ----------
     
     def initialize_schema(self):
         """Initialize database schema"""
@@ -34,42 +181,101 @@ class Database:
         with open(schema_path, 'r') as f:
             schema = f.read()
         
-        conn = self.connect()
-        conn.executescript(schema)
-        conn.commit()
-        self.close()
+        connection = self.connect()
+        with self._write_lock:
+            connection.executescript(schema)
+    
+    # ---------- Statements ----------
+    
+    def _connection(self, write: bool) -> sqlite3.Connection:
+        """The current scope's connection (outside a scope: autocommit)"""
+        scopes = self._scopes()
+        if scopes:
+            return scopes[-1][0]
+        return self.connect() if write else self._reader()
     
     def execute(self, query: str, params: tuple = ()):
         """Execute a query"""
-        if not self.connection:
-            self.connect()
-        
-        cursor = self.connection.cursor()
-        cursor.execute(query, params)
-        return cursor
+        if self._scopes():
+            return self._connection(write=True).execute(query, params)
+        with self._write_lock:
+            return self.connect().execute(query, params)
+    
+    def execute_many(self, query: str, params_seq):
+        """Execute a query once per parameter tuple"""
+        if self._scopes():
+            return self._connection(write=True).executemany(query, params_seq)
+        with self._write_lock:
+            return self.connect().executemany(query, params_seq)
     
     def fetch_one(self, query: str, params: tuple = ()):
         """Fetch one result"""
-        cursor = self.execute(query, params)
-        return cursor.fetchone()
+        return self._fetch(query, params, "fetchone")
     
     def fetch_all(self, query: str, params: tuple = ()):
         """Fetch all results"""
-        cursor = self.execute(query, params)
-        return cursor.fetchall()
+        return self._fetch(query, params, "fetchall")
+    
+    def _fetch(self, query: str, params: tuple, method: str):
+        if self.shared and not self._scopes():
+            with self._write_lock:
+                return getattr(self.connect().execute(query, params), method)()
+        return getattr(self._connection(write=False).execute(query, params), method)()
+    
+    def iterate(self, query: str, params: tuple = (), batch_size: int = 500,
+                row_factory: Optional[Callable] = None) -> Iterator:
+        """
+        Stream the results of a query, fetching batch_size rows at a time
+        
+        Runs on the current scope's connection, or this thread's reader.
+        Outside a scope the statement keeps its own snapshot until it is
+        exhausted, and writes in between are not blocked.
+        
+        Args:
+            row_factory: Called with the cursor once executed; returns the
+                         cursor row factory (None: plain tuples)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        cursor = self._connection(write=False).cursor()
+        try:
+            cursor.execute(query, params)
+            cursor.row_factory = row_factory(cursor) if row_factory else None
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
     
     def commit(self):
-        """Commit transaction"""
-        if self.connection:
-            self.connection.commit()
+        """Commit an unscoped transaction on the writer, if one is open"""
+        with self._write_lock:
+            if self._writer is not None and self._writer.in_transaction and not self._scopes():
+                self._writer.commit()
     
     def __enter__(self):
-        """Context manager entry"""
-        self.connect()
+        """Context manager entry (write transaction)"""
+        self._begin(write=True)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        if exc_type is None:
-            self.commit()
-        self.close()
\ No newline at end of file
+        self._end(commit=exc_type is None)
+
+
+class _Scope:
+    """Context manager for one (possibly nested) transaction scope"""
+    
+    def __init__(self, db: Database, write: bool):
+        self.db = db
+        self.write = write
+    
+    def __enter__(self) -> Database:
+        self.db._begin(self.write)
+        return self.db
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.db._end(commit=exc_type is None)
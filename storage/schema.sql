@@ -158,10 +158,70 @@ CREATE TABLE IF NOT EXISTS dialogue_messages (
 );
 
 -- Indexes for performance
-CREATE INDEX IF NOT EXISTS idx_bridges_maturity ON bridges(maturity_level);
+-- Covering index for the per-stage aggregates (and lookups by stage)
+DROP INDEX IF EXISTS idx_bridges_maturity;
+CREATE INDEX IF NOT EXISTS idx_bridges_statistics ON bridges(maturity_level, consciousness_level, insights_count);
 CREATE INDEX IF NOT EXISTS idx_bridges_consciousness ON bridges(consciousness_level);
+-- Keyset order of the streaming iterators
+CREATE INDEX IF NOT EXISTS idx_bridges_created ON bridges(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_bridges_maturity_created ON bridges(maturity_level, created_at, id);
 CREATE INDEX IF NOT EXISTS idx_clock_events_bridge ON clock_events(bridge_id, tick);
 CREATE INDEX IF NOT EXISTS idx_experiences_bridge ON experiences(bridge_id, tick);
 CREATE INDEX IF NOT EXISTS idx_insights_bridge ON insights(bridge_id, tick);
 CREATE INDEX IF NOT EXISTS idx_connections_bridges ON connections(bridge_id_1, bridge_id_2);
-CREATE INDEX IF NOT EXISTS idx_dialogues_bridges ON dialogues(bridge_id_1, bridge_id_2);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_dialogues_bridges ON dialogues(bridge_id_1, bridge_id_2);
+
+-- Statistics summary: one row per maturity level, kept in step with
+-- bridges by triggers so reading statistics never scans the table
+CREATE TABLE IF NOT EXISTS bridge_statistics (
+    maturity_level TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,
+    total_consciousness REAL NOT NULL DEFAULT 0.0,
+    total_insights INTEGER NOT NULL DEFAULT 0
+);
+
+-- Backfill once for databases created before the summary existed
+INSERT INTO bridge_statistics (maturity_level, count, total_consciousness, total_insights)
+SELECT maturity_level, COUNT(*), TOTAL(consciousness_level), TOTAL(insights_count)
+FROM bridges
+WHERE NOT EXISTS (SELECT 1 FROM bridge_statistics)
+GROUP BY maturity_level;
+
+CREATE TRIGGER IF NOT EXISTS bridge_statistics_insert AFTER INSERT ON bridges
+BEGIN
+    INSERT INTO bridge_statistics (maturity_level)
+    SELECT NEW.maturity_level
+    WHERE NOT EXISTS (SELECT 1 FROM bridge_statistics WHERE maturity_level = NEW.maturity_level);
+    UPDATE bridge_statistics SET
+        count = count + 1,
+        total_consciousness = total_consciousness + COALESCE(NEW.consciousness_level, 0),
+        total_insights = total_insights + COALESCE(NEW.insights_count, 0)
+    WHERE maturity_level = NEW.maturity_level;
+END;
+
+CREATE TRIGGER IF NOT EXISTS bridge_statistics_update
+AFTER UPDATE OF maturity_level, consciousness_level, insights_count ON bridges
+BEGIN
+    UPDATE bridge_statistics SET
+        count = count - 1,
+        total_consciousness = total_consciousness - COALESCE(OLD.consciousness_level, 0),
+        total_insights = total_insights - COALESCE(OLD.insights_count, 0)
+    WHERE maturity_level = OLD.maturity_level;
+    INSERT INTO bridge_statistics (maturity_level)
+    SELECT NEW.maturity_level
+    WHERE NOT EXISTS (SELECT 1 FROM bridge_statistics WHERE maturity_level = NEW.maturity_level);
+    UPDATE bridge_statistics SET
+        count = count + 1,
+        total_consciousness = total_consciousness + COALESCE(NEW.consciousness_level, 0),
+        total_insights = total_insights + COALESCE(NEW.insights_count, 0)
+    WHERE maturity_level = NEW.maturity_level;
+END;
+
+CREATE TRIGGER IF NOT EXISTS bridge_statistics_delete AFTER DELETE ON bridges
+BEGIN
+    UPDATE bridge_statistics SET
+        count = count - 1,
+        total_consciousness = total_consciousness - COALESCE(OLD.consciousness_level, 0),
+        total_insights = total_insights - COALESCE(OLD.insights_count, 0)
+    WHERE maturity_level = OLD.maturity_level;
+END;
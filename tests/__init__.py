@@ -7,7 +7,23 @@ __all__ = [
     'test_internal_clock',
     'test_personality', 
     'test_maturity',
-    'test_dialogue'
+    'test_dialogue',
+    'test_experience_processor',
+    'test_snapshot',
+    'test_write_behind',
+    'test_ingest',
+    'test_bridge_cache',
+    'test_pagination',
+    'test_response_cache',
+    'test_events',
+    'test_concurrency',
+    'test_sharding',
+    'test_autotick',
+    'test_history',
+    'test_bridge_repository',
+    'test_bridge_reloaded',
+    'test_population',
+    'test_server'
 ]
 
 __version__ = '1.0.0'
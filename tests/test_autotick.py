@@ -0,0 +1,143 @@
+"""
+Test the background auto-tick scheduler
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+def test_rates_and_classes():
+    """Test per-bridge and per-class rates, fractional carry-over and removal"""
+    from api.autotick import AutoTickScheduler
+    
+    clock = FakeClock()
+    delivered = {}
+    def advance_many(batch):
+        for bridge_id, ticks in batch.items():
+            delivered[bridge_id] = delivered.get(bridge_id, 0) + ticks
+        return ["gone"] if "gone" in batch else []
+    
+    scheduler = AutoTickScheduler(advance_many, interval=0.1, clock=clock)
+    scheduler.set_class_rate("fast", 50.0)
+    scheduler.register("slow", rate=2.5)
+    scheduler.register("classy", bridge_class="fast")
+    scheduler.register("gone", rate=10.0)
+    
+    scheduler.run_cycle()
+    for _ in range(40):
+        clock.now += 0.1
+        scheduler.run_cycle()
+    
+    # 4 seconds of simulated time
+    assert delivered["slow"] == 10
+    assert delivered["classy"] == 200
+    assert scheduler.registration("gone") is None
+    
+    stats = scheduler.get_stats()
+    assert stats["registered"] == 2 and stats["cycles"] == 41
+    assert stats["drift_ticks"] == 0
+    return True
+
+def test_backs_off_when_falling_behind():
+    """Test that slow cycles scale rates down (reported as drift) and recover"""
+    from api.autotick import AutoTickScheduler
+    
+    clock = FakeClock()
+    slow = {"cost": 0.2}
+    def advance_many(batch):
+        clock.now += slow["cost"]  # Work takes longer than the interval
+        return []
+    
+    scheduler = AutoTickScheduler(advance_many, interval=0.1, clock=clock)
+    scheduler.register("a", rate=100.0)
+    scheduler.run_cycle()
+    for _ in range(10):
+        clock.now += 0.1
+        scheduler.run_cycle()
+    
+    assert scheduler.scale < 0.5
+    assert scheduler.get_stats()["drift_ticks"] > 0
+    
+    slow["cost"] = 0.0
+    for _ in range(50):
+        clock.now += 0.1
+        scheduler.run_cycle()
+    assert scheduler.scale == 1.0
+    return True
+
+def test_background_thread():
+    """Test that the scheduler thread ticks on its own"""
+    import time
+    from api.autotick import AutoTickScheduler
+    
+    ticks = []
+    scheduler = AutoTickScheduler(lambda batch: ticks.extend(batch.values()), interval=0.01)
+    scheduler.register("a", rate=1000.0)
+    scheduler.start()
+    deadline = time.time() + 2.0
+    while sum(ticks) < 50 and time.time() < deadline:
+        time.sleep(0.01)
+    scheduler.stop()
+    
+    assert sum(ticks) >= 50
+    assert scheduler.get_stats()["running"] is False
+    return True
+
+def test_rejects_non_finite_rates():
+    """Test that nan and inf rates are refused like negative ones"""
+    from api.autotick import AutoTickScheduler
+    
+    scheduler = AutoTickScheduler(lambda batch: [], clock=FakeClock())
+    for rate in (float("nan"), float("inf"), -float("inf"), -1.0):
+        for call in (lambda: scheduler.register("a", rate=rate),
+                     lambda: scheduler.set_class_rate("fast", rate)):
+            try:
+                call()
+                assert False, f"rate {rate} accepted"
+            except ValueError:
+                pass
+    assert scheduler.registration("a") is None and scheduler.class_rates == {}
+    return True
+
+def test_thread_survives_failed_cycle():
+    """Test that an exception in a cycle is counted and the thread keeps going"""
+    import time
+    from api.autotick import AutoTickScheduler
+    
+    ticks = []
+    scheduler = AutoTickScheduler(lambda batch: ticks.extend(batch.values()), interval=0.01)
+    scheduler.register("a", rate=1000.0)
+    run_cycle = scheduler.run_cycle
+    failures = []
+    def flaky(now=None):
+        if len(failures) < 3:
+            failures.append(now)
+            raise ValueError("bad cycle")
+        return run_cycle(now)
+    scheduler.run_cycle = flaky
+    
+    scheduler.start()
+    deadline = time.time() + 2.0
+    while sum(ticks) < 50 and time.time() < deadline:
+        time.sleep(0.01)
+    alive = scheduler._thread.is_alive()
+    scheduler.stop()
+    
+    assert alive and sum(ticks) >= 50
+    assert scheduler.get_stats()["errors"] == 3
+    return True
+
+if __name__ == "__main__":
+    print("⏱️ Testing auto-tick scheduler...")
+    test_rates_and_classes() and print("✅ Rates and classes: PASS")
+    test_backs_off_when_falling_behind() and print("✅ Load shedding: PASS")
+    test_background_thread() and print("✅ Background thread: PASS")
+    test_rejects_non_finite_rates() and print("✅ Non-finite rates: PASS")
+    test_thread_survives_failed_cycle() and print("✅ Failed cycle: PASS")
+    print("🎉 Auto-tick tests completed")
@@ -0,0 +1,75 @@
+"""
+Test the hot bridge LRU cache
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+class FakeBridge:
+    def __init__(self, bridge_id):
+        self.id = bridge_id
+
+def test_lazy_load_and_lru_eviction():
+    """Test hydration on miss and least-recently-used eviction"""
+    from api.bridge_cache import BridgeCache
+    
+    stored = {f"bridge-{i}": FakeBridge(f"bridge-{i}") for i in range(5)}
+    evicted = []
+    cache = BridgeCache(stored.get, capacity=2, on_evict=evicted.append)
+    
+    assert len(cache) == 0
+    assert "missing" not in cache
+    assert cache["bridge-0"] is stored["bridge-0"]
+    assert cache.get("bridge-1") is stored["bridge-1"]
+    
+    # Touch bridge-0 so bridge-1 is the least recently used
+    assert "bridge-0" in cache
+    cache.get("bridge-2")
+    assert [b.id for b in evicted] == ["bridge-1"]
+    assert set(cache.hot()) == {"bridge-0", "bridge-2"}
+    
+    stats = cache.get_stats()
+    assert stats["loads"] == 3 and stats["evictions"] == 1 and stats["size"] == 2
+    return True
+
+def test_evicted_dirty_bridges_rehydrate_from_write_behind():
+    """Test that an evicted bridge with pending changes comes back unsaved"""
+    from api.bridge_cache import BridgeCache
+    from api.write_behind import WriteBehindPersistence
+    
+    saved = []
+    persistence = WriteBehindPersistence(saved.extend, durability="deferred")
+    
+    def load(bridge_id):
+        # A fresh object stands in for the (stale) database row
+        return persistence.get_pending(bridge_id) or FakeBridge(bridge_id)
+    
+    cache = BridgeCache(load, capacity=1)
+    
+    dirty = cache["dirty"]
+    persistence.mark_dirty(dirty)
+    cache["other"] = FakeBridge("other")
+    assert set(cache.hot()) == {"other"} and saved == []
+    
+    # Re-hydrated from the write-behind layer, not the database row
+    assert cache["dirty"] is dirty
+    persistence.flush()
+    assert saved == [dirty] and persistence.pending() == 0
+    return True
+
+if __name__ == "__main__":
+    print("🧪 Testing bridge cache...")
+    
+    try:
+        test_lazy_load_and_lru_eviction()
+        print("✅ Lazy load and LRU eviction test passed")
+        
+        test_evicted_dirty_bridges_rehydrate_from_write_behind()
+        print("✅ Eviction re-hydration test passed")
+        
+        print("\n🎉 All bridge cache tests passed!")
+        
+    except AssertionError as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
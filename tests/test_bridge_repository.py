@@ -0,0 +1,258 @@
+"""
+Test the storage bridge repository
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+def _make_bridge(bridge_id="bridge_test"):
+    """A stand-in with the attributes BridgeRepository.save reads"""
+    from types import SimpleNamespace
+    from core.bridge_reloaded import BridgeMetadata
+    from core.personality_core import PersonalityTraits
+    
+    return SimpleNamespace(
+        metadata=BridgeMetadata(id=bridge_id, name="Test Bridge"),
+        consciousness_engine=SimpleNamespace(calculate_consciousness=lambda bridge: 0.25),
+        state={"is_active": True},
+        clock=SimpleNamespace(ticks=0, significant_events=[]),
+        maturity=SimpleNamespace(get_level=lambda: "nascent"),
+        personality=SimpleNamespace(traits=PersonalityTraits(), is_forming=False, is_settled=False),
+        experiences=[],
+        insights=[],
+        connections={}
+    )
+
+def _grow(bridge, n):
+    """Append n experiences, insights and clock events"""
+    from types import SimpleNamespace
+    from core.experience_processor import Experience, ExperienceType
+    
+    for _ in range(n):
+        bridge.clock.ticks += 1
+        tick = bridge.clock.ticks
+        bridge.experiences.append({
+            "tick": tick,
+            "experience": Experience(type=ExperienceType.OBSERVATION, complexity=0.5, content={"n": tick}),
+            "processed": False
+        })
+        bridge.insights.append({"tick": tick, "type": "observation", "significance": 0.6, "description": f"insight {tick}"})
+        bridge.clock.significant_events.append(SimpleNamespace(
+            tick=tick, event_type=SimpleNamespace(value="insight"), significance=0.6,
+            description=f"event {tick}", metadata={}
+        ))
+
+def _make_repository(path):
+    from storage import Database, BridgeRepository
+    
+    database = Database(path)
+    database.initialize_schema()
+    return BridgeRepository(database)
+
+def _count(repository, table):
+    with repository.db.reading():
+        return repository.db.fetch_one(f"SELECT COUNT(*) FROM {table}")[0]
+
+def test_incremental_save():
+    """Test that repeated saves append only new history rows"""
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = _make_repository(os.path.join(tmp, "bridges.db"))
+        bridge = _make_bridge()
+        
+        _grow(bridge, 5)
+        repository.save(bridge)
+        repository.save(bridge)
+        _grow(bridge, 3)
+        repository.save(bridge)
+        
+        for table in ("experiences", "insights", "clock_events"):
+            assert _count(repository, table) == 8, table
+        
+        # Cursors come from the stored rows: a new repository continues where the old one stopped
+        repository = _make_repository(os.path.join(tmp, "bridges.db"))
+        _grow(bridge, 1)
+        repository.save(bridge)
+        assert _count(repository, "experiences") == 9
+        
+        # Cursors follow ticks, not list positions: trimming old records skips nothing,
+        # and records added at an already-saved tick are still saved
+        del bridge.experiences[:6]
+        latest = dict(bridge.experiences[-1])
+        bridge.experiences.append(latest)
+        _grow(bridge, 2)
+        repository.save(bridge)
+        assert _count(repository, "experiences") == 12
+        assert _count(repository, "insights") == 11
+        
+        repository.delete(bridge.metadata.id)
+        assert _count(repository, "experiences") == 0
+    return True
+
+def test_recreated_bridge_saves_its_history():
+    """Test that a new bridge reusing an id doesn't skip rows (or keep the old ones)"""
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = _make_repository(os.path.join(tmp, "bridges.db"))
+        old = _make_bridge()
+        _grow(old, 8)
+        repository.save(old)
+        
+        new = _make_bridge()
+        _grow(new, 3)
+        repository.save(new)
+        for table in ("experiences", "insights", "clock_events"):
+            assert _count(repository, table) == 3, table
+        with repository.db.reading():
+            ticks = repository.db.fetch_all("SELECT tick FROM experiences ORDER BY tick")
+        assert [row[0] for row in ticks] == [1, 2, 3]
+        
+        _grow(new, 2)
+        repository.save(new)
+        assert _count(repository, "experiences") == 5
+    return True
+
+def test_pooled_engine():
+    """Test WAL mode, pragmas, per-thread readers and scoped transactions"""
+    import tempfile
+    import threading
+    from storage import Database
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, "pool.db"), cache_size=-2048, cached_statements=64)
+        db.initialize_schema()
+        
+        with db.reading():
+            assert db.fetch_one("PRAGMA journal_mode")[0] == "wal"
+            assert db.fetch_one("PRAGMA cache_size")[0] == -2048
+            assert db.fetch_one("PRAGMA query_only")[0] == 1
+        
+        # Connections are reused, one reader per thread
+        assert db._reader() is db._reader()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(db._reader()))
+        thread.start()
+        thread.join()
+        assert other[0] is not db._reader()
+        assert db.get_pool_stats()["readers"] == 2
+        
+        # A failed scope (including nested ones) rolls back as a whole
+        try:
+            with db:
+                db.execute("INSERT INTO bridges (id, name, type) VALUES ('a', 'A', 't')")
+                with db.writing():
+                    db.execute("INSERT INTO bridges (id, name, type) VALUES ('b', 'B', 't')")
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+        assert db.fetch_one("SELECT COUNT(*) FROM bridges")[0] == 0
+        
+        # Readers see the last committed snapshot while a write is in progress
+        with db:
+            db.execute("INSERT INTO bridges (id, name, type) VALUES ('a', 'A', 't')")
+            seen = []
+            thread = threading.Thread(target=lambda: seen.append(db.fetch_one("SELECT COUNT(*) FROM bridges")[0]))
+            thread.start()
+            thread.join(timeout=5)
+            assert seen == [0]
+        assert db.fetch_one("SELECT COUNT(*) FROM bridges")[0] == 1
+
+        # commit() ends a transaction opened outside the scopes
+        db.commit()
+        db.execute("BEGIN")
+        db.execute("INSERT INTO bridges (id, name, type) VALUES ('c', 'C', 't')")
+        assert db.fetch_one("SELECT COUNT(*) FROM bridges")[0] == 1
+        db.commit()
+        assert not db.connect().in_transaction
+        assert db.fetch_one("SELECT COUNT(*) FROM bridges")[0] == 2
+        db.close()
+    return True
+
+def test_statistics():
+    """Test the trigger-maintained statistics against a full aggregate"""
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bridges.db")
+        repository = _make_repository(path)
+        
+        bridges = [_make_bridge(f"bridge_{i}") for i in range(6)]
+        for i, bridge in enumerate(bridges):
+            _grow(bridge, i)
+            repository.save(bridge)
+        
+        statistics = repository.get_statistics()
+        assert statistics["total_bridges"] == 6
+        assert statistics["by_maturity"] == {"nascent": 6, "forming": 0, "maturing": 0, "mature": 0}
+        assert statistics["total_insights"] == 15
+        
+        # Updates move a bridge between stages; deletes remove it
+        bridges[0].maturity = type(bridges[0].maturity)(get_level=lambda: "forming")
+        _grow(bridges[0], 4)
+        repository.save(bridges[0])
+        repository.delete(bridges[5].metadata.id)
+        
+        statistics = repository.get_statistics()
+        assert statistics == repository.get_statistics(exact=True)
+        assert statistics["by_maturity"]["forming"] == 1
+        assert statistics["total_bridges"] == 5 and statistics["total_insights"] == 14
+        
+        # The summary is backfilled for databases that predate it
+        with repository.db:
+            repository.db.execute("DROP TABLE bridge_statistics")
+            for trigger in ("insert", "update", "delete"):
+                repository.db.execute(f"DROP TRIGGER bridge_statistics_{trigger}")
+        repository = _make_repository(path)
+        assert repository.get_statistics() == statistics
+    return True
+
+def test_streaming_iterators():
+    """Test keyset-paged streaming in batches and the row formats"""
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = _make_repository(os.path.join(tmp, "bridges.db"))
+        for i in range(25):
+            bridge = _make_bridge(f"bridge_{i:02d}")
+            if i % 5 == 0:
+                bridge.maturity = type(bridge.maturity)(get_level=lambda: "forming")
+            repository.save(bridge)
+        
+        rows = list(repository.iter_all(batch_size=4))
+        assert len(rows) == 25 and isinstance(rows[0], dict)
+        keys = [(row["created_at"], row["id"]) for row in rows]
+        assert keys == sorted(keys)
+        
+        # Resume just past a row, in either direction
+        rest = list(repository.iter_all(after=keys[9], batch_size=3, columns=["id", "created_at"], row_format="tuple"))
+        assert [row[0] for row in rest] == [key[1] for key in keys[10:]]
+        newest = list(repository.iter_all(after=keys[20], descending=True, limit=2, row_format="namedtuple"))
+        assert [row.id for row in newest] == [keys[19][1], keys[18][1]]
+        
+        forming = [row.name for row in repository.iter_by_maturity("forming", columns=["name"], row_format="namedtuple")]
+        assert len(forming) == 5
+        assert len(repository.find_by_maturity("nascent")) == 20
+        
+        # Writes are not blocked while a stream is open
+        stream = repository.iter_all(batch_size=2)
+        next(stream)
+        repository.delete("bridge_24")
+        assert sum(1 for _ in stream) == 24
+        
+        try:
+            repository.iter_all(columns=["id; DROP TABLE bridges"])
+            assert False, "unknown column accepted"
+        except ValueError:
+            pass
+    return True
+
+if __name__ == "__main__":
+    print("🗄️ Testing bridge repository...")
+    test_incremental_save() and print("✅ Incremental save: PASS")
+    test_recreated_bridge_saves_its_history() and print("✅ Re-created bridge: PASS")
+    test_pooled_engine() and print("✅ Pooled engine: PASS")
+    test_statistics() and print("✅ Statistics: PASS")
+    test_streaming_iterators() and print("✅ Streaming iterators: PASS")
+    print("🎉 Repository tests completed")
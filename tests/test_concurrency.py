@@ -0,0 +1,101 @@
+"""
+Stress test for per-bridge lock striping
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+class CounterBridge:
+    """Bridge stand-in whose tick is a non-atomic read-modify-write"""
+    def __init__(self, bridge_id, ticks=0):
+        self.id = bridge_id
+        self.ticks = ticks
+    
+    def tick(self):
+        import time
+        ticks = self.ticks
+        time.sleep(0)  # Invite a thread switch mid-update
+        self.ticks = ticks + 1
+
+def test_no_lost_ticks_under_64_clients():
+    """Test that 64 concurrent clients lose no ticks, across cache evictions and flushes"""
+    import threading
+    from api.locks import LockStripes
+    from api.bridge_cache import BridgeCache
+    from api.write_behind import WriteBehindPersistence
+    
+    clients, ticks_per_client, bridge_count = 64, 200, 16
+    locks = LockStripes(8)
+    
+    # Fake database: saved tick counts, serialized under the stripe lock
+    stored = {f"bridge-{i}": 0 for i in range(bridge_count)}
+    def save_many(bridges):
+        for bridge in bridges:
+            with locks.hold(bridge.id):
+                stored[bridge.id] = bridge.ticks
+    
+    persistence = WriteBehindPersistence(save_many, flush_interval=0.005)
+    
+    def load(bridge_id):
+        pending = persistence.get_pending(bridge_id)
+        if pending is not None:
+            return pending
+        if bridge_id in stored:
+            return CounterBridge(bridge_id, stored[bridge_id])
+        return None
+    
+    # Small cache so bridges are evicted and re-hydrated constantly
+    cache = BridgeCache(load, capacity=4, locks=locks)
+    
+    def client(number):
+        for i in range(ticks_per_client):
+            bridge_id = f"bridge-{(number + i) % bridge_count}"
+            with cache.checkout(bridge_id) as bridge:
+                bridge.tick()
+                persistence.mark_dirty(bridge)
+    
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    persistence.close()
+    
+    expected = clients * ticks_per_client // bridge_count
+    assert sum(stored.values()) == clients * ticks_per_client
+    assert all(ticks == expected for ticks in stored.values()), stored
+    assert cache.get_stats()["evictions"] > 0
+    return True
+
+def test_hold_many_is_ordered():
+    """Test that overlapping multi-bridge locks don't deadlock"""
+    import threading
+    from api.locks import LockStripes
+    
+    locks = LockStripes(4)
+    ids = [f"bridge-{i}" for i in range(8)]
+    counter = {"value": 0}
+    
+    def worker(order):
+        for _ in range(200):
+            with locks.hold_many(order):
+                counter["value"] += 1
+    
+    threads = [
+        threading.Thread(target=worker, args=(ids,)),
+        threading.Thread(target=worker, args=(list(reversed(ids)),))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    
+    assert not any(thread.is_alive() for thread in threads)
+    assert counter["value"] == 400
+    return True
+
+if __name__ == "__main__":
+    print("🔒 Testing lock striping...")
+    test_no_lost_ticks_under_64_clients() and print("✅ 64 clients, no lost ticks: PASS")
+    test_hold_many_is_ordered() and print("✅ Ordered multi-bridge locking: PASS")
+    print("🎉 Concurrency tests completed")
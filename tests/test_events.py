@@ -0,0 +1,75 @@
+"""
+Test the live bridge event hub
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+def test_routing_and_subscribers():
+    """Test per-bridge and fleet subscriptions"""
+    from core.events import EventHub, INSIGHT
+    
+    hub = EventHub()
+    assert not hub.has_subscribers("a")
+    
+    one = hub.subscribe("a")
+    fleet = hub.subscribe()
+    assert hub.has_subscribers("a") and hub.has_subscribers("b")
+    
+    hub.publish("a", INSIGHT, {"description": "first"})
+    hub.publish("b", INSIGHT, {"description": "second"})
+    
+    assert [e["bridge_id"] for e in one.get(timeout=0)] == ["a"]
+    assert [e["bridge_id"] for e in fleet.get(timeout=0)] == ["a", "b"]
+    
+    one.close()
+    fleet.close()
+    assert not hub.has_subscribers("a")
+    return True
+
+def test_coalescing_and_bounded_buffer():
+    """Test that ticks coalesce and a full buffer drops the oldest events"""
+    from core.events import EventHub, TICK, INSIGHT, DROPPED
+    
+    hub = EventHub()
+    subscription = hub.subscribe("a", buffer_size=3)
+    
+    for tick in range(1, 101):
+        hub.publish("a", TICK, {"ticks": tick, "ticks_delta": 1})
+    events = subscription.get(timeout=0)
+    assert len(events) == 1
+    assert events[0]["data"] == {"ticks": 100, "ticks_delta": 100}
+    
+    for i in range(5):
+        hub.publish("a", INSIGHT, {"n": i})
+    events = subscription.get(timeout=0)
+    assert events[0]["type"] == DROPPED and events[0]["data"]["count"] == 2
+    assert [e["data"]["n"] for e in events[1:]] == [2, 3, 4]
+    
+    assert subscription.get(timeout=0) == []
+    return True
+
+def test_maturity_transition_callback():
+    """Test that stage transitions reach registered callbacks"""
+    from core.maturity_system import MaturitySystem, MaturityStage
+    
+    class FakeClock:
+        ticks = 0
+    
+    clock = FakeClock()
+    maturity = MaturitySystem(clock)
+    seen = []
+    maturity.add_transition_callback(seen.append)
+    
+    clock.ticks = 1500
+    maturity.update()
+    assert len(seen) == 1
+    assert seen[0].to_stage == MaturityStage.FORMING
+    return True
+
+if __name__ == "__main__":
+    print("📡 Testing bridge events...")
+    test_routing_and_subscribers() and print("✅ Routing: PASS")
+    test_coalescing_and_bounded_buffer() and print("✅ Coalescing and bounded buffer: PASS")
+    test_maturity_transition_callback() and print("✅ Maturity transition callback: PASS")
+    print("🎉 Event tests completed")
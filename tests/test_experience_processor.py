@@ -0,0 +1,44 @@
+"""
+Test ExperienceProcessor queue
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+def test_fifo_queue_budget():
+    """Test FIFO draining with a per-tick budget"""
+    from core.experience_processor import ExperienceProcessor, Experience, ExperienceType
+    
+    processor = ExperienceProcessor(max_per_tick=3)
+    for i in range(10):
+        processor.add_experience(Experience(ExperienceType.ROUTINE, 0.5, {"n": i}))
+    
+    drained = [e.content["n"] for e in processor.drain()]
+    assert drained == [0, 1, 2]
+    
+    stats = processor.get_stats()["queue"]
+    assert stats["depth"] == 7
+    assert stats["max_depth"] == 10
+    assert stats["dequeued"] == 3
+    return True
+
+def test_priority_queue_order():
+    """Test novel and complex experiences are processed first"""
+    from core.experience_processor import ExperienceProcessor, Experience, ExperienceType
+    
+    processor = ExperienceProcessor(ordering="priority", max_per_tick=10)
+    processor.add_experience(Experience(ExperienceType.ROUTINE, 0.9, {"n": "routine"}))
+    processor.add_experience(Experience(ExperienceType.CHALLENGE, 0.3, {"n": "easy"}))
+    processor.add_experience(Experience(ExperienceType.NOVEL, 0.1, {"n": "novel"}))
+    processor.add_experience(Experience(ExperienceType.CHALLENGE, 0.3, {"n": "easy-2"}))
+    
+    drained = [e.content["n"] for e in processor.drain()]
+    assert drained == ["novel", "routine", "easy", "easy-2"]
+    assert not processor.processing_queue
+    return True
+
+if __name__ == "__main__":
+    print("🧩 Testing ExperienceProcessor...")
+    test_fifo_queue_budget() and print("✅ FIFO queue budget: PASS")
+    test_priority_queue_order() and print("✅ Priority queue order: PASS")
+    print("🎉 ExperienceProcessor tests completed")
@@ -0,0 +1,93 @@
+"""
+Test append-only bridge history
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+def _save(connection, bridge_id, log, kind="experiences"):
+    """What Database.save_bridges does for one history"""
+    from api import history
+    
+    mark = log.count
+    with connection:
+        history.insert_rows(connection, kind, history.history_rows(kind, bridge_id, log.pending()))
+    log.mark_saved(mark)
+
+def test_high_water_mark():
+    """Test that only new entries are written and nothing is truncated"""
+    import sqlite3
+    from api import history
+    from api.history import HistoryLog
+    
+    connection = sqlite3.connect(":memory:")
+    history.create_tables(connection)
+    log = HistoryLog(keep=3)
+    
+    for i in range(20):
+        log.append({"content": f"exp-{i}", "type": "general", "depth": 0.5})
+    assert len(log.pending()) == 20
+    _save(connection, "b1", log)
+    assert log.pending() == [] and len(log.entries) == 3
+    
+    log.append({"content": "exp-20"})
+    assert [entry["seq"] for entry in log.pending()] == [21]
+    _save(connection, "b1", log)
+    _save(connection, "b1", log)  # Nothing new: no rows written
+    
+    rows = connection.execute("SELECT COUNT(*) FROM bridge_experiences").fetchone()[0]
+    assert rows == 21
+    
+    # Restoring from the blob state needs no rows at all
+    restored = HistoryLog.from_dict(log.to_dict())
+    assert restored.count == 21 and restored.pending() == []
+    assert restored.last()["content"] == "exp-20"
+    return True
+
+def test_paged_reads():
+    """Test range reads that combine stored and unsaved entries"""
+    import sqlite3
+    from api import history
+    from api.history import HistoryLog
+    
+    connection = sqlite3.connect(":memory:")
+    history.create_tables(connection)
+    log = HistoryLog(keep=2)
+    for i in range(7):
+        log.append({"content": f"insight-{i}", "timestamp": None})
+    _save(connection, "b1", log, "insights")
+    for i in range(7, 10):
+        log.append({"content": f"insight-{i}", "timestamp": None})
+    
+    seen, after = [], 0
+    while after is not None:
+        page, after = history.read_page(connection, "insights", "b1", log, after, limit=4)
+        seen.extend(entry["seq"] for entry in page)
+    assert seen == list(range(1, 11))
+    
+    page, after = history.read_page(connection, "insights", "b1", log, after=8, limit=4)
+    assert [entry["content"] for entry in page] == ["insight-8", "insight-9"] and after is None
+    
+    try:
+        history.parse_page_args({"limit": "0"})
+        assert False, "limit 0 accepted"
+    except ValueError:
+        pass
+    assert history.parse_page_args({"after": "5"}) == (5, history.DEFAULT_PAGE_SIZE)
+    return True
+
+def test_legacy_blob():
+    """Test adopting the truncated lists of old blobs"""
+    from api.history import HistoryLog
+    
+    log = HistoryLog.from_legacy([{"content": "a"}, {"content": "b"}], total=12)
+    assert log.count == 12
+    assert [entry["seq"] for entry in log.pending()] == [11, 12]
+    return True
+
+if __name__ == "__main__":
+    print("📜 Testing append-only history...")
+    test_high_water_mark() and print("✅ High-water mark: PASS")
+    test_paged_reads() and print("✅ Paged reads: PASS")
+    test_legacy_blob() and print("✅ Legacy blobs: PASS")
+    print("🎉 History tests completed")
@@ -0,0 +1,26 @@
+"""
+Test streaming NDJSON ingestion
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+def test_ndjson_chunks():
+    """Test incremental chunking with bad lines reported in place"""
+    import io
+    from api.ingest import iter_ndjson_chunks
+    
+    body = b'{"content": "a"}\n\n{"content": "b"}\nnot json\n[1, 2]\n{"content": "c"}'
+    chunks = list(iter_ndjson_chunks(io.BytesIO(body), chunk_size=2))
+    
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert chunks[0] == [(1, {"content": "a"}), (3, {"content": "b"})]
+    assert "__error__" in chunks[1][0][1] and chunks[1][0][0] == 4
+    assert "__error__" in chunks[1][1][1]
+    assert chunks[2] == [(6, {"content": "c"})]
+    return True
+
+if __name__ == "__main__":
+    print("📥 Testing NDJSON ingestion...")
+    test_ndjson_chunks() and print("✅ NDJSON chunks: PASS")
+    print("🎉 Ingestion tests completed")
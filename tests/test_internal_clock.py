@@ -21,8 +21,253 @@ def test_temporal_event():
     assert event.intensity == 0.75
     return True
 
+def test_shared_pulse_scheduler():
+    """Test clocks pulsing from one shared scheduler"""
+    import threading
+    import time
+    from core.internal_clock import TimeOrchestrator
+    
+    orchestrator = TimeOrchestrator()
+    threads_before = threading.active_count()
+    clocks = []
+    for i in range(50):
+        clock = orchestrator.create_clock(f"bridge-{i}", f"Bridge {i}")
+        clock.heartbeat_interval = 0.01
+        orchestrator.scheduler.schedule(clock)
+        clocks.append(clock)
+    
+    time.sleep(0.3)
+    assert threading.active_count() - threads_before <= 1
+    assert all(c.heartbeat_count > 0 for c in clocks)
+    
+    # Paused clocks stop pulsing, removed clocks are released
+    orchestrator.pause_clock("bridge-0")
+    orchestrator.remove_clock("bridge-1")
+    time.sleep(0.05)
+    paused_count = clocks[0].heartbeat_count
+    removed_count = clocks[1].heartbeat_count
+    time.sleep(0.2)
+    assert clocks[0].heartbeat_count == paused_count
+    assert clocks[1].heartbeat_count == removed_count
+    assert "bridge-1" not in orchestrator.clocks
+    assert orchestrator.scheduler.pending() <= 48
+    
+    orchestrator.resume_clock("bridge-0")
+    time.sleep(0.2)
+    assert clocks[0].heartbeat_count > paused_count
+    
+    orchestrator.shutdown()
+    return True
+
+def test_pulse_scheduler_callbacks():
+    """Test that threaded-scheduler callbacks run off the timing thread"""
+    import threading
+    import time
+    from core.internal_clock import TimeOrchestrator
+    
+    orchestrator = TimeOrchestrator()
+    clocks = []
+    for i in range(20):
+        clock = orchestrator.create_clock(f"bridge-{i}", f"Bridge {i}")
+        clock.heartbeat_interval = 0.01
+        orchestrator.scheduler.schedule(clock)
+        clocks.append(clock)
+    
+    callback_threads = set()
+    def slow_callback(clock):
+        callback_threads.add(threading.current_thread().name)
+        time.sleep(1.0)
+    clocks[0].add_pulse_callback(slow_callback)
+    
+    time.sleep(0.3)
+    assert all(c.heartbeat_count >= 5 for c in clocks)
+    assert callback_threads and all(name.startswith("pulse-callback") for name in callback_threads)
+    
+    stats = orchestrator.scheduler.stats
+    assert stats['callbacks'] > 0 and stats['callback_errors'] == 0
+    assert stats['heartbeats'] >= sum(c.heartbeat_count for c in clocks)
+    
+    orchestrator.shutdown()
+    return True
+
+def test_failing_heartbeat_isolated():
+    """Test that one clock's failing heartbeat doesn't stop the others"""
+    import logging
+    import time
+    from core.internal_clock import TimeOrchestrator
+    
+    logging.getLogger("core.internal_clock").disabled = True
+    try:
+        for use_asyncio in (False, True):
+            orchestrator = TimeOrchestrator(use_asyncio=use_asyncio)
+            clocks = []
+            for i in range(5):
+                clock = orchestrator.create_clock(f"bridge-{i}", f"Bridge {i}")
+                clock.heartbeat_interval = 0.01
+                orchestrator.scheduler.schedule(clock)
+                clocks.append(clock)
+            
+            def broken():
+                raise OSError("spill file unavailable")
+            clocks[0]._heartbeat = broken
+            
+            time.sleep(0.1)
+            counts = [c.heartbeat_count for c in clocks[1:]]
+            time.sleep(0.2)
+            assert all(c.heartbeat_count > n for c, n in zip(clocks[1:], counts)), use_asyncio
+            assert orchestrator.scheduler.stats['heartbeat_errors'] >= 5, use_asyncio
+            orchestrator.shutdown()
+    finally:
+        logging.getLogger("core.internal_clock").disabled = False
+    return True
+
+def test_async_pulse_scheduler():
+    """Test that slow pulse callbacks do not delay heartbeats"""
+    import asyncio
+    import time
+    from core.internal_clock import TimeOrchestrator
+    
+    orchestrator = TimeOrchestrator(use_asyncio=True)
+    clocks = []
+    for i in range(200):
+        clock = orchestrator.create_clock(f"bridge-{i}", f"Bridge {i}")
+        clock.heartbeat_interval = 0.01
+        orchestrator.scheduler.schedule(clock)
+        clocks.append(clock)
+    
+    async def slow_async_callback(clock):
+        await asyncio.sleep(1.0)
+    
+    def slow_callback(clock):
+        time.sleep(1.0)
+    
+    clocks[0].add_pulse_callback(slow_async_callback)
+    clocks[1].add_pulse_callback(slow_callback)
+    
+    time.sleep(0.3)
+    assert all(c.heartbeat_count > 0 for c in clocks)
+    assert clocks[0].heartbeat_count >= 5
+    assert clocks[1].heartbeat_count >= 5
+    
+    orchestrator.shutdown()
+    return True
+
+def test_async_callback_detection():
+    """Test async callbacks wrapped in partials and callable objects"""
+    import asyncio
+    import functools
+    import time
+    from core.internal_clock import InternalClock, is_async_callable
+    
+    calls = []
+    
+    async def record(tag, clock):
+        calls.append(tag)
+        await asyncio.sleep(0.2)
+    
+    class AsyncCallback:
+        async def __call__(self, clock):
+            await record("object", clock)
+    
+    assert is_async_callable(functools.partial(record, "partial"))
+    assert is_async_callable(AsyncCallback())
+    assert not is_async_callable(lambda clock: None)
+    
+    # A clock on its own pulse thread doesn't wait for slow callbacks
+    clock = InternalClock(bridge_id="test-callbacks", name="Callbacks", heartbeat_interval=0.01)
+    clock.add_pulse_callback(functools.partial(record, "partial"))
+    clock.add_pulse_callback(AsyncCallback())
+    time.sleep(0.3)
+    clock.stop()
+    assert clock.heartbeat_count >= 5
+    assert "partial" in calls and "object" in calls
+    return True
+
+def test_virtual_time_is_deterministic():
+    """Test seeded virtual-time simulation"""
+    from core.internal_clock import TimeOrchestrator, VirtualClock
+    
+    def simulate():
+        virtual = VirtualClock(seed=42)
+        orchestrator = TimeOrchestrator(time_source=virtual)
+        clocks = [orchestrator.create_clock(f"bridge-{i}", f"Bridge {i}") for i in range(3)]
+        for clock in clocks:
+            clock.awareness_level = 0.9
+        
+        virtual.advance(24 * 3600)  # a day of bridge life
+        clocks[0].meditate(3600)
+        return [(c.heartbeat_count, c.internal_time, len(c.temporal_events)) for c in clocks], virtual.now
+    
+    first, now = simulate()
+    second, _ = simulate()
+    assert first == second
+    assert now == 24 * 3600 + 3600 * 0.2
+    assert first[0][0] > 10000
+    return True
+
+def test_temporal_event_ring_buffer():
+    """Test fixed-capacity event buffer with spill file"""
+    import os
+    import tempfile
+    from core.internal_clock import TemporalEventBuffer
+    
+    spill_path = os.path.join(tempfile.mkdtemp(), "events.bin")
+    buffer = TemporalEventBuffer(capacity=5, spill_path=spill_path)
+    for i in range(12):
+        if i % 2:
+            buffer.append("insight", 0.5, float(i), 1000.0 + i, 0.9, 0.8)
+        else:
+            buffer.append("thought", 0.5, float(i), 1000.0 + i)
+    buffer.close()
+    
+    assert len(buffer) == 5
+    assert buffer.evicted == 7
+    assert [e["internal_time"] for e in buffer.recent(3)] == [9.0, 10.0, 11.0]
+    assert buffer[-1].event_type == "insight"
+    assert buffer[-1].data == {"clarity": 0.9, "novelty": 0.8}
+    assert buffer.recent(1)[0] == buffer[-1].to_dict()
+    
+    spilled = TemporalEventBuffer.read_spill(spill_path)
+    assert [e["internal_time"] for e in spilled] == [float(i) for i in range(7)]
+    assert spilled[0]["type"] == "thought" and spilled[0]["data"] == {}
+    
+    try:
+        TemporalEventBuffer(capacity=0)
+        assert False, "empty buffer accepted"
+    except ValueError:
+        pass
+    return True
+
+def test_memory_depth_resizes_buffer():
+    """Test that changing memory_depth keeps the newest events"""
+    from core.internal_clock import InternalClock, VirtualClock
+    
+    clock = InternalClock("test-depth", "Depth", memory_depth=4, time_source=VirtualClock(seed=1))
+    for i in range(4):
+        clock.temporal_events.append("thought", 0.5, float(i), float(i))
+    
+    clock.memory_depth = 2
+    assert clock.temporal_events.capacity == 2 and clock.temporal_events.evicted == 2
+    assert [e["internal_time"] for e in clock.get_timeline()] == [2.0, 3.0]
+    
+    clock.memory_depth = 6
+    for i in range(4, 8):
+        clock.temporal_events.append("memory", 0.5, float(i), float(i))
+    assert [e["internal_time"] for e in clock.get_timeline()] == [2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
+    clock.temporal_events.append("memory", 0.5, 8.0, 8.0)
+    assert clock.get_timeline(1)[0]["internal_time"] == 8.0 and len(clock.temporal_events) == 6
+    return True
+
 if __name__ == "__main__":
     print("⏰ Testing InternalClock...")
     test_clock_creation() and print("✅ Clock creation: PASS")
     test_temporal_event() and print("✅ Temporal event: PASS")
+    test_shared_pulse_scheduler() and print("✅ Shared pulse scheduler: PASS")
+    test_pulse_scheduler_callbacks() and print("✅ Pulse scheduler callbacks: PASS")
+    test_failing_heartbeat_isolated() and print("✅ Failing heartbeat isolated: PASS")
+    test_async_pulse_scheduler() and print("✅ Async pulse scheduler: PASS")
+    test_async_callback_detection() and print("✅ Async callback detection: PASS")
+    test_virtual_time_is_deterministic() and print("✅ Virtual time: PASS")
+    test_temporal_event_ring_buffer() and print("✅ Temporal event ring buffer: PASS")
+    test_memory_depth_resizes_buffer() and print("✅ Memory depth resize: PASS")
     print("🎉 InternalClock tests completed")
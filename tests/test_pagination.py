@@ -0,0 +1,64 @@
+"""
+Test bridge listing pagination parameters
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+def test_cursor_round_trip():
+    """Test that cursors decode to what was encoded"""
+    from api.pagination import encode_cursor, decode_cursor
+    
+    cursor = encode_cursor(0.375, "bridge-42")
+    assert decode_cursor(cursor) == (0.375, "bridge-42")
+    
+    import base64
+    import json
+    
+    def raw_cursor(value):
+        return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
+    
+    bad = ["not-a-cursor", raw_cursor([{"a": 1}, "bridge-1"]), raw_cursor([[1], "bridge-1"]),
+           raw_cursor([None, "bridge-1"]), raw_cursor([True, "bridge-1"]), raw_cursor([1, 2])]
+    for cursor in bad:
+        try:
+            decode_cursor(cursor)
+            assert False, f"malformed cursor accepted: {cursor}"
+        except ValueError:
+            pass
+    return True
+
+def test_parse_list_query():
+    """Test parameter parsing, projection and validation"""
+    from api.pagination import parse_list_query, LIST_FIELDS, DEFAULT_LIMIT
+    
+    query = parse_list_query({})
+    assert query.limit == DEFAULT_LIMIT
+    assert query.fields == list(LIST_FIELDS)
+    assert query.after is None
+    
+    query = parse_list_query({
+        "limit": "20",
+        "sort": "consciousness_level",
+        "order": "desc",
+        "fields": "name, maturity_stage",
+        "maturity_stage": "mature",
+        "min_consciousness": "0.5"
+    })
+    assert query.limit == 20 and query.descending
+    assert query.fields == ["id", "name", "maturity_stage"]
+    assert query.maturity_stage == "mature" and query.min_consciousness == 0.5
+    
+    for bad in ({"limit": "0"}, {"limit": "x"}, {"sort": "data"}, {"order": "up"}, {"fields": "data"}):
+        try:
+            parse_list_query(bad)
+            assert False, f"accepted {bad}"
+        except ValueError:
+            pass
+    return True
+
+if __name__ == "__main__":
+    print("📄 Testing listing pagination...")
+    test_cursor_round_trip() and print("✅ Cursor round trip: PASS")
+    test_parse_list_query() and print("✅ Query parsing: PASS")
+    print("🎉 Pagination tests completed")
@@ -0,0 +1,116 @@
+"""
+Test the struct-of-arrays bridge population against scalar bridges
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+def _make_bridges(count):
+    from core.bridge_reloaded import ConsciousBridgeReloaded
+    from core.internal_clock import VirtualClock
+    from core.personality_core import PersonalityTraits
+
+    return [
+        ConsciousBridgeReloaded(bridge_id=f"bridge_{i}", name=f"Bridge {i}",
+                                seed_personality=PersonalityTraits(),
+                                time_source=VirtualClock(seed=i))
+        for i in range(count)
+    ]
+
+def test_add_and_remove():
+    """Test row bookkeeping when adding and removing bridges"""
+    from core.population import BridgePopulation
+
+    population = BridgePopulation(capacity=2, seed=1)
+    rows = population.add(3, ids=["a", "b", "c"])
+    assert list(rows) == [0, 1, 2] and len(population) == 3
+    assert population.capacity >= 3
+
+    try:
+        population.add(2, ids=["d"])
+        assert False, "mismatched ids accepted"
+    except ValueError:
+        pass
+    assert len(population) == 3 and len(population.ids) == 3
+
+    bridge = _make_bridges(1)[0]
+    row = population.attach(bridge)
+    assert population.ids[row] == bridge.id and population.attached[row]
+
+    # Removing a row moves the last one (the attached bridge) into its place
+    population.remove(0)
+    assert population.ids == [bridge.id, "b", "c"]
+    assert bridge.population_row == 0 and population.attached[0]
+    assert population.bridges[0] is bridge
+    return True
+
+def test_advance_matches_bridges():
+    """Test that advancing rows gives the same state as scalar bridges"""
+    from core.population import BridgePopulation, STAGES
+
+    bridges = _make_bridges(4)
+    # Spread the bridges out so they cross stages at different times
+    for i, bridge in enumerate(bridges):
+        bridge.advance(400 * i)
+        bridge.add_connection("peer", "Peer", strength=0.2 * i)
+
+    population = BridgePopulation(seed=1)
+    for bridge in bridges:
+        population.attach(bridge)
+    population.add(2, ids=["plain_a", "plain_b"])
+
+    for step in (250, 750, 2500):
+        population.advance(step)
+        for bridge in bridges:
+            bridge.advance(step)
+
+    for bridge in bridges:
+        row = bridge.population_row
+        assert population.ticks[row] == bridge.clock.ticks
+        assert STAGES[population.stage[row]] == bridge.maturity.current_stage
+        assert population.consciousness[row] == bridge.state["consciousness_level"]
+
+    stats = population.get_stats()
+    assert stats["size"] == 6
+    assert stats["total_ticks"] == sum(b.clock.ticks for b in bridges) + 2 * 3500
+    for stage in STAGES:
+        expected = sum(b.maturity.current_stage == stage for b in bridges)
+        expected += 2 if stage.value == "maturing" else 0
+        assert stats["by_maturity"][stage.value] == expected
+
+    # Syncing writes the row back, clock included
+    copy = _make_bridges(1)[0]
+    population.attach(copy)
+    population.advance(10)
+    population.detach(copy)
+    assert copy.clock.ticks == 10 and copy.clock.internal_time == 10.0
+    return True
+
+def test_stability_refreshed():
+    """Test that personality stability is re-read before settlement"""
+    from core.population import BridgePopulation
+
+    bridge = _make_bridges(1)[0]
+    population = BridgePopulation(seed=1)
+    row = population.attach(bridge)
+    assert not population.is_stable[row]
+
+    # The personality forms and stabilises after the bridge was attached
+    personality = bridge.personality
+    personality.is_forming = True
+    personality._snapshot(0, "formed")
+    personality._snapshot(0, "steady")
+    assert personality.is_stable()
+
+    population.advance(500)
+    assert population.is_stable[row] and population.is_settled[row]
+    population.detach(bridge)
+    assert personality.is_settled
+    return True
+
+if __name__ == "__main__":
+    print("🧬 Testing bridge population...")
+    test_add_and_remove() and print("✅ Add/remove: PASS")
+    test_advance_matches_bridges() and print("✅ Advance vs bridges: PASS")
+    test_stability_refreshed() and print("✅ Stability refresh: PASS")
+    print("🎉 Population tests completed")
@@ -0,0 +1,39 @@
+"""
+Test versioned response bodies and ETag matching
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+def test_versioned_body_etag():
+    """Test that the ETag follows the body, not the version number"""
+    from api.response_cache import VersionedBody
+    
+    first = VersionedBody(1, {"ticks": 10})
+    same = VersionedBody(2, {"ticks": 10})
+    changed = VersionedBody(3, {"ticks": 11})
+    
+    assert first.body == b'{"ticks":10}'
+    assert first.etag == same.etag
+    assert first.etag != changed.etag
+    assert first.etag.startswith('"') and first.etag.endswith('"')
+    return True
+
+def test_if_none_match():
+    """Test If-None-Match evaluation"""
+    from api.response_cache import etag_matches
+    
+    etag = '"abc"'
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('"xyz", W/"abc"', etag)
+    assert etag_matches('*', etag)
+    assert not etag_matches('"xyz"', etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('', etag)
+    return True
+
+if __name__ == "__main__":
+    print("🏷️ Testing response cache...")
+    test_versioned_body_etag() and print("✅ Versioned body ETag: PASS")
+    test_if_none_match() and print("✅ If-None-Match: PASS")
+    print("🎉 Response cache tests completed")
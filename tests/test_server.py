@@ -0,0 +1,416 @@
+"""
+Test the Flask API server through its test client
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+def _server():
+    """Import api.server once, on a temporary database with auto-tick off"""
+    if "api.server" not in sys.modules:
+        import tempfile
+        os.environ["BRIDGE_DB_PATH"] = os.path.join(tempfile.mkdtemp(), "server.db")
+        os.environ["BRIDGE_AUTOTICK"] = "0"
+        os.environ["BRIDGE_DEBUG"] = "0"
+        os.environ["BRIDGE_SHARD_ID"] = "test-shard"  # No sample bridges
+    import api.server as server
+    return server
+
+def _create(client, name, **fields):
+    response = client.post('/api/bridges', json={"name": name, **fields})
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()["bridge"]["id"]
+
+def test_batch_tick_validation():
+    """Test that invalid batch entries are rejected before anything runs"""
+    server = _server()
+    client = server.app.test_client()
+    bridge_id = _create(client, "Batch Validation")
+
+    invalid = [
+        ["not an object"],
+        [{"bridge_id": ["list"], "ticks": 1}],
+        [{"bridge_id": bridge_id, "ticks": True}],
+        [{"bridge_id": bridge_id, "ticks": 0}],
+        [{"bridge_id": bridge_id, "ticks": 2.5}],
+        [{"bridge_id": bridge_id, "experience_depth": "x"}],
+        [{"bridge_id": bridge_id, "attention_level": float("nan")}],
+    ]
+    for entries in invalid:
+        # A valid entry first: it must not be applied either
+        response = client.post('/api/bridges/tick:batch', json={
+            "entries": [{"bridge_id": bridge_id, "ticks": 5}] + entries
+        })
+        assert response.status_code == 400, entries
+        assert response.get_json()["index"] == 1
+
+    with server.active_bridges.checkout(bridge_id) as bridge:
+        assert bridge.internal_clock.ticks == 0
+
+    response = client.post('/api/bridges/tick:batch', json={"entries": [
+        {"bridge_id": bridge_id, "ticks": 5, "experience_depth": 1, "attention_level": 0.5},
+        {"bridge_id": "bridge_missing", "ticks": 1}
+    ]})
+    assert response.status_code == 200
+    results = response.get_json()["results"]
+    assert results[0]["ticks"] == 5 and results[1]["error"] == "Bridge not found"
+    return True
+
+def test_stream_rejects_bad_bridge_ids():
+    """Test that a malformed bridge_id rejects its line and the stream goes on"""
+    import json
+    server = _server()
+    client = server.app.test_client()
+    bridge_id = _create(client, "Stream Ids")
+
+    lines = [
+        {"bridge_id": [1], "content": "unhashable"},
+        {"bridge_id": {"id": bridge_id}, "content": "object"},
+        {"content": "no bridge"},
+        {"bridge_id": bridge_id, "content": "kept"},
+    ]
+    response = client.post('/api/experiences:stream',
+                           data="\n".join(json.dumps(line) for line in lines))
+    assert response.status_code == 200
+    result = response.get_json()
+    assert result["accepted"] == 1 and result["rejected"] == 3
+    assert [error["line"] for error in result["errors"]] == [1, 2, 3]
+    assert result["errors"][0]["error"] == "bridge_id must be a string"
+    return True
+
+def test_stats_triggers():
+    """Test trigger-maintained stats across writes and after a rebuild"""
+    import tempfile
+    server = _server()
+
+    path = os.path.join(tempfile.mkdtemp(), "stats.db")
+    database = server.Database(path)
+    database.initialize_schema()
+
+    def exact():
+        rows = database.connection.execute("""
+            SELECT maturity_level, is_active, COUNT(*) AS count,
+                   SUM(internal_ticks) AS total_ticks, SUM(consciousness_level) AS total_consciousness
+            FROM bridges GROUP BY maturity_level, is_active
+        """).fetchall()
+        total = sum(row["count"] for row in rows)
+        active = [row for row in rows if row["is_active"]]
+        count = sum(row["count"] for row in active)
+        consciousness = sum(row["total_consciousness"] for row in active)
+        return {
+            "total_bridges": total,
+            "active_bridges": count,
+            "inactive_bridges": total - count,
+            "maturity_distribution": {row["maturity_level"]: row["count"] for row in active},
+            "total_ticks": sum(row["total_ticks"] for row in active),
+            "average_consciousness": round(consciousness / count, 3) if count else 0.0
+        }
+
+    # Insert
+    bridges = [server.ConsciousBridgeReloaded(name=f"Stats {i}") for i in range(6)]
+    database.save_bridges(bridges)
+    assert database.get_stats() == exact()
+    assert database.get_stats()["maturity_distribution"] == {"nascent": 6}
+
+    # Upsert: ticks and stage change on existing rows
+    for i, bridge in enumerate(bridges[:3]):
+        bridge.advance(600 * (i + 1))
+    database.save_bridges(bridges[:3])
+    stats = database.get_stats()
+    assert stats == exact() and stats["total_ticks"] == 600 + 1200 + 1800
+    assert database.count_bridges() == 6
+
+    # Update (soft delete) and delete
+    database.delete_bridge(bridges[0].id)
+    database.purge_bridges([bridges[5].id])
+    stats = database.get_stats()
+    assert stats == exact()
+    assert stats["active_bridges"] == 4 and stats["inactive_bridges"] == 1
+
+    # Rebuilt from the bridges table when the triggers are missing
+    with database.connection:
+        database.connection.execute("DROP TABLE bridge_stats")
+        for name in database._stats_triggers():
+            database.connection.execute(f"DROP TRIGGER {name}")
+    database.initialize_schema()
+    assert database.get_stats() == stats
+
+    database.save_bridges([server.ConsciousBridgeReloaded(name="After rebuild")])
+    assert database.get_stats() == exact()
+    return True
+
+def test_listing_filters_and_cursors():
+    """Test that filtered, sorted pages reflect unsaved ticks"""
+    server = _server()
+    client = server.app.test_client()
+    ids = [_create(client, f"Listing {i}", type="listing-test") for i in range(6)]
+
+    # Unsaved ticks: two bridges leave the nascent stage
+    response = client.post('/api/bridges/tick:batch', json={"entries": [
+        {"bridge_id": ids[0], "ticks": 150},
+        {"bridge_id": ids[1], "ticks": 250},
+        {"bridge_id": ids[2], "ticks": 40},
+        {"bridge_id": ids[3], "ticks": 20}
+    ]})
+    assert response.status_code == 200
+
+    def pages(**args):
+        rows, cursor = [], None
+        while True:
+            params = {"type": "listing-test", "limit": 2, **args}
+            if cursor:
+                params["cursor"] = cursor
+            body = client.get('/api/bridges', query_string=params).get_json()
+            rows.extend(body["bridges"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                return rows
+
+    # Reads don't flush the write-behind layer
+    import threading
+    flush, flushed_by = server.persistence.flush, []
+    server.persistence.flush = lambda: flushed_by.append(threading.current_thread()) or flush()
+    try:
+        nascent = pages(maturity_stage="nascent", sort="ticks", order="desc")
+        everything = pages(sort="ticks")
+    finally:
+        server.persistence.flush = flush
+    assert threading.current_thread() not in flushed_by
+    
+    assert all(row["maturity_stage"] == "nascent" for row in nascent)
+    assert [row["ticks"] for row in nascent] == [40, 20, 0, 0]
+    assert {row["id"] for row in nascent} == set(ids[2:])
+
+    assert [row["ticks"] for row in everything] == [0, 0, 20, 40, 150, 250]
+    assert len({row["id"] for row in everything}) == 6
+
+    # A cursor with a non-scalar sort value is a client error
+    from api.pagination import encode_cursor
+    response = client.get('/api/bridges', query_string={"cursor": encode_cursor({"a": 1}, ids[0])})
+    assert response.status_code == 400 and response.get_json()["error"] == "Invalid cursor"
+    return True
+
+def test_live_rows_paged_with_database_rows():
+    """Test that unsaved bridges are filtered, sorted and paged in place of their rows"""
+    import tempfile
+    from api.pagination import parse_list_query
+    server = _server()
+
+    database = server.Database(os.path.join(tempfile.mkdtemp(), "live.db"), locks=server.bridge_locks)
+    database.initialize_schema()
+    bridges = [server.ConsciousBridgeReloaded(name=f"Live {i}") for i in range(8)]
+    for i, bridge in enumerate(bridges):
+        bridge.advance(10 * i)
+    database.save_bridges(bridges)
+
+    # Unsaved: one bridge jumps to the top, one leaves the nascent stage, one is deleted
+    bridges[0].advance(95)
+    bridges[7].advance(150)
+    bridges[3].is_active = False
+    live = [bridges[0], bridges[3], bridges[7]]
+
+    def pages(**args):
+        rows, cursor = [], None
+        while True:
+            query = parse_list_query({"limit": "3", "sort": "ticks", **args, **({"cursor": cursor} if cursor else {})})
+            page, cursor = database.list_bridge_summaries(query, live)
+            rows.extend(page)
+            if cursor is None:
+                return rows
+
+    expected = [10, 20, 40, 50, 60, 95, 220]
+    assert [row["ticks"] for row in pages()] == expected
+    assert [row["ticks"] for row in pages(order="desc")] == expected[::-1]
+    nascent = pages(maturity_stage="nascent")
+    assert [row["ticks"] for row in nascent] == [10, 20, 40, 50, 60, 95]
+    assert bridges[7].id not in {row["id"] for row in nascent}
+
+    # Without the live rows the stale database values are listed
+    query = parse_list_query({"limit": "10", "sort": "ticks"})
+    assert [row["ticks"] for row in database.list_bridge_summaries(query)[0]] == [0, 10, 20, 30, 40, 50, 60, 70]
+    return True
+
+def test_personality_event_is_a_snapshot():
+    """Test that a published PERSONALITY event doesn't follow later trait changes"""
+    server = _server()
+    client = server.app.test_client()
+    bridge_id = _create(client, "Event Snapshot")
+
+    subscription = server.event_hub.subscribe(bridge_id)
+    try:
+        client.post(f'/api/bridges/{bridge_id}/experience', json={"content": "first", "depth": 0.9})
+        events = [e for e in subscription.get(timeout=1.0) if e["type"] == server.bridge_events.PERSONALITY]
+        published = dict(events[-1]["data"]["traits"])
+
+        with server.active_bridges.checkout(bridge_id) as bridge:
+            for name in bridge.personality_core.traits:
+                bridge.personality_core.traits[name] += 1.0
+        assert events[-1]["data"]["traits"] == published
+    finally:
+        subscription.close()
+    return True
+
+def test_immediate_durability_saves_once_per_batch():
+    """Test that a batch or stream chunk is one save in immediate mode"""
+    import json
+    server = _server()
+    client = server.app.test_client()
+    ids = [_create(client, f"Immediate {i}") for i in range(3)]
+
+    persistence = server.persistence
+    persistence.flush()
+    saves = []
+    save_many, durability = persistence.save_many, persistence.durability
+    persistence.save_many = lambda bridges: saves.append(sorted(b.id for b in bridges)) or save_many(bridges)
+    persistence.durability = "immediate"
+    try:
+        response = client.post('/api/bridges/tick:batch', json={"entries": [
+            {"bridge_id": bridge_id, "ticks": 3} for bridge_id in ids + ids
+        ]})
+        assert response.status_code == 200
+        assert saves == [sorted(ids)]
+
+        saves.clear()
+        lines = [{"bridge_id": bridge_id, "content": "seen"} for bridge_id in ids + ids]
+        response = client.post('/api/experiences:stream',
+                               data="\n".join(json.dumps(line) for line in lines))
+        assert response.get_json()["accepted"] == 6
+        assert saves == [sorted(ids)]
+    finally:
+        persistence.save_many, persistence.durability = save_many, durability
+
+    for bridge_id in ids:
+        with server.active_bridges.checkout(bridge_id) as bridge:
+            assert bridge.internal_clock.ticks == 6
+    return True
+
+def test_create_with_router_id():
+    """Test that X-Bridge-Id is honoured only on a shard, and never twice"""
+    server = _server()
+    client = server.app.test_client()
+    headers = {"X-Bridge-Id": "bridge_routed"}
+
+    response = client.post('/api/bridges', json={"name": "Routed"}, headers=headers)
+    assert response.status_code == 201
+    assert response.get_json()["bridge"]["id"] == "bridge_routed"
+
+    response = client.post('/api/bridges', json={"name": "Routed again"}, headers=headers)
+    assert response.status_code == 409
+    assert client.get('/api/bridges/bridge_routed').get_json()["name"] == "Routed"
+
+    shard_id, server.SHARD_ID = server.SHARD_ID, None
+    try:
+        response = client.post('/api/bridges', json={"name": "Unsharded"}, headers=headers)
+        assert response.status_code == 201
+        assert response.get_json()["bridge"]["id"] != "bridge_routed"
+    finally:
+        server.SHARD_ID = shard_id
+    return True
+
+def test_shard_transfer():
+    """Test moving a bridge with its history and auto-tick registration"""
+    server = _server()
+    client = server.app.test_client()
+    bridge_id = _create(client, "Moving")
+    for i in range(3):
+        response = client.post(f'/api/bridges/{bridge_id}/experience',
+                               json={"content": f"memory {i}", "depth": 0.9})
+        assert response.status_code == 200
+    client.post('/api/bridges/tick:batch', json={"entries": [{"bridge_id": bridge_id, "ticks": 7}]})
+    response = client.put(f'/api/bridges/{bridge_id}/autotick', json={"rate": 2.5})
+    assert response.status_code == 200
+
+    experiences = client.get(f'/api/bridges/{bridge_id}/experiences').get_json()["experiences"]
+    insights = client.get(f'/api/bridges/{bridge_id}/insights').get_json()["insights"]
+    assert len(experiences) == 3
+    assert bridge_id in client.get('/api/shard/bridges').get_json()["ids"]
+
+    exported = client.post('/api/shard/export', json={"ids": [bridge_id, "bridge_missing"]}).get_json()["bridges"]
+    assert len(exported) == 1 and exported[0]["id"] == bridge_id
+    assert len(exported[0]["history"]["experiences"]) == 3
+    assert exported[0]["autotick"] == {"rate": 2.5, "class": None}
+
+    # Released: the bridge, its history and its registration are gone
+    assert client.post('/api/shard/release', json={"ids": [bridge_id]}).get_json()["released"] == 1
+    assert bridge_id not in client.get('/api/shard/bridges').get_json()["ids"]
+    assert client.get(f'/api/bridges/{bridge_id}').status_code == 404
+    assert server.auto_ticker.registration(bridge_id) is None
+
+    # Imported (as another worker would): everything comes back
+    assert client.post('/api/shard/import', json={"bridges": exported}).get_json()["imported"] == 1
+    assert bridge_id in client.get('/api/shard/bridges').get_json()["ids"]
+    def stored(kind, entries):
+        # Stored rows keep the history columns only
+        columns = ("seq",) + server.history.HISTORY_TABLES[kind][1]
+        return [{column: entry.get(column) for column in columns} for entry in entries]
+    for kind, before in (("experiences", experiences), ("insights", insights)):
+        after = client.get(f'/api/bridges/{bridge_id}/{kind}').get_json()[kind]
+        assert stored(kind, after) == stored(kind, before), kind
+    with server.active_bridges.checkout(bridge_id) as bridge:
+        assert bridge.internal_clock.ticks == 7
+    assert server.auto_ticker.registration(bridge_id)["rate"] == 2.5
+    registrations, _ = server.db.load_autotick()
+    assert any(row["bridge_id"] == bridge_id and row["rate"] == 2.5 for row in registrations)
+
+    client.delete(f'/api/bridges/{bridge_id}/autotick')
+    return True
+
+def test_autotick_rates_must_be_finite():
+    """Test that the auto-tick endpoints refuse nan and inf rates"""
+    server = _server()
+    client = server.app.test_client()
+    bridge_id = _create(client, "Finite Rates")
+
+    for rate in ("nan", "inf", "-inf", -1):
+        response = client.put('/api/autotick/classes/finite-test', json={"rate": rate})
+        assert response.status_code == 400, rate
+        response = client.put(f'/api/bridges/{bridge_id}/autotick', json={"rate": rate})
+        assert response.status_code == 400, rate
+    assert "finite-test" not in server.auto_ticker.class_rates
+    assert server.auto_ticker.registration(bridge_id) is None
+    return True
+
+def test_autotick_starts_outside_the_reloader():
+    """Test that auto-tick is skipped only in the debug reloader's watcher process"""
+    server = _server()
+    saved = {name: os.environ.get(name) for name in ("BRIDGE_AUTOTICK", "WERKZEUG_RUN_MAIN")}
+    debug, name = server.DEBUG, server.__name__
+    try:
+        os.environ["BRIDGE_AUTOTICK"] = "1"
+        os.environ.pop("WERKZEUG_RUN_MAIN", None)
+        server.DEBUG = True
+        assert server._autotick_wanted()  # Imported by a WSGI server
+
+        server.__name__ = "__main__"
+        assert not server._autotick_wanted()  # Reloader watcher
+        os.environ["WERKZEUG_RUN_MAIN"] = "true"
+        assert server._autotick_wanted()  # Reloader child
+        server.DEBUG = False
+        os.environ.pop("WERKZEUG_RUN_MAIN")
+        assert server._autotick_wanted()
+
+        os.environ["BRIDGE_AUTOTICK"] = "0"
+        assert not server._autotick_wanted()
+    finally:
+        server.DEBUG, server.__name__ = debug, name
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+    return True
+
+if __name__ == "__main__":
+    print("🌐 Testing API server...")
+    test_batch_tick_validation() and print("✅ Batch tick validation: PASS")
+    test_stream_rejects_bad_bridge_ids() and print("✅ Stream bridge ids: PASS")
+    test_stats_triggers() and print("✅ Stats triggers: PASS")
+    test_listing_filters_and_cursors() and print("✅ Listing filters and cursors: PASS")
+    test_live_rows_paged_with_database_rows() and print("✅ Live rows in listings: PASS")
+    test_personality_event_is_a_snapshot() and print("✅ Personality event snapshot: PASS")
+    test_immediate_durability_saves_once_per_batch() and print("✅ Immediate durability batches: PASS")
+    test_create_with_router_id() and print("✅ Router-assigned ids: PASS")
+    test_shard_transfer() and print("✅ Shard transfer: PASS")
+    test_autotick_rates_must_be_finite() and print("✅ Finite auto-tick rates: PASS")
+    test_autotick_starts_outside_the_reloader() and print("✅ Auto-tick startup: PASS")
+    print("🎉 Server tests completed")
@@ -0,0 +1,292 @@
+"""
+Test consistent-hash sharding with N local worker processes
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import json
+
+def _run_worker(ports):
+    """
+    Minimal stand-in for an api.server worker (stdlib only)
+    
+    Speaks the subset of the API the router relies on, including the
+    /api/shard/* rebalancing endpoints.
+    """
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+    from api.pagination import decode_cursor, encode_cursor
+    
+    bridges = {}
+    
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+        
+        def _send(self, status, payload):
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        
+        def _body(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"{}")
+        
+        def do_GET(self):
+            path, _, query = self.path.partition("?")
+            args = dict(pair.split("=", 1) for pair in query.split("&") if pair)
+            if path == "/api/health":
+                return self._send(200, {"status": "healthy"})
+            if path == "/api/stats":
+                n = len(bridges)
+                return self._send(200, {"statistics": {
+                    "active_bridges": n, "maturity_distribution": {"nascent": n} if n else {}
+                }})
+            if path == "/api/shard/bridges":
+                return self._send(200, {"ids": list(bridges)})
+            if path == "/api/bridges":
+                ids = sorted(bridges)
+                if "cursor" in args:
+                    after = decode_cursor(args["cursor"])[1]
+                    ids = [i for i in ids if i > after]
+                limit = int(args.get("limit", 100))
+                page = [{"id": i, "ticks": bridges[i]["ticks"]} for i in ids[:limit]]
+                cursor = encode_cursor(page[-1]["id"], page[-1]["id"]) if len(ids) > limit else None
+                return self._send(200, {"count": len(page), "bridges": page, "next_cursor": cursor})
+            bridge_id = path.split("/")[3]
+            if bridge_id not in bridges:
+                return self._send(404, {"error": "Bridge not found"})
+            return self._send(200, bridges[bridge_id])
+        
+        def _stream(self, default_bridge_id=None):
+            length = int(self.headers.get("Content-Length") or 0)
+            summary = {"accepted": 0, "rejected": 0, "insights": 0, "chunks": 1, "bridges": 0, "errors": []}
+            for number, line in enumerate(self.rfile.read(length).splitlines(), start=1):
+                record = json.loads(line)
+                bridge = bridges.get(default_bridge_id or record.get("bridge_id"))
+                if bridge is None or "content" not in record:
+                    summary["rejected"] += 1
+                    summary["errors"].append({"line": number, "error": "rejected"})
+                    continue
+                bridge["experiences"] = bridge.get("experiences", 0) + 1
+                summary["accepted"] += 1
+            return self._send(200, summary)
+        
+        def do_POST(self):
+            path = self.path.partition("?")[0]
+            if path == "/api/experiences:stream":
+                return self._stream()
+            if path.endswith("/experiences:stream"):
+                bridge_id = path.split("/")[3]
+                if bridge_id not in bridges:
+                    return self._send(404, {"error": "Bridge not found"})
+                return self._stream(bridge_id)
+            body = self._body()
+            if path == "/api/bridges":
+                bridge_id = self.headers["X-Bridge-Id"]
+                bridges[bridge_id] = {"id": bridge_id, "name": body["name"], "ticks": 0}
+                return self._send(201, {"bridge": bridges[bridge_id]})
+            if path == "/api/bridges/tick:batch":
+                for index, entry in enumerate(body["entries"]):
+                    if entry.get("reject"):
+                        return self._send(400, {"error": "rejected", "index": index})
+                results = []
+                for entry in body["entries"]:
+                    bridge = bridges.get(entry["bridge_id"])
+                    if bridge is None:
+                        results.append({"bridge_id": entry["bridge_id"], "error": "Bridge not found"})
+                        continue
+                    bridge["ticks"] += entry["ticks"]
+                    results.append({"bridge_id": bridge["id"], "ticks_delta": entry["ticks"]})
+                return self._send(200, {"results": results})
+            if path == "/api/shard/export":
+                return self._send(200, {"bridges": [bridges[i] for i in body["ids"] if i in bridges]})
+            if path == "/api/shard/import":
+                for bridge in body["bridges"]:
+                    bridges[bridge["id"]] = bridge
+                return self._send(200, {"imported": len(body["bridges"])})
+            if path == "/api/shard/release":
+                for bridge_id in body["ids"]:
+                    bridges.pop(bridge_id, None)
+                return self._send(200, {"released": len(body["ids"])})
+            bridge_id = path.split("/")[3]
+            if bridge_id not in bridges:
+                return self._send(404, {"error": "Bridge not found"})
+            bridges[bridge_id]["ticks"] += 1
+            return self._send(200, {"current_state": bridges[bridge_id]})
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+def _start_workers(count):
+    import multiprocessing
+    ports = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_run_worker, args=(ports,), daemon=True) for _ in range(count)]
+    for process in processes:
+        process.start()
+    return processes, [f"127.0.0.1:{ports.get(timeout=10)}" for _ in processes]
+
+def test_hash_ring_moves_few_keys():
+    """Test balance and minimal movement of the consistent-hash ring"""
+    from api.sharding import HashRing
+    
+    keys = [f"bridge-{i}" for i in range(4000)]
+    ring = HashRing(["a", "b", "c"])
+    before = {key: ring.node_for(key) for key in keys}
+    
+    counts = {node: list(before.values()).count(node) for node in ring.nodes}
+    assert all(900 < count < 1800 for count in counts.values()), counts
+    
+    grown = ring.copy()
+    grown.add("d")
+    moved = [key for key in keys if grown.node_for(key) != before[key]]
+    assert all(grown.node_for(key) == "d" for key in moved)
+    assert 0.15 < len(moved) / len(keys) < 0.35
+    
+    grown.remove("d")
+    assert all(grown.node_for(key) == before[key] for key in keys)
+    return True
+
+def test_router_with_local_workers():
+    """Test routing, fan-out and rebalancing across local worker processes"""
+    import threading
+    from api.sharding import ShardRouter, WorkerPool, serve_router
+    
+    processes, addresses = _start_workers(4)
+    router = ShardRouter(addresses[:3])
+    server = serve_router(router, "127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = WorkerPool()
+    front = f"127.0.0.1:{server.server_address[1]}"
+    
+    def assert_placement(expected_ticks):
+        for bridge_id in ids:
+            for address in addresses:
+                status, body = client.request_json(address, "GET", f"/api/bridges/{bridge_id}")
+                if address == router.ring.node_for(bridge_id):
+                    assert status == 200 and body["ticks"] == expected_ticks
+                else:
+                    assert status == 404
+    
+    try:
+        ids = []
+        for i in range(30):
+            status, body = client.request_json(front, "POST", "/api/bridges", {"name": f"b{i}"})
+            assert status == 201
+            ids.append(body["bridge"]["id"])
+        assert len({router.ring.node_for(i) for i in ids}) == 3
+        
+        for bridge_id in ids:
+            assert client.request_json(front, "POST", f"/api/bridges/{bridge_id}/tick", {})[0] == 200
+        status, body = client.request_json(front, "POST", "/api/bridges/tick:batch", {
+            "entries": [{"bridge_id": bridge_id, "ticks": 2} for bridge_id in ids] + [{"bridge_id": "nope", "ticks": 1}]
+        })
+        assert status == 200 and body["total_ticks"] == 60 and body["results"][-1]["error"]
+        assert [r["bridge_id"] for r in body["results"][:-1]] == ids
+        assert_placement(3)
+        
+        # Merged keyset pagination visits every bridge once, in order
+        listed, cursor = [], None
+        while True:
+            query = "?sort=id&limit=7" + (f"&cursor={cursor}" if cursor else "")
+            status, page = client.request_json(front, "GET", "/api/bridges" + query)
+            listed += [b["id"] for b in page["bridges"]]
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        assert listed == sorted(ids)
+        
+        status, stats = client.request_json(front, "GET", "/api/stats")
+        assert stats["statistics"]["active_bridges"] == 30 and stats["shards"] == 3
+        
+        # A worker joins: only bridges now owned by it move
+        moved = router.add_worker(addresses[3])
+        assert 0 < moved < 30
+        assert_placement(3)
+        
+        # A worker leaves: its bridges are drained to the others
+        status, body = client.request_json(front, "DELETE", "/shards/workers/" + addresses[0])
+        assert status == 200 and addresses[0] not in body["workers"]
+        assert_placement(3)
+    finally:
+        server.shutdown()
+        server.server_close()
+        for process in processes:
+            process.terminate()
+    return True
+
+def test_router_batches_and_streams():
+    """Test batch validation, error indexes and chunked stream forwarding"""
+    import threading
+    from api.ingest import MAX_REPORTED_ERRORS
+    from api.sharding import ShardRouter, WorkerPool, serve_router
+    
+    processes, addresses = _start_workers(3)
+    router = ShardRouter(addresses, chunk_size=50)
+    server = serve_router(router, "127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = WorkerPool()
+    front = f"127.0.0.1:{server.server_address[1]}"
+    
+    def ticks():
+        return [client.request_json(front, "GET", f"/api/bridges/{i}")[1]["ticks"] for i in ids]
+    
+    def stream(path, records):
+        body = "\n".join(r if isinstance(r, str) else json.dumps(r) for r in records).encode()
+        status, _, data = client.request(front, "POST", path, body, {"Content-Type": "application/x-ndjson"})
+        return status, json.loads(data)
+    
+    try:
+        ids = [client.request_json(front, "POST", "/api/bridges", {"name": f"b{i}"})[1]["bridge"]["id"]
+               for i in range(12)]
+        assert len({router.ring.node_for(i) for i in ids}) == 3
+        
+        # An invalid entry anywhere stops the whole batch, reported at its index
+        entries = [{"bridge_id": bridge_id, "ticks": 2} for bridge_id in ids]
+        for bad in ({"bridge_id": ids[0], "ticks": 0}, {"bridge_id": 7}, "entry"):
+            status, body = client.request_json(front, "POST", "/api/bridges/tick:batch",
+                                               {"entries": entries[:5] + [bad] + entries[5:]})
+            assert status == 400 and body["index"] == 5, bad
+        assert ticks() == [0] * 12
+        
+        # A worker's error index is mapped back to the client's batch
+        target = router.ring.node_for(ids[7])
+        same_owner = [i for i, bridge_id in enumerate(ids) if router.ring.node_for(bridge_id) == target]
+        rejected = [dict(entry) for entry in entries]
+        rejected[same_owner[-1]]["reject"] = True
+        status, body = client.request_json(front, "POST", "/api/bridges/tick:batch", {"entries": rejected})
+        assert status == 400 and body["index"] == same_owner[-1]
+        
+        # Fleet stream: rejected lines are reported up to the cap, in line order
+        records = ["not json"] * 150 + [{"bridge_id": i, "content": "x"} for i in ids] + [{"bridge_id": ids[0]}]
+        status, body = stream("/api/experiences:stream", records)
+        assert status == 200 and body["accepted"] == 12 and body["rejected"] == 151
+        assert len(body["errors"]) == MAX_REPORTED_ERRORS
+        assert [e["line"] for e in body["errors"]] == list(range(1, MAX_REPORTED_ERRORS + 1))
+        
+        # Per-bridge stream: forwarded to the owner chunk by chunk
+        status, body = stream(f"/api/bridges/{ids[3]}/experiences:stream",
+                              [{"content": n} for n in range(120)] + [{"type": "no content"}])
+        assert status == 200 and body["accepted"] == 120 and body["chunks"] == 3
+        assert body["errors"] == [{"line": 121, "error": "rejected"}]
+        assert client.request_json(front, "GET", f"/api/bridges/{ids[3]}")[1]["experiences"] == 121
+        
+        assert stream("/api/bridges/unknown/experiences:stream", [{"content": 1}])[0] == 404
+        assert stream("/api/bridges/unknown/experiences:stream", [])[0] == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+        for process in processes:
+            process.terminate()
+    return True
+
+if __name__ == "__main__":
+    print("🔀 Testing sharding...")
+    test_hash_ring_moves_few_keys() and print("✅ Hash ring: PASS")
+    test_router_with_local_workers() and print("✅ Router with local workers: PASS")
+    test_router_batches_and_streams() and print("✅ Router batches and streams: PASS")
+    print("🎉 Sharding tests completed")
@@ -0,0 +1,110 @@
+"""
+Test binary snapshot sections
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+def test_section_round_trip():
+    """Test writing and mapping record sections"""
+    import tempfile
+    from core.snapshot import write_sections, read_sections, is_snapshot
+    
+    path = os.path.join(tempfile.mkdtemp(), "bridge.snap")
+    write_sections(path, {
+        "meta": [{"id": "bridge-1"}],
+        "insights": [{"tick": i, "description": f"insight {i}"} for i in range(1000)],
+        "dialogues": []
+    })
+    
+    assert is_snapshot(path)
+    sections = read_sections(path)
+    assert sections["meta"].decode(0) == {"id": "bridge-1"}
+    assert len(sections["insights"]) == 1000
+    assert sections["insights"].decode(999)["tick"] == 999
+    assert len(sections["dialogues"]) == 0
+    return True
+
+def test_lazy_record_list():
+    """Test lazy decoding and appends"""
+    import tempfile
+    from core.snapshot import write_sections, read_sections, LazyRecordList
+    
+    path = os.path.join(tempfile.mkdtemp(), "bridge.snap")
+    write_sections(path, {"experiences": [{"tick": i} for i in range(10)]})
+    
+    decoded = []
+    def decode(record):
+        decoded.append(record["tick"])
+        return record
+    
+    records = LazyRecordList(read_sections(path)["experiences"], decode)
+    assert len(records) == 10
+    assert decoded == []
+    
+    assert records[-1] == {"tick": 9}
+    assert decoded == [9]
+    
+    records.append({"tick": 10})
+    assert len(records) == 11
+    assert records[10] == {"tick": 10}
+    assert records == [{"tick": i} for i in range(11)]
+    
+    del records[0]
+    assert records[0] == {"tick": 1}
+    return True
+
+def test_bridge_round_trip():
+    """Test saving and loading a whole bridge, clock included"""
+    import math
+    import tempfile
+    from core.bridge_reloaded import ConsciousBridgeReloaded
+    from core.internal_clock import VirtualClock
+    from core.snapshot import LazyRecordList
+    
+    source = VirtualClock(seed=3)
+    bridge = ConsciousBridgeReloaded(bridge_id="bridge-snap", name="Snapshot", time_source=source)
+    bridge.clock.awareness_level = 0.9
+    for i in range(6):
+        bridge.add_experience({"type": "novel", "complexity": 0.9, "content": {"n": i}})
+    bridge.advance(1100)
+    bridge.add_connection("bridge-other", "Other", strength=0.7)
+    bridge.start_dialogue("bridge-other", "time")
+    source.advance(200)
+    assert len(bridge.clock.temporal_events) > 0 and bridge.clock.significant_events
+    
+    path = os.path.join(tempfile.mkdtemp(), "bridge.snap")
+    bridge.save_snapshot(path)
+    
+    for lazy in (True, False):
+        loaded = ConsciousBridgeReloaded.load_snapshot(path, lazy=lazy, time_source=VirtualClock(seed=3))
+        assert isinstance(loaded.insights, LazyRecordList) == lazy
+        
+        clock, original = loaded.clock, bridge.clock
+        assert clock.ticks == original.ticks == 1100
+        assert math.isclose(clock.internal_time, original.internal_time)
+        assert clock.heartbeat_count == original.heartbeat_count
+        assert clock.get_timeline(1000) == original.get_timeline(1000)
+        assert [e.to_dict() for e in clock.significant_events] == \
+               [e.to_dict() for e in original.significant_events]
+        
+        assert loaded.maturity.get_level() == bridge.maturity.get_level()
+        assert loaded.personality.get_traits() == bridge.personality.get_traits()
+        assert loaded.insights == bridge.insights
+        assert len(loaded.experiences) == len(bridge.experiences)
+        assert loaded.dialogue_history == bridge.dialogue_history
+        assert loaded.connections == bridge.connections
+        
+        # The loaded bridge keeps growing; closing unmaps the file
+        loaded.advance(10)
+        loaded.close_snapshot()
+        assert loaded.clock.ticks == 1110
+        assert loaded.insights[:len(bridge.insights)] == bridge.insights
+    return True
+
+if __name__ == "__main__":
+    print("💾 Testing snapshots...")
+    test_section_round_trip() and print("✅ Section round trip: PASS")
+    test_lazy_record_list() and print("✅ Lazy record list: PASS")
+    test_bridge_round_trip() and print("✅ Bridge round trip: PASS")
+    print("🎉 Snapshot tests completed")
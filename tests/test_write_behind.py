@@ -0,0 +1,54 @@
+"""
+Test write-behind persistence
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+class FakeBridge:
+    def __init__(self, bridge_id):
+        self.id = bridge_id
+
+def test_dirty_set_coalesces_saves():
+    """Test that repeated marks cost one save per flush"""
+    from api.write_behind import WriteBehindPersistence
+    
+    batches = []
+    persistence = WriteBehindPersistence(batches.append, durability="deferred")
+    bridges = [FakeBridge(f"bridge-{i}") for i in range(3)]
+    for _ in range(100):
+        for bridge in bridges:
+            persistence.mark_dirty(bridge)
+    
+    assert batches == []
+    assert persistence.pending() == 3
+    assert persistence.flush() == 3
+    assert len(batches) == 1 and len(batches[0]) == 3
+    assert persistence.flush() == 0
+    return True
+
+def test_background_flush_and_close():
+    """Test size-triggered background flush and flush on close"""
+    import time
+    from api.write_behind import WriteBehindPersistence
+    
+    saved = []
+    persistence = WriteBehindPersistence(saved.extend, flush_interval=60.0, max_batch=5)
+    for i in range(5):
+        persistence.mark_dirty(FakeBridge(f"bridge-{i}"))
+    
+    deadline = time.time() + 2.0
+    while len(saved) < 5 and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(saved) == 5
+    
+    persistence.mark_dirty(FakeBridge("late"))
+    persistence.close()
+    assert saved[-1].id == "late"
+    return True
+
+if __name__ == "__main__":
+    print("💾 Testing write-behind persistence...")
+    test_dirty_set_coalesces_saves() and print("✅ Dirty set coalescing: PASS")
+    test_background_flush_and_close() and print("✅ Background flush: PASS")
+    print("🎉 Write-behind tests completed")